@@ -1,22 +1,41 @@
-from robo_appian.utils.RoboUtils import RoboUtils
-from robo_appian.utils.ComponentUtils import ComponentUtils
-from robo_appian.components.ButtonUtils import ButtonUtils
-from robo_appian.components.DateUtils import DateUtils
-from robo_appian.components.DropdownUtils import DropdownUtils
-from robo_appian.components.InputUtils import InputUtils
-from robo_appian.components.LabelUtils import LabelUtils
-from robo_appian.components.LinkUtils import LinkUtils
-from robo_appian.components.SearchDropdownUtils import SearchDropdownUtils
-from robo_appian.components.TableUtils import TableUtils
-from robo_appian.components.TabUtils import TabUtils
-from robo_appian.utils.BrowserUtils import BrowserUtils
-from robo_appian.components.SearchInputUtils import SearchInputUtils
-
-__version__ = ComponentUtils.get_version()
+import importlib
+from typing import TYPE_CHECKING
+
+# Utilities are imported on first attribute access (PEP 562) so that
+# `import robo_appian` does not pull in selenium until a utility is used.
+_LAZY_IMPORTS = {
+    "ButtonUtils": "robo_appian.components.ButtonUtils",
+    "RoboUtils": "robo_appian.utils.RoboUtils",
+    "RetryPolicy": "robo_appian.utils.RoboUtils",
+    "ComponentUtils": "robo_appian.utils.ComponentUtils",
+    "DateUtils": "robo_appian.components.DateUtils",
+    "DropdownUtils": "robo_appian.components.DropdownUtils",
+    "InputUtils": "robo_appian.components.InputUtils",
+    "LabelUtils": "robo_appian.components.LabelUtils",
+    "LinkUtils": "robo_appian.components.LinkUtils",
+    "SearchDropdownUtils": "robo_appian.components.SearchDropdownUtils",
+    "TableUtils": "robo_appian.components.TableUtils",
+    "TabUtils": "robo_appian.components.TabUtils",
+    "BrowserUtils": "robo_appian.utils.BrowserUtils",
+    "WindowManager": "robo_appian.utils.BrowserUtils",
+    "WindowInfo": "robo_appian.utils.BrowserUtils",
+    "SearchInputUtils": "robo_appian.components.SearchInputUtils",
+    "ArtifactUtils": "robo_appian.utils.ArtifactUtils",
+    "TypeaheadUtils": "robo_appian.utils.TypeaheadUtils",
+    "SnapshotUtils": "robo_appian.utils.SnapshotUtils",
+    "PageObjectUtils": "robo_appian.utils.PageObjectUtils",
+    "PageField": "robo_appian.utils.PageObjectUtils",
+    "ProfilerUtils": "robo_appian.utils.ProfilerUtils",
+    "LocatorUtils": "robo_appian.utils.LocatorUtils",
+    "AccessibilityUtils": "robo_appian.utils.AccessibilityUtils",
+    "NetworkUtils": "robo_appian.utils.NetworkUtils",
+    "BrowserProfileUtils": "robo_appian.utils.BrowserProfileUtils",
+}
 
 __all__ = [
     "ButtonUtils",
     "RoboUtils",
+    "RetryPolicy",
     "ComponentUtils",
     "DateUtils",
     "DropdownUtils",
@@ -27,5 +46,69 @@ __all__ = [
     "TableUtils",
     "TabUtils",
     "BrowserUtils",
+    "WindowManager",
+    "WindowInfo",
     "SearchInputUtils",
+    "ArtifactUtils",
+    "TypeaheadUtils",
+    "SnapshotUtils",
+    "PageObjectUtils",
+    "PageField",
+    "ProfilerUtils",
+    "LocatorUtils",
+    "AccessibilityUtils",
+    "NetworkUtils",
+    "BrowserProfileUtils",
 ]
+
+if TYPE_CHECKING:
+    from robo_appian.utils.RoboUtils import RoboUtils, RetryPolicy
+    from robo_appian.utils.ComponentUtils import ComponentUtils
+    from robo_appian.components.ButtonUtils import ButtonUtils
+    from robo_appian.components.DateUtils import DateUtils
+    from robo_appian.components.DropdownUtils import DropdownUtils
+    from robo_appian.components.InputUtils import InputUtils
+    from robo_appian.components.LabelUtils import LabelUtils
+    from robo_appian.components.LinkUtils import LinkUtils
+    from robo_appian.components.SearchDropdownUtils import SearchDropdownUtils
+    from robo_appian.components.TableUtils import TableUtils
+    from robo_appian.components.TabUtils import TabUtils
+    from robo_appian.utils.BrowserUtils import BrowserUtils, WindowManager, WindowInfo
+    from robo_appian.components.SearchInputUtils import SearchInputUtils
+    from robo_appian.utils.ArtifactUtils import ArtifactUtils
+    from robo_appian.utils.TypeaheadUtils import TypeaheadUtils
+    from robo_appian.utils.SnapshotUtils import SnapshotUtils
+    from robo_appian.utils.PageObjectUtils import PageObjectUtils, PageField
+    from robo_appian.utils.ProfilerUtils import ProfilerUtils
+    from robo_appian.utils.LocatorUtils import LocatorUtils
+    from robo_appian.utils.AccessibilityUtils import AccessibilityUtils
+    from robo_appian.utils.NetworkUtils import NetworkUtils
+    from robo_appian.utils.BrowserProfileUtils import BrowserProfileUtils
+
+
+def _read_version():
+    from importlib import metadata
+
+    try:
+        return metadata.version("robo_appian")
+    except metadata.PackageNotFoundError:
+        # Source checkout that is not installed: fall back to pyproject.toml
+        from robo_appian.utils.ComponentUtils import ComponentUtils
+
+        return ComponentUtils.get_version()
+
+
+def __getattr__(name):
+    if name == "__version__":
+        value = _read_version()
+    elif name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | {"__version__"})
@@ -2,6 +2,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from robo_appian.utils.ComponentUtils import ComponentUtils
+from robo_appian.utils.SnapshotUtils import SnapshotUtils
 
 
 class ButtonUtils:
@@ -139,6 +140,9 @@ class ButtonUtils:
             ...     ButtonUtils.clickByLabelText(wait, "Delete")
         """
         xpath = f".//button[./span[normalize-space(.)='{label}']]"
+        found = SnapshotUtils.exists(wait, xpath)
+        if found is not None:
+            return found
         try:
             ComponentUtils.findComponentByXPath(wait, xpath)
         except Exception:
@@ -161,6 +165,9 @@ class ButtonUtils:
             bool: True if button found, False otherwise.
         """
         xpath = f".//button[./span[contains(translate(normalize-space(.), '\u00a0', ' '), '{label}')]]"
+        found = SnapshotUtils.exists(wait, xpath)
+        if found is not None:
+            return found
         try:
             ComponentUtils.findComponentByXPath(wait, xpath)
         except Exception:
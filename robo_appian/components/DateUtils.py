@@ -1,9 +1,50 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
+from datetime import date, datetime
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 
 from robo_appian.components.InputUtils import InputUtils
 from robo_appian.utils.ComponentUtils import ComponentUtils
+from robo_appian.utils.SnapshotUtils import SnapshotUtils
+
+
+_FIND_DATE_INPUTS_SCRIPT = """
+const labels = arguments[0];
+const normalize = (text) => (text || "").replace(/\\s+/g, " ").trim();
+const found = [];
+for (const text of labels) {
+    let input = null;
+    for (const label of document.querySelectorAll("div > div > label")) {
+        if (normalize(label.textContent) !== text) {
+            continue;
+        }
+        const candidate = label.parentElement.parentElement.querySelector(
+            ":scope > div > div > div > input"
+        );
+        if (candidate && !candidate.disabled && candidate.getClientRects().length > 0) {
+            input = candidate;
+            break;
+        }
+    }
+    found.push(input);
+}
+return found;
+"""
+
+_WRITE_DATES_SCRIPT = """
+const entries = arguments[0];
+const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+for (const [el, value] of entries) {
+    if (el.value === value) {
+        continue;
+    }
+    el.focus();
+    setter.call(el, value);
+    el.dispatchEvent(new Event("input", { bubbles: true }));
+    el.dispatchEvent(new Event("change", { bubbles: true }));
+    el.blur();
+}
+return entries.map(([el]) => el.value);
+"""
 
 
 class DateUtils:
@@ -27,15 +68,52 @@ class DateUtils:
         DateUtils.setValueByLabelText(wait, "Today", ComponentUtils.today())
         DateUtils.setValueByLabelText(wait, "Yesterday", ComponentUtils.yesterday())
 
+        # date/datetime objects are formatted with ComponentUtils.DATE_FORMAT
+        DateUtils.setValueByLabelText(wait, "Start Date", date(2024, 1, 15))
+
+        # Set a start/end pair in one round trip
+        DateUtils.setDateRangeByLabelText(wait, "From", date(2024, 1, 1), "To", date(2024, 3, 31))
+
         # Click to open date picker
         DateUtils.clickByLabelText(wait, "Event Date")
 
     Note:
-        - Date format is typically MM/DD/YYYY for Appian
+        - Date format is typically MM/DD/YYYY for Appian; pass pattern for other locales
+        - Dates are written with the input's native value setter and read back in the same
+          script; an input that does not hold the value afterwards is typed into instead
         - Waits for clickability before interacting with date fields
         - ComponentUtils.today() returns today's date as MM/DD/YYYY
     """
 
+    @staticmethod
+    def __findComponents(wait: WebDriverWait, labels: list):
+        """
+        Finds the date inputs for several labels with one script per poll (internal helper).
+
+        Args:
+            wait: WebDriverWait instance.
+            labels: Labels of the date components.
+
+        Returns:
+            list[WebElement]: The date input elements, in the order of labels.
+
+        Raises:
+            TimeoutException: If any date input is not found or not enabled within timeout.
+        """
+        state = {"missing": labels}
+
+        def inputs(driver):
+            found = driver.execute_script(_FIND_DATE_INPUTS_SCRIPT, labels)
+            state["missing"] = [label for label, el in zip(labels, found) if el is None]
+            return found if not state["missing"] else False
+
+        try:
+            return wait.until(inputs)
+        except TimeoutException as e:
+            raise TimeoutException(
+                f"Date component(s) not found or not enabled: {state['missing']}"
+            ) from e
+
     @staticmethod
     def __findComponent(wait: WebDriverWait, label: str):
         """
@@ -51,42 +129,150 @@ class DateUtils:
         Raises:
             TimeoutException: If date component not found within timeout.
         """
+        return DateUtils.__findComponents(wait, [label])[0]
 
-        xpath = f'.//div[./div/label[normalize-space(translate(., "\u00a0", " "))="{label}"]]/div/div/div/input'
-        component = wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
-        return component
+    @staticmethod
+    def __writeDates(wait: WebDriverWait, components: list, values: list):
+        """
+        Set date inputs natively and verify the committed values in the same script (internal helper).
+
+        Inputs that do not hold the expected value afterwards (e.g. a picker that rejects
+        programmatic values) are typed into instead.
+        """
+        SnapshotUtils.invalidate(wait)
+        committed = wait._driver.execute_script(
+            _WRITE_DATES_SCRIPT, [[component, value] for component, value in zip(components, values)]
+        )
+        for component, value, actual in zip(components, values, committed):
+            if actual != value:
+                InputUtils._setValueByComponent(wait, component, value, fast=False)
 
     @staticmethod
-    def setValueByLabelText(wait: WebDriverWait, label: str, value: str):
+    def setValueByLabelText(wait: WebDriverWait, label: str, value, pattern: str = None):
         """
         Set a date in a date picker component by label.
 
-        Finds the date input by its associated label, waits for clickability, clears any
-        existing date, and enters the new date value.
+        Finds the date input by its associated label, waits for it to be enabled, sets the
+        date and checks that the input holds it.
 
         Args:
             wait: WebDriverWait instance.
             label: Exact label text of the date component (e.g., "Start Date").
-            value: Date string in MM/DD/YYYY format (e.g., "01/15/2024").
+            value: Date string in MM/DD/YYYY format (e.g., "01/15/2024"), or a date/datetime.
+            pattern: strftime pattern for date/datetime values. Defaults to ComponentUtils.DATE_FORMAT.
 
         Returns:
             WebElement: The date input component (for chaining if needed).
 
         Raises:
-            ValueError: If label has no 'for' attribute.
-            TimeoutException: If date input not found or not clickable within timeout.
+            TimeoutException: If date input not found or not enabled within timeout.
 
         Examples:
             >>> DateUtils.setValueByLabelText(wait, "Start Date", "01/15/2024")
-            >>> DateUtils.setValueByLabelText(wait, "End Date", "12/31/2024")
+            >>> DateUtils.setValueByLabelText(wait, "End Date", date(2024, 12, 31))
             >>> # Using helper for today's date
             >>> from robo_appian.utils.ComponentUtils import ComponentUtils
             >>> DateUtils.setValueByLabelText(wait, "Date", ComponentUtils.today())
         """
         component = DateUtils.__findComponent(wait, label)
-        InputUtils._setValueByComponent(wait, component, value)
+        DateUtils.__writeDates(wait, [component], [ComponentUtils.formatDate(value, pattern)])
         return component
 
+    @staticmethod
+    def setValuesByLabelText(wait: WebDriverWait, values: dict, pattern: str = None):
+        """
+        Set several date components at once.
+
+        All inputs are located with one script per poll and written, in the order given, with
+        one more script that also reads back the committed values.
+
+        Args:
+            wait: WebDriverWait instance.
+            values: Mapping of label text to date string or date/datetime.
+            pattern: strftime pattern for date/datetime values. Defaults to ComponentUtils.DATE_FORMAT.
+
+        Returns:
+            list[WebElement]: The date input components, in the order of values.
+
+        Raises:
+            TimeoutException: If any date input is not found or not enabled within timeout.
+
+        Examples:
+            >>> DateUtils.setValuesByLabelText(wait, {
+            ...     "Hire Date": date(2023, 6, 1),
+            ...     "Review Date": "06/01/2024",
+            ... })
+        """
+        labels = list(values)
+        texts = [ComponentUtils.formatDate(values[label], pattern) for label in labels]
+        components = DateUtils.__findComponents(wait, labels)
+        DateUtils.__writeDates(wait, components, texts)
+        return components
+
+    @staticmethod
+    def setDateRangeByLabelText(
+        wait: WebDriverWait, start_label: str, start, end_label: str, end, pattern: str = None
+    ):
+        """
+        Set a start/end date pair together, start first.
+
+        Args:
+            wait: WebDriverWait instance.
+            start_label: Exact label text of the start date component.
+            start: Start date string or date/datetime.
+            end_label: Exact label text of the end date component.
+            end: End date string or date/datetime.
+            pattern: strftime pattern for date/datetime values. Defaults to ComponentUtils.DATE_FORMAT.
+
+        Returns:
+            tuple[WebElement, WebElement]: The start and end date inputs.
+
+        Raises:
+            ValueError: If start and end are both dates and end is before start.
+            TimeoutException: If either date input is not found or not enabled within timeout.
+
+        Examples:
+            >>> DateUtils.setDateRangeByLabelText(
+            ...     wait, "Leave Start", date(2024, 7, 1), "Leave End", date(2024, 7, 12)
+            ... )
+        """
+        if isinstance(start, date) and isinstance(end, date):
+            first = start.date() if isinstance(start, datetime) else start
+            last = end.date() if isinstance(end, datetime) else end
+            if last < first:
+                raise ValueError(f"End date {end} is before start date {start}")
+        start_component, end_component = DateUtils.setValuesByLabelText(
+            wait, {start_label: start, end_label: end}, pattern
+        )
+        return start_component, end_component
+
+    @staticmethod
+    def ensureValueByLabelText(wait: WebDriverWait, label: str, value, pattern: str = None):
+        """
+        Set a date by label only if the date input does not already hold it.
+
+        Args:
+            wait: WebDriverWait instance.
+            label: Exact label text of the date component.
+            value: Date string in MM/DD/YYYY format, or a date/datetime.
+            pattern: strftime pattern for date/datetime values. Defaults to ComponentUtils.DATE_FORMAT.
+
+        Returns:
+            bool: True if the date was written, False if it was already set.
+
+        Raises:
+            TimeoutException: If date input not found or not clickable within timeout.
+
+        Examples:
+            >>> DateUtils.ensureValueByLabelText(wait, "Start Date", "01/15/2024")
+        """
+        value = ComponentUtils.formatDate(value, pattern)
+        component = DateUtils.__findComponent(wait, label)
+        if component.get_property("value") == value:
+            return False
+        DateUtils.__writeDates(wait, [component], [value])
+        return True
+
     @staticmethod
     def clickByLabelText(wait: WebDriverWait, label: str):
         """
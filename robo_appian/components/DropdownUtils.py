@@ -1,5 +1,6 @@
 import time
 from robo_appian.utils.ComponentUtils import ComponentUtils
+from robo_appian.utils.SnapshotUtils import SnapshotUtils
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
@@ -118,8 +119,8 @@ class DropdownUtils:
             DropdownUtils.__selectDropdownValueByDropdownOptionId(wait, "dropdown_option_id", "Option Value")
         """
         option_xpath = f'.//div/ul[@id="{dropdown_option_id}"]/li[./div[normalize-space(.)="{value}"]]'
-        component = wait.until(EC.element_to_be_clickable((By.XPATH, option_xpath)))
-        component.click()
+        component = ComponentUtils.waitForComponentToBeVisibleByXpath(wait, option_xpath)
+        ComponentUtils.click(wait, component)
 
     @staticmethod
     def __selectDropdownValueByPartialLabelText(
@@ -171,6 +172,9 @@ class DropdownUtils:
         """
         # xpath = f'.//div[./div/span[normalize-space(.)="{label}"]]/div/div/p[normalize-space(translate(., "\u00a0", " "))]'
         xpath = f'//span[normalize-space(.)="{label}"]/ancestor::div[@role="presentation"][1]//div[@aria-labelledby=//span[normalize-space(.)="{label}"]/@id and not(@role="combobox")]'
+        found = SnapshotUtils.exists(wait, xpath)
+        if found is not None:
+            return found
         try:
             wait._driver.find_element(By.XPATH, xpath)
             return True
@@ -195,6 +199,9 @@ class DropdownUtils:
                 print("The dropdown is disabled.")
         """
         xpath = f'//span[normalize-space(translate(., "\u00a0", " "))="{label}"]/ancestor::div[@role="presentation"][1]//div[@aria-labelledby=//span[normalize-space(.)="{label}"]/@id and @role="combobox" and not(@aria-disabled="true")]'
+        found = SnapshotUtils.exists(wait, xpath)
+        if found is not None:
+            return found
         try:
             wait._driver.find_element(By.XPATH, xpath)
             return True  # If disabled element is found, dropdown is not editable
@@ -265,6 +272,29 @@ class DropdownUtils:
         """
         DropdownUtils.__selectDropdownValueByLabelText(wait, dropdown_label, value)
 
+    @staticmethod
+    def ensureDropdownValueByLabelText(
+        wait: WebDriverWait, dropdown_label: str, value: str
+    ):
+        """
+        Select a dropdown value by label text only if it is not already the selected value.
+
+        Reads the combobox's displayed value with a single call and skips opening the
+        dropdown (and the Appian server re-evaluation a selection triggers) when it matches.
+
+        :param wait: WebDriverWait instance to wait for elements.
+        :param dropdown_label: The label of the dropdown.
+        :param value: The value that should be selected.
+        :return: True if the value was selected, False if it was already selected.
+        Example:
+            DropdownUtils.ensureDropdownValueByLabelText(wait, "Status", "Active")
+        """
+        combobox = DropdownUtils.__findComboboxByLabelText(wait, dropdown_label)
+        if " ".join(combobox.text.split()) == value:
+            return False
+        DropdownUtils.selectDropdownValueByComboboxComponent(wait, combobox, value)
+        return True
+
     @staticmethod
     def selectDropdownValueByPartialLabelText(
         wait: WebDriverWait, dropdown_label: str, value: str
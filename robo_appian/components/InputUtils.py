@@ -1,10 +1,36 @@
 from robo_appian.utils.ComponentUtils import ComponentUtils
+from robo_appian.utils.SnapshotUtils import SnapshotUtils
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.action_chains import ActionChains
 
 
+_FAST_WRITE_SCRIPT = """
+const el = arguments[0];
+const value = arguments[1];
+const minLength = arguments[2];
+if (el.value === value) {
+    return "unchanged";
+}
+const isTextArea = el instanceof HTMLTextAreaElement;
+const isTextInput = el instanceof HTMLInputElement
+    && ["text", "email", "number", "password", "search", "tel", "url"].includes(el.type);
+if ((!isTextArea && !isTextInput) || el.disabled || el.readOnly
+    || value.length < minLength
+    || el.getAttribute("role") === "combobox" || el.hasAttribute("aria-autocomplete")) {
+    return "keys";
+}
+const prototype = isTextArea ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+const setter = Object.getOwnPropertyDescriptor(prototype, "value").set;
+el.focus();
+setter.call(el, value);
+el.dispatchEvent(new Event("input", { bubbles: true }));
+el.dispatchEvent(new Event("change", { bubbles: true }));
+return el.value === value ? "set" : "keys";
+"""
+
+
 class InputUtils:
     """
     Fill text inputs, search fields, and other input components using label-driven selectors.
@@ -34,8 +60,13 @@ class InputUtils:
         - Uses normalize-space and NBSP translation to handle whitespace variations
         - Automatically moves to element, clears it, and enters text via ActionChains
         - Waits for element to be clickable before interacting
+        - Set InputUtils.FAST_WRITE = True to skip writes when the field already holds the
+          value and to set long values (FAST_WRITE_MIN_LENGTH characters or more) in one script
     """
 
+    FAST_WRITE = False
+    FAST_WRITE_MIN_LENGTH = 200
+
     @staticmethod
     def __findComponentByPartialLabel(wait: WebDriverWait, label: str):
         """
@@ -91,18 +122,39 @@ class InputUtils:
         return component
 
     @staticmethod
-    def _setValueByComponent(wait: WebDriverWait, component: WebElement, value: str):
+    def _setValueByComponent(
+        wait: WebDriverWait, component: WebElement, value: str, fast: bool = None
+    ):
         """
         Sets a value in an input component.
+
+        In fast-write mode, one script first compares the current value with the target and
+        returns without touching the field when they are equal. Long values in plain text
+        inputs and text areas are then set through the native value setter followed by the
+        input/change events Appian listens for. Short values, search/combobox inputs, and
+        fields that did not take the value fall back to the keystroke path.
+
         Parameters:
             wait: Selenium WebDriverWait instance.
             component: The Selenium WebElement for the input component.
             value: The value to set in the input field.
+            fast: Use fast-write mode. Defaults to InputUtils.FAST_WRITE.
         Returns:
             The Selenium WebElement for the input component after setting the value.
         Example:
             InputUtils._setValueByComponent(wait, component, "test_value")
+            InputUtils._setValueByComponent(wait, component, long_json, fast=True)
         """
+        if fast is None:
+            fast = InputUtils.FAST_WRITE
+        SnapshotUtils.invalidate(wait)
+        if fast:
+            outcome = wait._driver.execute_script(
+                _FAST_WRITE_SCRIPT, component, value, InputUtils.FAST_WRITE_MIN_LENGTH
+            )
+            if outcome != "keys":
+                return component
+
         wait.until(EC.element_to_be_clickable(component))
         driver = wait._driver
         ActionChains(driver).move_to_element(component).perform()
@@ -158,6 +210,35 @@ class InputUtils:
         component = InputUtils.__findComponentByLabel(wait, label)
         InputUtils._setValueByComponent(wait, component, value)
 
+    @staticmethod
+    def ensureValueByLabelText(wait: WebDriverWait, label: str, value: str):
+        """
+        Set an input's value by exact label text only if it differs from the current value.
+
+        Reads the current value with a single call and skips the write (and the Appian
+        server re-evaluation it would trigger) when the field already holds the value.
+
+        Args:
+            wait: WebDriverWait instance.
+            label: Exact visible label text.
+            value: Text the input field should contain.
+
+        Returns:
+            bool: True if the value was written, False if it was already set.
+
+        Raises:
+            ValueError: If label element has no 'for' attribute linking to input.
+            TimeoutException: If label or input not found within wait timeout.
+
+        Examples:
+            >>> InputUtils.ensureValueByLabelText(wait, "Username", "john_doe")
+        """
+        component = InputUtils.__findComponentByLabel(wait, label)
+        if component.get_property("value") == value:
+            return False
+        InputUtils._setValueByComponent(wait, component, value)
+        return True
+
     @staticmethod
     def setValueById(wait: WebDriverWait, id: str, value: str):
         """
@@ -2,6 +2,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 from robo_appian.utils.ComponentUtils import ComponentUtils
+from robo_appian.utils.SnapshotUtils import SnapshotUtils
 
 
 class LabelUtils:
@@ -26,6 +27,11 @@ class LabelUtils:
         - Useful in test assertions: `assert LabelUtils.isLabelExists(wait, "Pending")`
     """
 
+    @staticmethod
+    def __xpath(label: str):
+        """Build the XPath matching an element whose normalized text equals label (internal helper)."""
+        return f'//*[normalize-space(translate(., "\u00a0", " "))="{label}"]'
+
     @staticmethod
     def __findByLabelText(wait: WebDriverWait, label: str):
         """
@@ -41,8 +47,9 @@ class LabelUtils:
         Raises:
             TimeoutException: If label not found within timeout.
         """
-        xpath = f'//*[normalize-space(translate(., "\u00a0", " "))="{label}"]'
-        component = ComponentUtils.waitForComponentToBeVisibleByXpath(wait, xpath)
+        component = ComponentUtils.waitForComponentToBeVisibleByXpath(
+            wait, LabelUtils.__xpath(label)
+        )
         return component
 
     @staticmethod
@@ -89,6 +96,9 @@ class LabelUtils:
             ...     print("Validation error displayed")
             >>> assert LabelUtils.isLabelExists(wait, "Success!"), "Success message not found"
         """
+        found = SnapshotUtils.exists(wait, LabelUtils.__xpath(label), visible=True)
+        if found is not None:
+            return found
         try:
             LabelUtils.__findByLabelText(wait, label)
         except Exception:
@@ -1,6 +1,7 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from robo_appian.utils.BrowserUtils import BrowserUtils
 from robo_appian.utils.ComponentUtils import ComponentUtils
 
 
@@ -79,3 +80,38 @@ class LinkUtils:
         component = LinkUtils.find(wait, label)
         ComponentUtils.click(wait, component)
         return component
+
+    @staticmethod
+    def openInBackgroundTabs(wait: WebDriverWait, labels, purpose: str = "opened from link"):
+        """
+        Open several links in background tabs at once, without leaving the current page.
+
+        Each link's href is opened by BrowserUtils.windows(wait).openAll, so the pages load
+        concurrently; the tabs are registered under the link labels. Visit them with
+        BrowserUtils.windows(wait).visitAll.
+
+        Args:
+            wait: WebDriverWait instance.
+            labels: Exact visible texts of the links.
+            purpose: Free-text description of the tabs.
+
+        Returns:
+            list[str]: The tab names (the labels), in order.
+
+        Raises:
+            ValueError: If a link has no href (e.g. a script-only link).
+            TimeoutException: If a link is not found or the tabs do not open within timeout.
+
+        Examples:
+            >>> labels = ["INV-1001", "INV-1002", "INV-1003"]
+            >>> LinkUtils.openInBackgroundTabs(wait, labels)
+            >>> BrowserUtils.windows(wait).visitAll(labels, lambda wait, label: LabelUtils.isLabelExists(wait, label))
+        """
+        labels = list(labels)
+        urls = []
+        for label in labels:
+            href = LinkUtils.find(wait, label).get_attribute("href")
+            if not href or href.startswith("javascript:") or href.endswith("#"):
+                raise ValueError(f"Link '{label}' has no URL to open in a tab.")
+            urls.append(href)
+        return BrowserUtils.windows(wait).openAll(urls, names=labels, purpose=purpose)
@@ -1,5 +1,6 @@
-from robo_appian.components.InputUtils import InputUtils
 from robo_appian.utils.ComponentUtils import ComponentUtils
+from robo_appian.utils.LocatorUtils import LocatorUtils
+from robo_appian.utils.TypeaheadUtils import TypeaheadUtils
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
@@ -11,8 +12,9 @@ class SearchDropdownUtils:
     Select values from search-enabled dropdowns in Appian UI.
 
     Search dropdowns allow users to type to filter options, then click to select. These differ
-    from standard dropdowns because they include a search/filter input field. Automatically
-    types the search term, waits for options to populate, and clicks the matching option.
+    from standard dropdowns because they include a search/filter input field. Types the shortest
+    useful prefix of the value, reads the option list as it updates, and clicks the matching
+    option as soon as it appears (see TypeaheadUtils).
 
     All methods follow the wait-first pattern: pass WebDriverWait as the first argument.
 
@@ -40,13 +42,10 @@ class SearchDropdownUtils:
         input_component = wait.until(
             EC.element_to_be_clickable((By.ID, input_component_id))
         )
-        InputUtils._setValueByComponent(wait, input_component, value)
-
         dropdown_option_id = str(component_id) + "_list"
-
-        xpath = f'.//ul[@id="{dropdown_option_id}"]/li[./div[normalize-space(.)="{value}"]][1]'
-        component = wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
-        ComponentUtils.click(wait, component)
+        TypeaheadUtils.selectValue(
+            wait, input_component, dropdown_option_id, value, cache_key=component_id
+        )
 
     @staticmethod
     def __selectSearchDropdownValueByPartialLabelText(
@@ -59,12 +58,23 @@ class SearchDropdownUtils:
             wait, combobox, value
         )
 
+    @staticmethod
+    def __findComboboxByLabelText(wait: WebDriverWait, label: str):
+        """
+        Find the enabled combobox of a search dropdown by exact label.
+
+        Falls back to ARIA, label/for and id-suffix strategies when the structural XPath
+        no longer matches (see LocatorUtils).
+        """
+        xpath = f'.//div[./div/span[normalize-space(.)="{label}"]]/div/div/div/div[@role="combobox" and not(@aria-disabled="true")]'
+        combobox = LocatorUtils.find(wait, "combobox", label, xpath)
+        return wait.until(EC.element_to_be_clickable(combobox))
+
     @staticmethod
     def __selectSearchDropdownValueByLabelText(
         wait: WebDriverWait, label: str, value: str
     ):
-        xpath = f'.//div[./div/span[normalize-space(.)="{label}"]]/div/div/div/div[@role="combobox" and not(@aria-disabled="true")]'
-        combobox = wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
+        combobox = SearchDropdownUtils.__findComboboxByLabelText(wait, label)
         SearchDropdownUtils._selectSearchDropdownValueByComboboxComponent(
             wait, combobox, value
         )
@@ -115,6 +125,35 @@ class SearchDropdownUtils:
             wait, dropdown_label, value
         )
 
+    @staticmethod
+    def ensureSearchDropdownValueByLabelText(
+        wait: WebDriverWait, dropdown_label: str, value: str
+    ):
+        """
+        Select a search dropdown value by exact label only if it is not already selected.
+
+        Args:
+            wait: WebDriverWait instance.
+            dropdown_label: Exact visible label text of the dropdown.
+            value: Exact text of the option that should be selected.
+
+        Returns:
+            bool: True if the value was selected, False if it was already selected.
+
+        Raises:
+            TimeoutException: If dropdown or option not found within timeout.
+
+        Examples:
+            >>> SearchDropdownUtils.ensureSearchDropdownValueByLabelText(wait, "Employee", "John Doe")
+        """
+        combobox = SearchDropdownUtils.__findComboboxByLabelText(wait, dropdown_label)
+        if " ".join(combobox.text.split()) == value:
+            return False
+        SearchDropdownUtils._selectSearchDropdownValueByComboboxComponent(
+            wait, combobox, value
+        )
+        return True
+
     @staticmethod
     def selectSearchDropdownValueByPartialLabelText(
         wait: WebDriverWait, dropdown_label: str, value: str
@@ -143,3 +182,52 @@ class SearchDropdownUtils:
         SearchDropdownUtils.__selectSearchDropdownValueByPartialLabelText(
             wait, dropdown_label, value
         )
+
+    @staticmethod
+    def selectMany(wait: WebDriverWait, dropdown_label: str, values: list[str]):
+        """
+        Select several values in a multi-select search dropdown by exact label.
+
+        Resolves the combobox once and keeps its component ID, then for each value opens the
+        dropdown only if the search box is not already showing and selects the value with the
+        typeahead engine. All selected tokens are verified with a single read at the end.
+
+        Args:
+            wait: WebDriverWait instance.
+            dropdown_label: Exact visible label text of the dropdown.
+            values: Exact texts of the options to select, in order.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the combobox has no ID or some values are not selected afterwards.
+            TimeoutException: If the dropdown or an option is not found within timeout.
+
+        Examples:
+            >>> SearchDropdownUtils.selectMany(wait, "Reviewers", ["John Doe", "Jane Roe"])
+        """
+        combobox = SearchDropdownUtils.__findComboboxByLabelText(wait, dropdown_label)
+        combobox_id = combobox.get_attribute("id")
+        if not combobox_id:
+            raise ValueError("Combobox element does not have an 'id' attribute.")
+        component_id = combobox_id.rsplit("_value", 1)[0]
+        input_component_id = component_id + "_searchInput"
+
+        for value in values:
+            search_inputs = wait._driver.find_elements(By.ID, input_component_id)
+            if not search_inputs or not search_inputs[0].is_displayed():
+                combobox = wait.until(EC.element_to_be_clickable((By.ID, combobox_id)))
+                ComponentUtils.click(wait, combobox)
+            SearchDropdownUtils.__selectSearchDropdownValueByDropdownId(
+                wait, component_id, value
+            )
+
+        combobox = ComponentUtils.findComponentById(wait, combobox_id)
+        missing = TypeaheadUtils.findMissingSelections(
+            wait, combobox, dropdown_label, values, component_id + "_list"
+        )
+        if missing:
+            raise ValueError(
+                f"Search dropdown '{dropdown_label}' is missing selected values: {', '.join(missing)}"
+            )
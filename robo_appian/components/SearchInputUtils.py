@@ -1,6 +1,7 @@
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.support.ui import WebDriverWait
-from robo_appian.components.InputUtils import InputUtils
 from robo_appian.utils.ComponentUtils import ComponentUtils
+from robo_appian.utils.TypeaheadUtils import TypeaheadUtils
 
 
 class SearchInputUtils:
@@ -37,12 +38,9 @@ class SearchInputUtils:
         attribute: str = "aria-controls"
         dropdown_list_id = search_input_component.get_attribute(attribute)
         if dropdown_list_id:
-            InputUtils._setValueByComponent(wait, search_input_component, value)
-            xpath = f'.//ul[@id="{dropdown_list_id}" and @role="listbox" ]/li[@role="option" and @tabindex="-1" and ./div/div/div/div/div/div/p[normalize-space(.)="{value}"][1]]'
-            drop_down_item = ComponentUtils.waitForComponentToBeVisibleByXpath(
-                wait, xpath
+            TypeaheadUtils.selectValue(
+                wait, search_input_component, dropdown_list_id, value, cache_key=xpath
             )
-            ComponentUtils.click(wait, drop_down_item)
         else:
             raise ValueError(
                 f"Search input component with label '{search_input_component.text}' does not have 'aria-controls' attribute."
@@ -107,3 +105,65 @@ class SearchInputUtils:
         SearchInputUtils.__selectSearchInputComponentsByPartialLabelText(
             wait, label, value
         )
+
+    @staticmethod
+    def selectMany(wait: WebDriverWait, label: str, values: list[str]):
+        """
+        Select several values in a multi-value search input (user or record picker) by exact label.
+
+        Resolves the input and its aria-controls list once, streams each value through the
+        search box, and verifies all selected tokens with a single read at the end. The input
+        is re-found by ID only if Appian re-renders it between selections.
+
+        Args:
+            wait: WebDriverWait instance.
+            label: Exact visible label text of the search input.
+            values: Exact texts of the options to select, in order.
+
+        Returns:
+            WebElement: The search input component.
+
+        Raises:
+            ValueError: If the input lacks 'aria-controls' or some values are not selected afterwards.
+            TimeoutException: If the input or an option is not found within timeout.
+
+        Examples:
+            >>> SearchInputUtils.selectMany(wait, "Assignees", ["John Doe", "Jane Roe", "Sam Poe"])
+        """
+        xpath = f'.//div[./div/span[normalize-space(translate(., "\u00a0", " "))="{label}"]]/div/div/div/input[@role="combobox"]'
+        search_input_component = ComponentUtils.waitForComponentToBeVisibleByXpath(
+            wait, xpath
+        )
+        dropdown_list_id = search_input_component.get_attribute("aria-controls")
+        if not dropdown_list_id:
+            raise ValueError(
+                f"Search input component with label '{label}' does not have 'aria-controls' attribute."
+            )
+        input_id = search_input_component.get_attribute("id")
+
+        for value in values:
+            try:
+                TypeaheadUtils.selectValue(
+                    wait, search_input_component, dropdown_list_id, value, cache_key=xpath
+                )
+            except StaleElementReferenceException:
+                if input_id:
+                    search_input_component = ComponentUtils.findComponentById(wait, input_id)
+                else:
+                    search_input_component = ComponentUtils.waitForComponentToBeVisibleByXpath(
+                        wait, xpath
+                    )
+                TypeaheadUtils.selectValue(
+                    wait, search_input_component, dropdown_list_id, value, cache_key=xpath
+                )
+
+        if input_id:
+            search_input_component = ComponentUtils.findComponentById(wait, input_id)
+        missing = TypeaheadUtils.findMissingSelections(
+            wait, search_input_component, label, values, dropdown_list_id
+        )
+        if missing:
+            raise ValueError(
+                f"Search input '{label}' is missing selected values: {', '.join(missing)}"
+            )
+        return search_input_component
@@ -1,8 +1,8 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webelement import WebElement
 from robo_appian.utils.ComponentUtils import ComponentUtils
+from robo_appian.utils.LocatorUtils import LocatorUtils
 
 
 class TabUtils:
@@ -31,7 +31,8 @@ class TabUtils:
         """
         Find a tab element by its exact visible label.
 
-        Returns the tab element (useful for chaining or advanced inspection).
+        Returns the tab element (useful for chaining or advanced inspection). If the tab
+        markup has changed, falls back to ARIA and link-text strategies (see LocatorUtils).
 
         Args:
             wait: WebDriverWait instance.
@@ -47,8 +48,7 @@ class TabUtils:
             >>> tab = TabUtils.findTabByLabelText(wait, "Details")
         """
         xpath = f'//div/div[@role="link" ]/div/div/div/div/div/p[normalize-space(.)="{label}"]'
-        component = wait.until(EC.visibility_of_element_located((By.XPATH, xpath)))
-        return component
+        return LocatorUtils.find(wait, "tab", label, xpath)
 
     @staticmethod
     def selectTabByLabelText(wait: WebDriverWait, label: str):
@@ -80,8 +80,9 @@ class TabUtils:
         """
         Check if a tab is currently selected (active).
 
-        Returns True if the tab has the "Selected Tab" indicator (aria-label or span text),
-        False otherwise. Useful in test assertions to verify navigation.
+        Waits for the tab's "Selected Tab" indicator (span text, or aria-selected on tabs
+        found by the aria fallback) and returns False if it does not appear within timeout.
+        Useful in test assertions to verify navigation, including right after selecting a tab.
 
         Args:
             wait: WebDriverWait instance.
@@ -96,12 +97,49 @@ class TabUtils:
             >>> assert TabUtils.checkTabSelectedByLabelText(wait, "History"), "History tab should be selected"
         """
         component = TabUtils.findTabByLabelText(wait, label)
-
-        select_text = "Selected Tab."
-        xpath = f'./span[normalize-space(.)="{select_text}"]'
         try:
-            component = ComponentUtils.findChildComponentByXpath(wait, component, xpath)
+            return wait.until(lambda driver: TabUtils.__isSelected(component))
         except Exception:
             return False
 
+    @staticmethod
+    def ensureTabSelectedByLabelText(wait: WebDriverWait, label: str):
+        """
+        Select a tab by its exact visible label only if it is not already the active tab.
+
+        The selected state is read once, without waiting for the indicator, so a tab that is
+        not selected is clicked right away.
+
+        Args:
+            wait: WebDriverWait instance.
+            label: Exact visible label text of the tab.
+
+        Returns:
+            bool: True if the tab was clicked, False if it was already selected.
+
+        Raises:
+            TimeoutException: If tab not found or not clickable within timeout.
+
+        Examples:
+            >>> TabUtils.ensureTabSelectedByLabelText(wait, "Details")
+        """
+        component = TabUtils.findTabByLabelText(wait, label)
+        if TabUtils.__isSelected(component):
+            return False
+        ComponentUtils.click(wait, component)
         return True
+
+    @staticmethod
+    def __isSelected(component: WebElement):
+        """
+        Check the "Selected Tab." indicator under a tab element without waiting for it to appear.
+
+        The marker is searched among all descendants, so it is also found when the tab was
+        located by the link fallback (the role="link" container rather than the label
+        paragraph). Tabs found by the aria fallback may carry aria-selected instead.
+        """
+        select_text = "Selected Tab."
+        xpath = f'.//span[normalize-space(.)="{select_text}"]'
+        if component.find_elements(By.XPATH, xpath):
+            return True
+        return component.get_attribute("aria-selected") == "true"
@@ -1,9 +1,149 @@
+import re
+from collections import namedtuple
+from typing import NamedTuple
+import numpy as np
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from robo_appian.utils.ComponentUtils import ComponentUtils
 
 
+# Shared prefix: counts re-renders of a table with a MutationObserver so that cached
+# row indexes can be checked for staleness without re-reading the table.
+_TABLE_VERSION_JS = """
+function tableVersion(table) {
+    if (!table.__roboAppianVersion) {
+        table.__roboAppianVersion = 1;
+        new MutationObserver(() => { table.__roboAppianVersion += 1; }).observe(
+            table, { childList: true, subtree: true, characterData: true }
+        );
+    }
+    return table.__roboAppianVersion;
+}
+"""
+
+_TABLE_STATE_SCRIPT = _TABLE_VERSION_JS + """
+const columnName = arguments[0];
+for (const th of document.querySelectorAll("table > thead > tr > th[abbr]")) {
+    if (th.getAttribute("abbr") === columnName) {
+        const table = th.closest("table");
+        return { table: table, version: tableVersion(table) };
+    }
+}
+return null;
+"""
+
+_READ_TABLE_PAGE_SCRIPT = _TABLE_VERSION_JS + """
+const table = arguments[0];
+const wanted = arguments[1];
+const nextLabel = arguments[2];
+const firstLabel = arguments[3];
+const version = tableVersion(table);
+const normalize = (text) => (text || "").replace(/\\s+/g, " ").trim();
+
+const headers = Array.from(table.querySelectorAll(":scope > thead > tr > th[scope='col'][abbr]"));
+const positions = {};
+headers.forEach((th, i) => {
+    const match = /(?:^|\\s)headCell_(\\d+)(?:\\s|$)/.exec(th.className || "");
+    positions[th.getAttribute("abbr")] = match ? Number(match[1]) : i;
+});
+const columns = wanted && wanted.length ? wanted : headers.map((th) => th.getAttribute("abbr"));
+const missing = columns.filter((name) => !(name in positions));
+if (missing.length) {
+    return { columns: columns, missing: missing, rows: [], rowNumbers: [], next: null, version: version };
+}
+
+const rows = [];
+const rowNumbers = [];
+for (const tr of table.querySelectorAll(":scope > tbody > tr")) {
+    if (tr.closest("[aria-hidden='true']")) {
+        continue;
+    }
+    const cells = Array.from(tr.children).filter(
+        (td) => td.tagName === "TD" && !td.hasAttribute("data-empty-grid-message")
+    );
+    if (!cells.length) {
+        continue;
+    }
+    const dnd = /^row (\\d+)$/.exec(tr.getAttribute("data-dnd-name") || "");
+    rowNumbers.push(dnd ? Number(dnd[1]) - 1 : rows.length);
+    rows.push(columns.map((name) => {
+        const cell = cells[positions[name]];
+        return cell ? normalize(cell.textContent) : null;
+    }));
+}
+
+// Look for the pager in the grid's own container only: stop climbing at the first
+// ancestor that also holds another grid, whose pager this would otherwise pick up.
+// The container it is found in also scopes the lookup of the grid's next page.
+const ownsOnlyThisGrid = (scope) => Array.from(scope.querySelectorAll("table")).every(
+    (other) => other === table || table.contains(other)
+);
+const enabled = (control) => control && !(control.disabled || control.getAttribute("aria-disabled") === "true"
+        || /(^|\\s)\\S*disabled\\S*(\\s|$)/i.test(control.className || "")) ? control : null;
+let next = null;
+let first = null;
+let container = null;
+for (let scope = table.parentElement; scope && !container && ownsOnlyThisGrid(scope); scope = scope.parentElement) {
+    next = scope.querySelector("[aria-label='" + nextLabel + "']");
+    first = scope.querySelector("[aria-label='" + firstLabel + "']");
+    if (next || first) {
+        container = scope;
+    }
+}
+return {
+    columns: columns, missing: [], rows: rows, rowNumbers: rowNumbers,
+    table: table, container: container, next: enabled(next), first: enabled(first), version: version,
+};
+"""
+
+
+# Find the grid with a column inside its pager container, after a re-render replaced the
+# table element; without a container, only a grid that is unique on the page qualifies.
+_FIND_GRID_SCRIPT = """
+const scope = arguments[0] || document;
+const columnName = arguments[1];
+const tables = Array.from(scope.querySelectorAll("table")).filter((table) =>
+    Array.from(table.querySelectorAll(":scope > thead > tr > th[abbr]")).some(
+        (th) => th.getAttribute("abbr") === columnName
+    )
+);
+return tables.length === 1 ? tables[0] : null;
+"""
+
+
+class TableSnapshot(NamedTuple):
+    """
+    Columnar copy of a grid's cell texts, from TableUtils.snapshot.
+
+    Attributes:
+        columns: Column names, in order.
+        data: Column name -> numpy array of cell texts (one entry per row).
+    """
+
+    columns: tuple
+    data: dict
+
+    def __len__(self):
+        return len(self.data[self.columns[0]]) if self.columns else 0
+
+
+class TableDiff(NamedTuple):
+    """
+    Row differences between two TableSnapshots, from TableUtils.diff.
+
+    Attributes:
+        added: Rows (column -> text) whose key is only in the after snapshot.
+        removed: Rows (column -> text) whose key is only in the before snapshot.
+        changed: Key -> {column: (before, after)} for rows present in both with different cells.
+    """
+
+    added: list
+    removed: list
+    changed: dict
+
+
 class TableUtils:
     """
     Interact with Appian grid/table components: read cells, click rows, find elements.
@@ -41,8 +181,14 @@ class TableUtils:
         - Tables are located by column header 'abbr' attribute
         - Column positions are derived from header class attributes (e.g., "headCell_2")
         - Hidden/aria-hidden elements are automatically excluded
+        - iterRows reads whole pages in one script and follows the grid's "Next page" control
     """
 
+    NEXT_PAGE_LABEL = "Next page"
+    FIRST_PAGE_LABEL = "First page"
+
+    _row_indexes = {}
+
     @staticmethod
     def __findColumNumberByColumnName(tableObject, columnName):
         """
@@ -154,7 +300,8 @@ class TableUtils:
         """
         Count non-empty rows in a table.
 
-        Returns the number of data rows (excluding empty grid message placeholders).
+        Returns the number of data rows (excluding empty grid message placeholders) on the
+        current page of the grid. Use iterRows to go through every page.
 
         Args:
             tableObject: WebElement representing the table (from findTableByColumnName).
@@ -171,3 +318,338 @@ class TableUtils:
         xpath = "./tbody/tr[./td[not (@data-empty-grid-message)]]"
         rows = tableObject.find_elements(By.XPATH, xpath)
         return len(rows)
+
+    @staticmethod
+    def iterRows(wait: WebDriverWait, columnName: str, columns: list = None, max_pages: int = None):
+        """
+        Iterate over the rows of a grid, across all of its pages.
+
+        Each page is read with a single script call. Rows are yielded one page at a time and
+        the grid's "Next page" control (aria-label TableUtils.NEXT_PAGE_LABEL) is clicked only
+        after every row of the current page has been consumed, so memory use stays flat
+        however many rows the grid holds.
+
+        Args:
+            wait: WebDriverWait instance.
+            columnName: Any column name (header abbr) identifying the table.
+            columns: Column names to read, in order. Defaults to all columns.
+            max_pages: Stop after this many pages. Defaults to all pages.
+
+        Yields:
+            namedtuple: One record per row, with one field per column. Field names are the
+            column names with non-identifier characters replaced by "_" (e.g. "Employee ID"
+            becomes Employee_ID); values are the cell texts.
+
+        Raises:
+            ValueError: If a requested column is not in the table.
+            TimeoutException: If the table is not found, or the next page does not render within timeout.
+
+        Examples:
+            >>> for row in TableUtils.iterRows(wait, "Employee ID", ["Employee ID", "Status"]):
+            ...     assert row.Status in ("Active", "Inactive"), row.Employee_ID
+            >>> total = sum(1 for _ in TableUtils.iterRows(wait, "Employee ID"))
+        """
+        record = None
+        for page in TableUtils.__pages(wait, columnName, columns, max_pages):
+            if record is None:
+                record = namedtuple(
+                    "TableRow",
+                    [re.sub(r"\W", "_", name) for name in page["columns"]],
+                    rename=True,
+                )
+            for values in page["rows"]:
+                yield record(*values)
+
+    @staticmethod
+    def buildRowIndex(wait: WebDriverWait, keyColumn: str):
+        """
+        Return an index of the current grid page: key column value -> row number.
+
+        The index is built from one bulk read and cached. It is reused until the grid
+        re-renders (detected by a MutationObserver on the table), so repeated lookups cost a
+        single script call. Only the current page of a paged grid is indexed.
+
+        Args:
+            wait: WebDriverWait instance.
+            keyColumn: Column name (header abbr) whose cell texts are the keys.
+
+        Returns:
+            dict: Cell text -> 0-based row number (first occurrence for duplicate values).
+
+        Raises:
+            TimeoutException: If no table with the column is found within timeout.
+
+        Examples:
+            >>> index = TableUtils.buildRowIndex(wait, "Employee ID")
+            >>> TableUtils.selectRowFromTableByColumnNameAndRowNumber(wait, index["12345"], "Employee ID")
+        """
+        state = wait.until(
+            lambda driver: driver.execute_script(_TABLE_STATE_SCRIPT, keyColumn),
+            message=f"Could not find a table with column '{keyColumn}'.",
+        )
+        cached = TableUtils._row_indexes.get(keyColumn)
+        if cached is not None and cached[0] == state["table"].id and cached[1] == state["version"]:
+            return cached[2]
+
+        page = TableUtils.__readPage(wait, state["table"], keyColumn, [keyColumn])
+        index = {}
+        for (value,), rowNumber in zip(page["rows"], page["rowNumbers"]):
+            index.setdefault(value, rowNumber)
+        TableUtils._row_indexes[keyColumn] = (state["table"].id, page["version"], index)
+        return index
+
+    @staticmethod
+    def findRowIndex(wait: WebDriverWait, keyColumn: str, value: str):
+        """
+        Find the row whose key column holds value, using the cached row index.
+
+        Args:
+            wait: WebDriverWait instance.
+            keyColumn: Column name (header abbr) to match value in.
+            value: Exact cell text (whitespace-normalized).
+
+        Returns:
+            int: 0-based row number, as accepted by the row-number methods.
+
+        Raises:
+            ValueError: If no row on the current page has that value.
+            TimeoutException: If no table with the column is found within timeout.
+
+        Examples:
+            >>> row = TableUtils.findRowIndex(wait, "Employee ID", "12345")
+            >>> TableUtils.findComponentFromTableCell(wait, row, "Status")
+        """
+        index = TableUtils.buildRowIndex(wait, keyColumn)
+        if value not in index:
+            raise ValueError(f"No row with '{keyColumn}' = '{value}' in the table.")
+        return index[value]
+
+    @staticmethod
+    def selectRowByColumnValue(wait: WebDriverWait, keyColumn: str, value: str):
+        """
+        Click the row whose key column holds value.
+
+        Args:
+            wait: WebDriverWait instance.
+            keyColumn: Column name (header abbr) to match value in.
+            value: Exact cell text.
+
+        Raises:
+            ValueError: If no row on the current page has that value.
+            TimeoutException: If the table or row is not found within timeout.
+
+        Examples:
+            >>> TableUtils.selectRowByColumnValue(wait, "Employee ID", "12345")
+        """
+        rowNumber = TableUtils.findRowIndex(wait, keyColumn, value)
+        TableUtils.selectRowFromTableByColumnNameAndRowNumber(wait, rowNumber, keyColumn)
+
+    @staticmethod
+    def findComponentByColumnValue(wait: WebDriverWait, keyColumn: str, value: str, columnName: str):
+        """
+        Find the component in columnName of the row whose key column holds value.
+
+        Args:
+            wait: WebDriverWait instance.
+            keyColumn: Column name (header abbr) to match value in.
+            value: Exact cell text.
+            columnName: Column whose cell component to return.
+
+        Returns:
+            WebElement: The component in the cell.
+
+        Raises:
+            ValueError: If no row on the current page has that value.
+            TimeoutException: If the table or cell is not found within timeout.
+
+        Examples:
+            >>> edit = TableUtils.findComponentByColumnValue(wait, "Employee ID", "12345", "Actions")
+            >>> ComponentUtils.click(wait, edit)
+        """
+        rowNumber = TableUtils.findRowIndex(wait, keyColumn, value)
+        return TableUtils.findComponentFromTableCell(wait, rowNumber, columnName)
+
+    @staticmethod
+    def snapshot(wait: WebDriverWait, columnName: str, columns: list = None, all_pages: bool = False):
+        """
+        Read a grid into a columnar snapshot for before/after comparisons.
+
+        The current page is read with one script call. With all_pages, the grid is first
+        rewound to its first page (the control labelled TableUtils.FIRST_PAGE_LABEL) and then
+        read page by page as in iterRows, so repeated snapshots cover the same rows whatever
+        page the grid was left on.
+
+        Args:
+            wait: WebDriverWait instance.
+            columnName: Any column name (header abbr) identifying the table.
+            columns: Column names to read. Defaults to all columns.
+            all_pages: Follow the grid's pager and read every page.
+
+        Returns:
+            TableSnapshot: Column name -> numpy array of cell texts.
+
+        Raises:
+            ValueError: If a requested column is not in the table.
+            TimeoutException: If the table is not found, or a page does not render within timeout.
+
+        Examples:
+            >>> before = TableUtils.snapshot(wait, "Employee ID")
+            >>> ButtonUtils.clickByLabelText(wait, "Add Employee")
+            >>> after = TableUtils.snapshot(wait, "Employee ID")
+            >>> result = TableUtils.diff(before, after, "Employee ID")
+        """
+        if all_pages:
+            names, rows = None, []
+            for page in TableUtils.__pages(wait, columnName, columns, rewind=True):
+                names = names or page["columns"]
+                rows.extend(page["rows"])
+        else:
+            table = TableUtils.findTableByColumnName(wait, columnName)
+            page = TableUtils.__readPage(wait, table, columnName, columns)
+            names, rows = page["columns"], page["rows"]
+
+        # Missing cells come back as None; keep them as empty text rather than "None"
+        cells = [["" if cell is None else cell for cell in row] for row in rows]
+        values = np.array(cells, dtype=object).reshape(len(rows), len(names))
+        return TableSnapshot(
+            tuple(names),
+            {name: values[:, i].astype(str) for i, name in enumerate(names)},
+        )
+
+    @staticmethod
+    def diff(before: TableSnapshot, after: TableSnapshot, keyColumn: str):
+        """
+        Compare two table snapshots row by row, matching rows by a key column.
+
+        The comparison is vectorized over whole columns; only the differing rows are
+        turned back into Python objects. For duplicate keys, the first row is used.
+
+        Args:
+            before: Snapshot taken before the action.
+            after: Snapshot taken after the action.
+            keyColumn: Column whose values identify a row (e.g. "Employee ID").
+
+        Returns:
+            TableDiff: Added rows, removed rows and changed cells, compared over the
+            columns present in both snapshots.
+
+        Raises:
+            ValueError: If keyColumn is missing from either snapshot.
+
+        Examples:
+            >>> result = TableUtils.diff(before, after, "Employee ID")
+            >>> assert [row["Employee ID"] for row in result.added] == ["12345"]
+            >>> assert not result.removed
+            >>> assert result.changed == {"100": {"Status": ("Active", "Inactive")}}
+        """
+        for snapshot in (before, after):
+            if keyColumn not in snapshot.data:
+                raise ValueError(f"Key column '{keyColumn}' is not in the snapshot.")
+
+        before_keys, before_first = np.unique(before.data[keyColumn], return_index=True)
+        after_keys, after_first = np.unique(after.data[keyColumn], return_index=True)
+        _, before_common, after_common = np.intersect1d(
+            before_keys, after_keys, assume_unique=True, return_indices=True
+        )
+        before_rows = before_first[before_common]
+        after_rows = after_first[after_common]
+
+        added_rows = after_first[~np.isin(after_keys, before_keys, assume_unique=True)]
+        removed_rows = before_first[~np.isin(before_keys, after_keys, assume_unique=True)]
+
+        shared = [name for name in after.columns if name in before.data and name != keyColumn]
+        changed = {}
+        if shared and len(before_rows):
+            differs = np.stack(
+                [before.data[name][before_rows] != after.data[name][after_rows] for name in shared]
+            )
+            for position in np.flatnonzero(differs.any(axis=0)):
+                b, a = before_rows[position], after_rows[position]
+                changed[str(after.data[keyColumn][a])] = {
+                    name: (str(before.data[name][b]), str(after.data[name][a]))
+                    for name, differ in zip(shared, differs[:, position])
+                    if differ
+                }
+
+        return TableDiff(
+            added=[TableUtils.__row(after, i) for i in np.sort(added_rows)],
+            removed=[TableUtils.__row(before, i) for i in np.sort(removed_rows)],
+            changed=changed,
+        )
+
+    @staticmethod
+    def __row(snapshot: TableSnapshot, index):
+        """Turn one snapshot row back into a column -> text dict (internal helper)."""
+        return {name: str(snapshot.data[name][index]) for name in snapshot.columns}
+
+    @staticmethod
+    def __readPage(wait: WebDriverWait, table, columnName: str, columns: list = None):
+        """Read the current page of a table in one script call (internal helper)."""
+        page = wait._driver.execute_script(
+            _READ_TABLE_PAGE_SCRIPT,
+            table,
+            list(columns or []),
+            TableUtils.NEXT_PAGE_LABEL,
+            TableUtils.FIRST_PAGE_LABEL,
+        )
+        if page["missing"]:
+            raise ValueError(
+                f"Could not find column(s) {page['missing']} in the table with column '{columnName}'."
+            )
+        return page
+
+    @staticmethod
+    def __pages(
+        wait: WebDriverWait, columnName: str, columns: list = None, max_pages: int = None, rewind: bool = False
+    ):
+        """
+        Yield the pages of a grid as read by __readPage, clicking "Next page" only when the
+        following page is requested; with rewind, start from the first page (internal helper).
+        """
+        table = TableUtils.findTableByColumnName(wait, columnName)
+        page = TableUtils.__readPage(wait, table, columnName, columns)
+        if rewind and page["first"] is not None:
+            page = TableUtils.__turnPage(wait, page, "first", columnName, columns)
+
+        pages = 1
+        while True:
+            yield page
+            if page["next"] is None or (max_pages is not None and pages >= max_pages):
+                return
+            page = TableUtils.__turnPage(wait, page, "next", columnName, columns)
+            pages += 1
+
+    @staticmethod
+    def __turnPage(wait: WebDriverWait, page: dict, control: str, columnName: str, columns: list):
+        """Click a pager control of the page's grid and wait for the new page (internal helper)."""
+        ComponentUtils.click(wait, page[control])
+        return wait.until(
+            lambda driver: TableUtils.__pageAfter(wait, page, columnName, columns),
+            message=f"The {control} page of the table with column '{columnName}' did not render.",
+        )
+
+    @staticmethod
+    def __pageAfter(wait: WebDriverWait, previous: dict, columnName: str, columns: list):
+        """
+        Return the page of the grid whose pager was clicked once its rows differ from the
+        page before the click, else False (internal helper).
+
+        Only that grid is read: the same table element or, if it was re-rendered, the grid
+        inside the container its pager was found in. Another grid on the page that shares
+        the column is never taken for the next page.
+        """
+        driver = wait._driver
+        try:
+            try:
+                page = TableUtils.__readPage(wait, previous["table"], columnName, columns)
+            except StaleElementReferenceException:
+                try:
+                    table = driver.execute_script(_FIND_GRID_SCRIPT, previous["container"], columnName)
+                except StaleElementReferenceException:
+                    table = driver.execute_script(_FIND_GRID_SCRIPT, None, columnName)
+                if table is None:
+                    return False
+                page = TableUtils.__readPage(wait, table, columnName, columns)
+        except StaleElementReferenceException:
+            return False
+        return page if page["rows"] != previous["rows"] else False
@@ -0,0 +1,290 @@
+import logging
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from robo_appian.utils.ComponentUtils import ComponentUtils
+
+logger = logging.getLogger(__name__)
+
+
+_COLLECT_RESOLVED_SCRIPT = """
+const found = window.__roboAppianAx || [];
+delete window.__roboAppianAx;
+return found;
+"""
+
+_STASH_NODES_FUNCTION = "function() { window.__roboAppianAx = Array.from(arguments); }"
+
+# Map positions in document.querySelectorAll(selector) back to elements; null if the
+# page changed since DOM.querySelectorAll returned the same list.
+_ELEMENTS_AT_SCRIPT = """
+const candidates = document.querySelectorAll(arguments[0]);
+if (candidates.length !== arguments[2]) {
+    return null;
+}
+return arguments[1].map((i) => candidates[i]);
+"""
+
+_FIND_DISPLAYED_SCRIPT = """
+const snapshot = document.evaluate(
+    arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+);
+const limit = arguments[1];
+const found = [];
+for (let i = 0; i < snapshot.snapshotLength && (limit === null || found.length < limit); i++) {
+    const el = snapshot.snapshotItem(i);
+    if (el.nodeType !== Node.ELEMENT_NODE) {
+        continue;
+    }
+    let visible;
+    if (typeof el.checkVisibility === "function") {
+        visible = el.checkVisibility({ checkOpacity: true, checkVisibilityCSS: true });
+    } else {
+        const style = window.getComputedStyle(el);
+        visible = style.display !== "none" && style.visibility === "visible"
+            && parseFloat(style.opacity) !== 0;
+    }
+    if (visible && el.getClientRects().length > 0) {
+        found.push(el);
+    }
+}
+return found;
+"""
+
+# Native elements whose implicit ARIA role the XPath fallback should also match.
+_IMPLICIT_ROLE_TAGS = {
+    "button": ("button",),
+    "link": ("a",),
+    "combobox": ("select",),
+    "listbox": ("select",),
+    "option": ("option",),
+    "textbox": ("input", "textarea"),
+    "checkbox": (),
+    "tab": (),
+}
+
+
+class AccessibilityUtils:
+    """
+    Find components by ARIA role and accessible name through the browser's accessibility tree.
+
+    On Chromium drivers, lookups go through the DevTools protocol: Accessibility.queryAXTree
+    finds the nodes with the role and computed accessible name, and the nodes are mapped back
+    to WebElements in bulk. DOM.pushNodesByBackendIdsToFrontend turns them into node ids,
+    DOM.querySelectorAll lists the elements that can carry the role, and one script picks
+    the matching positions from the same list. The document is fetched once per lookup, not
+    once per poll, so a lookup costs a fixed number of calls however many nodes match. Nodes
+    outside that list (shadow roots, roles without a selector) are resolved one by one. The
+    browser has already computed names from labels, aria-label and aria-labelledby, so no
+    text-matching XPath runs over the whole page, and hidden elements are excluded by the
+    tree itself.
+
+    On other browsers, or if the CDP call fails, the same lookup falls back to an XPath over
+    role/aria-label/aria-labelledby/text (and native tags with the same implicit role),
+    filtered by visibility inside the browser in one script call.
+
+    Examples:
+        >>> AccessibilityUtils.clickByRole(wait, "button", "Submit")
+        >>> combobox = AccessibilityUtils.findByRole(wait, "combobox", "Department")
+        >>> options = AccessibilityUtils.findAllByRole(wait, "option")
+    """
+
+    _support = {}
+
+    @staticmethod
+    def isSupported(wait: WebDriverWait):
+        """
+        Return True if the accessibility-tree backend is available for this driver (Chromium with CDP).
+        """
+        driver = wait._driver
+        key = id(driver)
+        if key not in AccessibilityUtils._support:
+            supported = hasattr(driver, "execute_cdp_cmd")
+            if supported:
+                try:
+                    driver.execute_cdp_cmd("DOM.getDocument", {"depth": 0})
+                except WebDriverException:
+                    supported = False
+            AccessibilityUtils._support[key] = supported
+        return AccessibilityUtils._support[key]
+
+    @staticmethod
+    def findByRole(wait: WebDriverWait, role: str, name: str):
+        """
+        Wait for a component with the given role and accessible name and return it.
+
+        Args:
+            wait: WebDriverWait instance.
+            role: ARIA role, e.g. "button", "combobox", "option", "link", "tab".
+            name: Exact accessible name (e.g. the visible label).
+
+        Returns:
+            WebElement: The first matching element in document order.
+
+        Raises:
+            TimeoutException: If no matching element appears within timeout.
+
+        Examples:
+            >>> tab = AccessibilityUtils.findByRole(wait, "tab", "History")
+        """
+        lookup = {}
+        return wait.until(
+            lambda driver: next(iter(AccessibilityUtils.__query(wait, role, name, 1, lookup)), False),
+            message=f"No element with role '{role}' and name '{name}' found.",
+        )
+
+    @staticmethod
+    def findAllByRole(wait: WebDriverWait, role: str, name: str = None):
+        """
+        Return all components with the given role (and accessible name) without waiting.
+
+        Args:
+            wait: WebDriverWait instance.
+            role: ARIA role.
+            name: Exact accessible name, or None for any name.
+
+        Returns:
+            list[WebElement]: Matching elements in document order (may be empty).
+        """
+        return AccessibilityUtils.__query(wait, role, name)
+
+    @staticmethod
+    def clickByRole(wait: WebDriverWait, role: str, name: str):
+        """
+        Click the component with the given role and accessible name.
+
+        Raises:
+            TimeoutException: If no matching element is found or clickable within timeout.
+
+        Examples:
+            >>> AccessibilityUtils.clickByRole(wait, "button", "Save Draft")
+        """
+        component = AccessibilityUtils.findByRole(wait, role, name)
+        ComponentUtils.click(wait, component)
+        return component
+
+    @staticmethod
+    def xpathForRole(role: str, name: str = None):
+        """
+        Build the fallback XPath for a role and accessible name.
+
+        Matches explicit role attributes and native tags with the same implicit role; the
+        name is compared with aria-label, the text of aria-labelledby targets, a label[for]
+        and the element's own text.
+        """
+        tags = _IMPLICIT_ROLE_TAGS.get(role, ())
+        kinds = [f'@role="{role}"'] + [f'(self::{tag} and not(@role))' for tag in tags]
+        condition = " or ".join(kinds)
+        if name is None:
+            return f"//*[{condition}]"
+        text = 'normalize-space(translate({0}, "\u00a0", " "))'
+        named = " or ".join(
+            [
+                f'{text.format("@aria-label")}="{name}"',
+                f'@aria-labelledby=//*[{text.format(".")}="{name}"]/@id',
+                f'@id=//label[{text.format(".")}="{name}"]/@for',
+                f'{text.format(".")}="{name}"',
+            ]
+        )
+        return f"//*[({condition}) and ({named})]"
+
+    @staticmethod
+    def selectorForRole(role: str):
+        """
+        Build the CSS selector of the elements that can carry a role: the explicit role
+        attribute and native tags with the same implicit role.
+        """
+        tags = _IMPLICIT_ROLE_TAGS.get(role, ())
+        return ", ".join([f'[role="{role}"]'] + [f"{tag}:not([role])" for tag in tags])
+
+    @staticmethod
+    def __query(wait: WebDriverWait, role: str, name: str = None, limit: int = None, lookup: dict = None):
+        """
+        Run one lookup attempt. lookup holds state shared by the polls of one lookup (the
+        document node id), so it is fetched once per lookup rather than once per poll.
+        """
+        driver = wait._driver
+        lookup = {} if lookup is None else lookup
+        if AccessibilityUtils.isSupported(wait):
+            try:
+                return AccessibilityUtils.__queryAXTree(driver, role, name, limit, lookup)
+            except WebDriverException as e:
+                logger.warning(f"Accessibility tree query failed, falling back to XPath: {e}")
+                AccessibilityUtils._support[id(driver)] = False
+
+        xpath = AccessibilityUtils.xpathForRole(role, name)
+        return driver.execute_script(_FIND_DISPLAYED_SCRIPT, xpath, limit) or []
+
+    @staticmethod
+    def __queryAXTree(driver, role: str, name: str, limit: int, lookup: dict):
+        params = {"role": role}
+        if name is not None:
+            params["accessibleName"] = name
+        if "root" in lookup:
+            try:
+                nodes = driver.execute_cdp_cmd(
+                    "Accessibility.queryAXTree", {**params, "nodeId": lookup["root"]}
+                )
+            except WebDriverException:
+                # The page navigated and the document node id is gone; fetch it again below
+                del lookup["root"]
+        if "root" not in lookup:
+            lookup["root"] = driver.execute_cdp_cmd("DOM.getDocument", {"depth": 0})["root"]["nodeId"]
+            nodes = driver.execute_cdp_cmd(
+                "Accessibility.queryAXTree", {**params, "nodeId": lookup["root"]}
+            )
+
+        backend_ids = [
+            node["backendDOMNodeId"]
+            for node in nodes["nodes"]
+            if not node.get("ignored") and "backendDOMNodeId" in node
+        ]
+        if limit is not None:
+            backend_ids = backend_ids[:limit]
+        if not backend_ids:
+            return []
+
+        elements = AccessibilityUtils.__elementsByPosition(driver, role, backend_ids, lookup["root"])
+        if elements is None:
+            elements = AccessibilityUtils.__resolveEach(driver, backend_ids)
+        return elements
+
+    @staticmethod
+    def __elementsByPosition(driver, role: str, backend_ids: list, root: int):
+        """
+        Map backend node ids to WebElements with a fixed number of calls, or return None
+        if a node is not among the role's candidate elements.
+        """
+        node_ids = driver.execute_cdp_cmd(
+            "DOM.pushNodesByBackendIdsToFrontend", {"backendNodeIds": backend_ids}
+        )["nodeIds"]
+        selector = AccessibilityUtils.selectorForRole(role)
+        candidates = driver.execute_cdp_cmd(
+            "DOM.querySelectorAll", {"nodeId": root, "selector": selector}
+        )["nodeIds"]
+        position = {node_id: i for i, node_id in enumerate(candidates)}
+        indexes = [position.get(node_id) for node_id in node_ids]
+        if None in indexes:
+            return None
+        return driver.execute_script(_ELEMENTS_AT_SCRIPT, selector, indexes, len(candidates))
+
+    @staticmethod
+    def __resolveEach(driver, backend_ids: list):
+        """Resolve nodes one by one, then hand all of them to execute_script in one Runtime.callFunctionOn."""
+        try:
+            object_ids = [
+                driver.execute_cdp_cmd(
+                    "DOM.resolveNode", {"backendNodeId": backend_id, "objectGroup": "robo_appian"}
+                )["object"]["objectId"]
+                for backend_id in backend_ids
+            ]
+            driver.execute_cdp_cmd(
+                "Runtime.callFunctionOn",
+                {
+                    "objectId": object_ids[0],
+                    "functionDeclaration": _STASH_NODES_FUNCTION,
+                    "arguments": [{"objectId": object_id} for object_id in object_ids],
+                },
+            )
+            return driver.execute_script(_COLLECT_RESOLVED_SCRIPT)
+        finally:
+            driver.execute_cdp_cmd("Runtime.releaseObjectGroup", {"objectGroup": "robo_appian"})
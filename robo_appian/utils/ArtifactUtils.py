@@ -0,0 +1,271 @@
+import atexit
+import gzip
+import itertools
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait as wait_for_futures
+from datetime import datetime
+from pathlib import Path
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from robo_appian.utils.ComponentUtils import ComponentUtils
+
+logger = logging.getLogger(__name__)
+
+
+class ArtifactUtils:
+    """
+    Capture failure evidence when a test fails on a robo_appian wait, without blocking the test on disk writes.
+
+    Once installed on a WebDriverWait, every TimeoutException raised by that wait (and so by every
+    utility that uses it) remembers the locator that was attempted. Nothing is captured then, since
+    many timeouts are expected: probes, ensure* checks and click fallbacks catch them and carry on.
+    When the test does fail, captureFailure takes a screenshot and a DOM snapshot and pairs them with
+    the locator of the timeout that caused the failure (the sample conftest calls it from a
+    pytest_runtest_makereport hook). Only the browser reads happen on the test thread; compression
+    and file writes run on a small background thread pool with a bounded queue. When the queue is
+    full, the artifact is dropped with a warning instead of slowing the test down.
+
+    Files written per failure, sharing one prefix:
+        - <prefix>.png: screenshot
+        - <prefix>.html.gz (or .html): page source
+        - <prefix>.json.gz (or .json): url, locator, reason and timestamp
+
+    Examples:
+        >>> from robo_appian.utils.ArtifactUtils import ArtifactUtils
+        >>> ArtifactUtils.install(wait, "artifacts")
+        >>> try:
+        ...     ButtonUtils.clickByLabelText(wait, "Missing")
+        ... except Exception as e:
+        ...     ArtifactUtils.captureFailure(wait, e)  # evidence written in background
+        ...     raise
+        >>> ArtifactUtils.flush()  # e.g. in a session teardown
+    """
+
+    _directory = None
+    _compress = True
+    _max_workers = 2
+    _max_queue = 16
+    _executor = None
+    _slots = None
+    _futures = set()
+    _lock = threading.Lock()
+    _counter = itertools.count(1)
+    dropped = 0
+
+    @staticmethod
+    def configure(directory, max_workers: int = 2, max_queue: int = 16, compress: bool = True):
+        """
+        Configure where and how failure artifacts are written.
+
+        Args:
+            directory: Directory for artifact files (created on first write).
+            max_workers: Background writer threads.
+            max_queue: Maximum captures waiting to be written; further captures are dropped.
+            compress: Gzip the HTML snapshot and metadata (screenshots are already PNG-compressed).
+        """
+        if (max_workers, max_queue) != (ArtifactUtils._max_workers, ArtifactUtils._max_queue):
+            ArtifactUtils.shutdown()
+        with ArtifactUtils._lock:
+            ArtifactUtils._directory = Path(directory)
+            ArtifactUtils._compress = compress
+            ArtifactUtils._max_workers = max_workers
+            ArtifactUtils._max_queue = max_queue
+
+    @staticmethod
+    def install(wait: WebDriverWait, directory=None):
+        """
+        Remember the locator of every timeout on this WebDriverWait, for captureFailure.
+
+        Wraps wait.until on this instance only; the TimeoutException is re-raised unchanged and
+        nothing is captured until captureFailure is called. Installing twice on the same wait
+        has no effect.
+
+        Args:
+            wait: WebDriverWait instance used by the robo_appian utilities.
+            directory: Optional artifact directory; see configure. Defaults to "robo_appian_artifacts".
+
+        Returns:
+            WebDriverWait: The same wait, for chaining.
+
+        Examples:
+            >>> wait = ArtifactUtils.install(WebDriverWait(driver, 15), "artifacts")
+        """
+        if directory is not None:
+            ArtifactUtils.configure(
+                directory,
+                ArtifactUtils._max_workers,
+                ArtifactUtils._max_queue,
+                ArtifactUtils._compress,
+            )
+
+        original_until = wait.until
+        if getattr(original_until, "_robo_artifacts", False):
+            return wait
+
+        def until(method, message: str = ""):
+            try:
+                return original_until(method, message)
+            except TimeoutException as e:
+                wait._robo_timeout = (e, ComponentUtils.getLocatorFromCondition(method))
+                raise
+
+        until._robo_artifacts = True
+        wait.until = until
+        return wait
+
+    @staticmethod
+    def captureFailure(wait: WebDriverWait, error: BaseException = None):
+        """
+        Capture evidence for a failed test, using the locator of the timeout that caused it.
+
+        The locator is taken from the last timeout of an installed wait when error is that
+        TimeoutException or was raised from it; timeouts that were caught and handled along
+        the way are ignored. Other failures are captured without a locator.
+
+        Args:
+            wait: WebDriverWait instance, usually installed with install.
+            error: The exception that failed the test, or None to use the last timeout.
+
+        Returns:
+            str: Path prefix of the queued artifact files, or None; see capture.
+
+        Examples:
+            >>> ArtifactUtils.captureFailure(wait, call.excinfo.value)  # in pytest_runtest_makereport
+        """
+        timeout, locator = getattr(wait, "_robo_timeout", None) or (None, None)
+        wait._robo_timeout = None
+        reason = str(error) if error is not None else ""
+        if timeout is None or (error is not None and not ArtifactUtils.__raisedFrom(error, timeout)):
+            return ArtifactUtils.capture(wait, None, reason)
+        return ArtifactUtils.capture(wait, locator, timeout.msg or reason)
+
+    @staticmethod
+    def capture(wait: WebDriverWait, locator=None, reason: str = ""):
+        """
+        Capture a screenshot, DOM snapshot and locator now and queue them for writing.
+
+        Args:
+            wait: WebDriverWait instance.
+            locator: The (by, value) locator that was attempted, if known.
+            reason: Short description of the failure (e.g. the timeout message).
+
+        Returns:
+            str: Path prefix of the queued artifact files, or None if the capture failed
+            or was dropped because the write queue is full.
+        """
+        if ArtifactUtils._directory is None:
+            ArtifactUtils._directory = Path("robo_appian_artifacts")
+
+        executor, slots = ArtifactUtils.__ensureExecutor()
+        if not slots.acquire(blocking=False):
+            ArtifactUtils.dropped += 1
+            logger.warning("Failure artifact dropped: write queue is full.")
+            return None
+
+        try:
+            driver = wait._driver
+            screenshot = driver.get_screenshot_as_png()
+            page_source = driver.page_source
+            metadata = {
+                "timestamp": datetime.now().isoformat(timespec="milliseconds"),
+                "url": driver.current_url,
+                "locator": list(locator) if locator else None,
+                "reason": reason,
+            }
+        except Exception as e:
+            slots.release()
+            logger.warning(f"Failure artifact capture failed: {e}")
+            return None
+
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        prefix = ArtifactUtils._directory / f"{stamp}_{next(ArtifactUtils._counter):04d}"
+        future = executor.submit(
+            ArtifactUtils.__write,
+            prefix,
+            screenshot,
+            page_source,
+            metadata,
+            ArtifactUtils._compress,
+        )
+        with ArtifactUtils._lock:
+            ArtifactUtils._futures.add(future)
+
+        def done(finished):
+            slots.release()
+            with ArtifactUtils._lock:
+                ArtifactUtils._futures.discard(finished)
+
+        future.add_done_callback(done)
+        return str(prefix)
+
+    @staticmethod
+    def flush(timeout: float = None):
+        """
+        Block until all queued artifacts are written.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait for all writes.
+
+        Returns:
+            bool: True if the queue is empty, False if writes were still pending at timeout.
+        """
+        with ArtifactUtils._lock:
+            pending = set(ArtifactUtils._futures)
+        if not pending:
+            return True
+        _, not_done = wait_for_futures(pending, timeout=timeout)
+        return not not_done
+
+    @staticmethod
+    def shutdown():
+        """Write all pending artifacts and stop the background writer threads."""
+        ArtifactUtils.flush()
+        with ArtifactUtils._lock:
+            executor = ArtifactUtils._executor
+            ArtifactUtils._executor = None
+            ArtifactUtils._slots = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def __raisedFrom(error: BaseException, timeout: TimeoutException):
+        seen = set()
+        while error is not None and id(error) not in seen:
+            if error is timeout:
+                return True
+            seen.add(id(error))
+            error = error.__cause__ or error.__context__
+        return False
+
+    @staticmethod
+    def __ensureExecutor():
+        with ArtifactUtils._lock:
+            if ArtifactUtils._executor is None:
+                ArtifactUtils._executor = ThreadPoolExecutor(
+                    max_workers=ArtifactUtils._max_workers,
+                    thread_name_prefix="robo_appian_artifacts",
+                )
+                ArtifactUtils._slots = threading.BoundedSemaphore(ArtifactUtils._max_queue)
+            return ArtifactUtils._executor, ArtifactUtils._slots
+
+    @staticmethod
+    def __write(prefix: Path, screenshot: bytes, page_source: str, metadata: dict, compress: bool):
+        try:
+            prefix.parent.mkdir(parents=True, exist_ok=True)
+            prefix.with_name(prefix.name + ".png").write_bytes(screenshot)
+
+            html = page_source.encode("utf-8")
+            details = json.dumps(metadata, indent=2).encode("utf-8")
+            if compress:
+                prefix.with_name(prefix.name + ".html.gz").write_bytes(gzip.compress(html))
+                prefix.with_name(prefix.name + ".json.gz").write_bytes(gzip.compress(details))
+            else:
+                prefix.with_name(prefix.name + ".html").write_bytes(html)
+                prefix.with_name(prefix.name + ".json").write_bytes(details)
+        except Exception as e:
+            logger.warning(f"Failed to write failure artifact {prefix}: {e}")
+
+
+atexit.register(ArtifactUtils.shutdown)
@@ -0,0 +1,358 @@
+import json
+import os
+import tempfile
+import threading
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.support.ui import WebDriverWait
+from robo_appian.utils.SnapshotUtils import SnapshotUtils
+
+
+_MEASURE_LOAD_SCRIPT = """
+const nav = performance.getEntriesByType("navigation")[0];
+const resources = performance.getEntriesByType("resource");
+let transfer = nav ? (nav.transferSize || 0) : 0;
+for (const entry of resources) {
+    transfer += entry.transferSize || 0;
+}
+return {
+    load_ms: nav ? nav.loadEventEnd - nav.startTime : null,
+    dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+    resources: resources.length,
+    transfer_bytes: transfer,
+};
+"""
+
+_FAST_UI_CSS = """
+*, *::before, *::after {
+    animation-duration: 1ms !important;
+    animation-delay: 0s !important;
+    transition-duration: 1ms !important;
+    transition-delay: 0s !important;
+    scroll-behavior: auto !important;
+}
+"""
+
+_INSTALL_FAST_UI_SCRIPT = """
+(function () {
+    const css = __CSS__;
+    const install = () => {
+        if (document.getElementById("robo-appian-fast-ui")) {
+            return;
+        }
+        const style = document.createElement("style");
+        style.id = "robo-appian-fast-ui";
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.documentElement) {
+        install();
+    } else {
+        document.addEventListener("DOMContentLoaded", install, { once: true });
+    }
+})();
+"""
+
+_REMOVE_FAST_UI_SCRIPT = """
+const style = document.getElementById("robo-appian-fast-ui");
+if (style) {
+    style.remove();
+}
+"""
+
+_COMMON_FLAGS = (
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--metrics-recording-only",
+    "--mute-audio",
+)
+
+_FONT_PATTERNS = ("*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*")
+_ANALYTICS_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*hotjar.com*",
+    "*newrelic.com*",
+    "*nr-data.net*",
+)
+_IMAGE_PATTERNS = ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico")
+
+
+class BrowserProfileUtils:
+    """
+    Build lightweight Chrome profiles for faster Appian page loads, and measure what they save.
+
+    A profile combines Chrome flags, URL patterns blocked through the DevTools protocol
+    (Network.setBlockedURLs), image suppression, reduced motion and a disk cache directory
+    shared across sessions. Functional tests do not need fonts, images or analytics beacons,
+    and every skipped download shortens navigation.
+
+    Profiles (see PROFILES):
+        - default: the plain harness flags, nothing blocked (the baseline for reports)
+        - light: default + tuned flags, fonts and analytics blocked, reduced motion, fast UI
+          (see enableFastUI), shared disk cache
+        - minimal: light + images suppressed and blocked
+
+    Examples:
+        >>> options = BrowserProfileUtils.chromeOptions("light", headless=True)
+        >>> driver = webdriver.Chrome(options=options)
+        >>> wait = WebDriverWait(driver, 15)
+        >>> BrowserProfileUtils.apply(wait, "light")
+        >>> driver.get(app_url)
+        >>> BrowserProfileUtils.measureLoad(wait)
+        >>> BrowserProfileUtils.report()
+    """
+
+    DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "robo_appian_cache")
+
+    PROFILES = {
+        "default": {
+            "flags": ("--disable-gpu", "--window-size=1920,1080"),
+            "blocked": (),
+            "images": True,
+            "reduced_motion": False,
+            "fast_ui": False,
+            "cache": False,
+        },
+        "light": {
+            "flags": _COMMON_FLAGS,
+            "blocked": _FONT_PATTERNS + _ANALYTICS_PATTERNS,
+            "images": True,
+            "reduced_motion": True,
+            "fast_ui": True,
+            "cache": True,
+        },
+        "minimal": {
+            "flags": _COMMON_FLAGS,
+            "blocked": _FONT_PATTERNS + _ANALYTICS_PATTERNS + _IMAGE_PATTERNS,
+            "images": False,
+            "reduced_motion": True,
+            "fast_ui": True,
+            "cache": True,
+        },
+    }
+
+    _applied = {}
+    _blocked = {}
+    _fast_ui = {}
+    _loads = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def chromeOptions(profile: str = "light", headless: bool = True, cache_dir: str = None, options=None):
+        """
+        Build ChromeOptions for a profile.
+
+        Args:
+            profile: Name of a profile in PROFILES.
+            headless: Run Chrome headless.
+            cache_dir: Disk cache directory shared across sessions; defaults to DEFAULT_CACHE_DIR
+                for profiles that use a cache.
+            options: Existing ChromeOptions to extend instead of creating new ones.
+
+        Returns:
+            ChromeOptions: Options ready for webdriver.Chrome.
+
+        Raises:
+            ValueError: If the profile is unknown.
+        """
+        settings = BrowserProfileUtils.__settings(profile)
+        options = options if options is not None else ChromeOptions()
+        if headless:
+            options.add_argument("--headless=new")
+        for flag in settings["flags"]:
+            options.add_argument(flag)
+        if settings["cache"] or cache_dir:
+            directory = cache_dir or BrowserProfileUtils.DEFAULT_CACHE_DIR
+            os.makedirs(directory, exist_ok=True)
+            options.add_argument(f"--disk-cache-dir={directory}")
+        if not settings["images"]:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        if settings["reduced_motion"]:
+            options.add_argument("--force-prefers-reduced-motion")
+        return options
+
+    @staticmethod
+    def apply(wait: WebDriverWait, profile: str = "light"):
+        """
+        Apply a profile's runtime settings to a started driver: URL blocking, reduced motion and fast UI.
+
+        Needs a Chromium driver with CDP support; on other drivers only the profile name is
+        recorded for measureLoad.
+
+        Args:
+            wait: WebDriverWait instance.
+            profile: Name of a profile in PROFILES.
+
+        Returns:
+            bool: True if the runtime settings were applied through CDP.
+
+        Raises:
+            ValueError: If the profile is unknown.
+        """
+        settings = BrowserProfileUtils.__settings(profile)
+        driver = wait._driver
+        BrowserProfileUtils._applied[id(driver)] = profile
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        try:
+            if settings["blocked"]:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(settings["blocked"])})
+                BrowserProfileUtils._blocked[id(driver)] = list(settings["blocked"])
+            if settings["reduced_motion"]:
+                driver.execute_cdp_cmd(
+                    "Emulation.setEmulatedMedia",
+                    {"features": [{"name": "prefers-reduced-motion", "value": "reduce"}]},
+                )
+        except WebDriverException:
+            return False
+        if settings.get("fast_ui"):
+            return BrowserProfileUtils.enableFastUI(wait)
+        return True
+
+    @staticmethod
+    def blockedURLs(wait: WebDriverWait):
+        """
+        Return the URL patterns apply() is blocking through Network.setBlockedURLs for this driver.
+
+        The blocking only holds while the CDP Network domain stays enabled, so features that
+        enable the domain themselves (NetworkUtils) must not disable it while this is non-empty.
+
+        Returns:
+            list[str]: The blocked patterns; empty if nothing is blocked.
+        """
+        return list(BrowserProfileUtils._blocked.get(id(wait._driver), ()))
+
+    @staticmethod
+    def enableFastUI(wait: WebDriverWait):
+        """
+        Cut CSS animation and transition durations to 1ms, remove their delays and disable smooth scrolling.
+
+        A near-zero duration rather than 0s keeps transitionend and animationend firing, so UI
+        code that waits for those events still proceeds.
+
+        Injects a stylesheet into the current page. On Chromium drivers the stylesheet is also
+        registered with Page.addScriptToEvaluateOnNewDocument, so every page loaded afterwards
+        gets it before its own scripts run; on other drivers call it again after navigating.
+        With animations over within a millisecond, clickability and visibility waits resolve
+        as soon as the DOM is ready instead of after each animation ends.
+
+        Args:
+            wait: WebDriverWait instance.
+
+        Returns:
+            bool: True if the stylesheet persists across navigations (CDP), False if it only
+            applies to the current page.
+
+        Examples:
+            >>> BrowserProfileUtils.enableFastUI(wait)
+            >>> driver.get(app_url)
+        """
+        driver = wait._driver
+        source = _INSTALL_FAST_UI_SCRIPT.replace("__CSS__", json.dumps(_FAST_UI_CSS))
+        persistent = id(driver) in BrowserProfileUtils._fast_ui
+        if not persistent and hasattr(driver, "execute_cdp_cmd"):
+            try:
+                result = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+                BrowserProfileUtils._fast_ui[id(driver)] = result["identifier"]
+                persistent = True
+            except (WebDriverException, KeyError, TypeError):
+                pass
+        driver.execute_script(source)
+        return persistent
+
+    @staticmethod
+    def disableFastUI(wait: WebDriverWait):
+        """
+        Remove the fast UI stylesheet from the current page and from future pages.
+        """
+        driver = wait._driver
+        identifier = BrowserProfileUtils._fast_ui.pop(id(driver), None)
+        if identifier is not None:
+            try:
+                driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier})
+            except WebDriverException:
+                pass
+        driver.execute_script(_REMOVE_FAST_UI_SCRIPT)
+
+    @staticmethod
+    def measureLoad(wait: WebDriverWait, url: str = None):
+        """
+        Record the load timing of the current page (or of url, after navigating to it).
+
+        Args:
+            wait: WebDriverWait instance.
+            url: Optional URL to load first.
+
+        Returns:
+            dict: "profile", "load_ms", "dom_content_loaded_ms", "resources" and "transfer_bytes".
+        """
+        driver = wait._driver
+        if url is not None:
+            driver.get(url)
+            SnapshotUtils.invalidate(wait)
+        wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+        measurement = dict(driver.execute_script(_MEASURE_LOAD_SCRIPT))
+        measurement["profile"] = BrowserProfileUtils._applied.get(id(driver), "default")
+        with BrowserProfileUtils._lock:
+            BrowserProfileUtils._loads.setdefault(measurement["profile"], []).append(measurement)
+        return measurement
+
+    @staticmethod
+    def report(baseline: str = "default"):
+        """
+        Summarize recorded page loads per profile, with savings against a baseline profile.
+
+        Args:
+            baseline: Profile to compare against.
+
+        Returns:
+            list[dict]: One entry per profile with "profile", "loads", "mean_load_ms",
+            "mean_transfer_bytes", "saved_ms" and "saved_percent" (None without baseline loads).
+        """
+        with BrowserProfileUtils._lock:
+            loads = {profile: list(entries) for profile, entries in BrowserProfileUtils._loads.items()}
+
+        def mean(entries, key):
+            values = [entry[key] for entry in entries if entry.get(key) is not None]
+            return sum(values) / len(values) if values else None
+
+        base = mean(loads.get(baseline, []), "load_ms")
+        summary = []
+        for profile, entries in loads.items():
+            load_ms = mean(entries, "load_ms")
+            saved = base - load_ms if base is not None and load_ms is not None else None
+            summary.append(
+                {
+                    "profile": profile,
+                    "loads": len(entries),
+                    "mean_load_ms": load_ms,
+                    "mean_transfer_bytes": mean(entries, "transfer_bytes"),
+                    "saved_ms": saved,
+                    "saved_percent": saved / base * 100 if saved is not None and base else None,
+                }
+            )
+        return sorted(summary, key=lambda entry: entry["profile"] != baseline)
+
+    @staticmethod
+    def reset():
+        """Clear all recorded page loads."""
+        with BrowserProfileUtils._lock:
+            BrowserProfileUtils._loads.clear()
+
+    @staticmethod
+    def __settings(profile: str):
+        if profile not in BrowserProfileUtils.PROFILES:
+            raise ValueError(f"Unknown browser profile '{profile}'.")
+        return BrowserProfileUtils.PROFILES[profile]
@@ -1,4 +1,435 @@
+import threading
+from typing import NamedTuple, Optional
+from selenium.common.exceptions import NoSuchWindowException, TimeoutException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
+from robo_appian.utils.SnapshotUtils import SnapshotUtils
+
+
+_OPEN_TABS_SCRIPT = """
+const urls = arguments[0];
+const targets = arguments[1];
+return urls.map((url, i) => window.open(url, targets[i]) !== null);
+"""
+
+_WINDOW_NAME_PREFIX = "robo-appian:"
+
+
+class WindowInfo(NamedTuple):
+    """
+    A browser window or tab tracked by WindowManager.
+
+    Attributes:
+        name: Name the window was registered under.
+        handle: WebDriver window handle.
+        parent: Name of the window it was opened from (None for the main window).
+        purpose: Free-text description, e.g. "record view opened from grid link".
+    """
+
+    name: str
+    handle: str
+    parent: Optional[str]
+    purpose: str = ""
+
+
+class WindowManager:
+    """
+    Track the windows and tabs of one driver by name, with their parent and purpose.
+
+    Switching by name is a single switch_to.window call, and closing returns to the
+    window's recorded parent rather than to whatever tab sits at the previous index. The
+    current window is always read from the driver, so switches made outside the manager
+    (switch_to_next_tab, links, scripts) are taken into account. Windows opened by the
+    manager itself (open) are created with switch_to.new_window and need no waiting;
+    windows opened by the page (track) are picked up from the BiDi
+    browsingContext.contextCreated event when the session has BiDi enabled, and otherwise
+    by comparing one window_handles call per poll against the known handles. Every switch
+    and navigation drops the SnapshotUtils page snapshot, which belongs to the page it was
+    taken from.
+
+    Get the manager for a driver with BrowserUtils.windows(wait); the window that is current
+    when it is created is registered as "main".
+
+    Examples:
+        >>> windows = BrowserUtils.windows(wait)
+        >>> windows.track("record", lambda: LinkUtils.click(wait, "INV-1001"), "record view opened from grid link")
+        >>> ... assertions on the record ...
+        >>> windows.close()  # back to "main"
+        >>> windows.open("report", "https://example.appiancloud.com/suite/sites/reports")
+        >>> windows.switch("main")
+    """
+
+    MAIN = "main"
+
+    def __init__(self, wait: WebDriverWait):
+        self.wait = wait
+        self._windows = {}
+        handle = wait._driver.current_window_handle
+        self._windows[WindowManager.MAIN] = WindowInfo(WindowManager.MAIN, handle, None, "initial window")
+
+    @property
+    def current(self):
+        """Name of the window the driver is on, or None if that window is not tracked."""
+        return self.__nameOf(self.__currentHandle())
+
+    def names(self):
+        """Return the names of the tracked windows, in the order they were registered."""
+        return list(self._windows)
+
+    def info(self, name: str = None):
+        """
+        Return the WindowInfo of a tracked window (the current one by default).
+
+        Raises:
+            KeyError: If no window with that name is tracked.
+        """
+        name = name or self.current
+        if name not in self._windows:
+            raise KeyError(f"No window named '{name}' is tracked.")
+        return self._windows[name]
+
+    def handleOf(self, name: str):
+        """Return the window handle registered under name."""
+        return self.info(name).handle
+
+    def open(self, name: str, url: str = None, purpose: str = "", type_hint: str = "tab"):
+        """
+        Open a new tab (or window), register it as a child of the current window and switch to it.
+
+        Args:
+            name: Name to register the window under.
+            url: Optional URL to load in the new window.
+            purpose: Free-text description of the window.
+            type_hint: "tab" or "window".
+
+        Returns:
+            str: The new window handle.
+
+        Raises:
+            ValueError: If the name is already in use.
+        """
+        self.__checkName(name)
+        driver = self.wait._driver
+        parent = self.current
+        driver.switch_to.new_window(type_hint)
+        SnapshotUtils.invalidate(self.wait)
+        handle = driver.current_window_handle
+        self._windows[name] = WindowInfo(name, handle, parent, purpose)
+        if url is not None:
+            driver.get(url)
+        return handle
+
+    def track(self, name: str, action, purpose: str = "", switch: bool = True):
+        """
+        Run an action that opens a window (e.g. clicking a link), wait for the window and register it.
+
+        With BiDi enabled on the session (options.enable_bidi = True), the new window is taken
+        from the browsingContext.contextCreated event as soon as the browser reports it.
+        Classic WebDriver has no new-window event, so without BiDi (or if subscribing fails)
+        window_handles is polled and compared against the handles known before the action.
+
+        Args:
+            name: Name to register the new window under.
+            action: Callable that causes exactly one new window or tab to open.
+            purpose: Free-text description of the window.
+            switch: Switch to the new window once it is open.
+
+        Returns:
+            str: The new window handle.
+
+        Raises:
+            ValueError: If the name is already in use.
+            TimeoutException: If no new window opens within the wait timeout.
+        """
+        self.__checkName(name)
+        driver = self.wait._driver
+        parent = self.current
+        message = f"No new window opened for '{name}'."
+        created = []
+        opened = threading.Event()
+
+        def on_context_created(context):
+            if isinstance(context, dict):
+                context_id, parent_context = context.get("context"), context.get("parent")
+            else:
+                context_id, parent_context = getattr(context, "context", None), getattr(context, "parent", None)
+            if context_id and parent_context is None:
+                created.append(context_id)
+                opened.set()
+
+        callback_id = self.__subscribe("context_created", on_context_created)
+        if callback_id is None:
+            known = set(driver.window_handles)
+            action()
+
+            def new_window(driver):
+                new = [handle for handle in driver.window_handles if handle not in known]
+                return new[0] if new else False
+
+            handle = self.wait.until(new_window, message=message)
+        else:
+            try:
+                action()
+                if not opened.wait(self.wait._timeout):
+                    raise TimeoutException(message)
+                handle = created[0]
+            finally:
+                self.__unsubscribe("context_created", callback_id)
+
+        self._windows[name] = WindowInfo(name, handle, parent, purpose)
+        if switch:
+            self.switch(name)
+        return handle
+
+    def openAll(self, urls, names=None, purpose: str = ""):
+        """
+        Open several URLs in background tabs at once and register them as children of the current window.
+
+        All tabs are opened by one window.open script, so their pages load concurrently
+        while the driver stays on the current window. Each tab is given a window name
+        derived from its registered name, which is how handles are matched to URLs.
+        URLs the browser refuses to open as popups are opened one by one instead.
+
+        Args:
+            urls: URLs to open.
+            names: Names to register the tabs under; defaults to the URLs.
+            purpose: Free-text description of the tabs.
+
+        Returns:
+            list[str]: The registered names, in URL order.
+
+        Raises:
+            ValueError: If a name is already in use or names and urls differ in length.
+            TimeoutException: If the tabs do not open within the wait timeout.
+
+        Examples:
+            >>> names = windows.openAll(["https://.../record/1", "https://.../record/2"])
+        """
+        urls = list(urls)
+        names = list(names) if names is not None else list(urls)
+        if len(names) != len(urls):
+            raise ValueError("names and urls must have the same length.")
+        if len(set(names)) != len(names):
+            raise ValueError("Tab names must be unique.")
+        for name in names:
+            self.__checkName(name)
+
+        driver = self.wait._driver
+        origin_handle = driver.current_window_handle
+        origin = self.__nameOf(origin_handle)
+        known = set(driver.window_handles)
+        targets = [f"{_WINDOW_NAME_PREFIX}{name}" for name in names]
+        opened = driver.execute_script(_OPEN_TABS_SCRIPT, urls, targets)
+        expected = sum(1 for flag in opened if flag)
+
+        def all_opened(driver):
+            new = [handle for handle in driver.window_handles if handle not in known]
+            return new if len(new) >= expected else False
+
+        new_handles = self.wait.until(all_opened, message="Not all tabs opened.") if expected else []
+        by_target = {}
+        for handle in new_handles:
+            self.__switchTo(handle)
+            by_target[driver.execute_script("return window.name")] = handle
+        self.__switchTo(origin_handle)
+
+        for name, url, target in zip(names, urls, targets):
+            if target in by_target:
+                self._windows[name] = WindowInfo(name, by_target[target], origin, purpose)
+            else:
+                self.open(name, url, purpose)
+                self.__switchTo(origin_handle)
+        return names
+
+    def visitAll(self, names, callback, close: bool = True):
+        """
+        Visit tracked tabs one after another and run a callback in each.
+
+        Each tab is switched to, its document is waited on until loaded, and
+        callback(wait, name) runs. With close, the tab is closed afterwards. The driver
+        always returns to the window that was current before the call, also when a
+        callback raises.
+
+        Args:
+            names: Names of tracked tabs, e.g. from openAll.
+            callback: Callable(wait, name) run in each tab, e.g. the assertions for a record.
+            close: Close each tab after its callback.
+
+        Returns:
+            list: The callback results, in the order of names.
+        """
+        origin_handle = self.wait._driver.current_window_handle
+        origin = self.__nameOf(origin_handle)
+        results = []
+        try:
+            for name in names:
+                self.switch(name)
+                self.wait.until(
+                    lambda driver: driver.execute_script("return document.readyState") == "complete",
+                    message=f"Tab '{name}' did not finish loading.",
+                )
+                results.append(callback(self.wait, name))
+                if close:
+                    self.close(name)
+        finally:
+            if close:
+                for name in names:
+                    if name in self._windows and name != origin:
+                        self.close(name)
+            try:
+                self.__switchTo(origin_handle)
+            except NoSuchWindowException:
+                self.switch(WindowManager.MAIN)
+        return results
+
+    def fanOut(self, urls, callback, names=None, purpose: str = "", close: bool = True):
+        """
+        Open URLs in background tabs at once, then run a callback in each tab once it is loaded.
+
+        Reuses the current browser session: the pages load concurrently in their tabs while
+        the first ones are being checked, instead of being loaded one after another.
+
+        Args:
+            urls: URLs to open.
+            callback: Callable(wait, name) run in each tab; name defaults to the URL.
+            names: Names to register the tabs under; defaults to the URLs.
+            purpose: Free-text description of the tabs.
+            close: Close each tab after its callback.
+
+        Returns:
+            list: The callback results, in URL order.
+
+        Examples:
+            >>> def check(wait, url):
+            ...     return LabelUtils.isLabelExists(wait, "Invoice Summary")
+            >>> assert all(BrowserUtils.windows(wait).fanOut(record_urls, check))
+        """
+        names = self.openAll(urls, names, purpose)
+        return self.visitAll(names, callback, close)
+
+    def adopt(self, name: str, handle: str, purpose: str = "", parent: str = None):
+        """
+        Register a window opened outside the manager.
+
+        Args:
+            name: Name to register the window under.
+            handle: Its window handle.
+            purpose: Free-text description of the window.
+            parent: Name of the window it belongs to; defaults to the current window.
+        """
+        self.__checkName(name)
+        self._windows[name] = WindowInfo(name, handle, parent or self.current, purpose)
+
+    def switch(self, name: str):
+        """
+        Switch to a tracked window by name.
+
+        Always issues switch_to.window: the driver may have been moved to another window
+        outside the manager, so a cached "already there" would leave it on the wrong one.
+
+        Raises:
+            KeyError: If no window with that name is tracked.
+        """
+        self.__switchTo(self.handleOf(name))
+
+    def close(self, name: str = None):
+        """
+        Close a tracked window (the current one by default) and switch to its parent.
+
+        If another window is closed, the driver stays on the current window. Windows opened
+        from the closed window are re-parented to its parent.
+
+        Args:
+            name: Name of the window to close.
+
+        Returns:
+            str: Name of the window the driver is on afterwards (None if it is not tracked).
+
+        Raises:
+            KeyError: If no window with that name is tracked, or name is omitted and the
+                current window is not tracked.
+            ValueError: If name is the main window.
+        """
+        driver = self.wait._driver
+        current_handle = driver.current_window_handle
+        name = name or self.__nameOf(current_handle)
+        if name is None:
+            raise KeyError("The current window is not tracked.")
+        info = self.info(name)
+        if name == WindowManager.MAIN:
+            raise ValueError("The main window cannot be closed through the WindowManager.")
+
+        if info.handle != current_handle:
+            self.__switchTo(info.handle)
+            returning_handle = current_handle
+        else:
+            returning = info.parent if info.parent in self._windows else WindowManager.MAIN
+            returning_handle = self._windows[returning].handle
+        try:
+            driver.close()
+        except NoSuchWindowException:
+            pass
+        del self._windows[name]
+        for child, child_info in list(self._windows.items()):
+            if child_info.parent == name:
+                self._windows[child] = child_info._replace(parent=info.parent)
+
+        self.__switchTo(returning_handle)
+        return self.__nameOf(returning_handle)
+
+    def sync(self):
+        """
+        Drop tracked windows that were closed outside the manager (one window_handles call).
+
+        Returns:
+            list[str]: Names of the windows that were dropped.
+        """
+        open_handles = set(self.wait._driver.window_handles)
+        dropped = [
+            name
+            for name, info in self._windows.items()
+            if name != WindowManager.MAIN and info.handle not in open_handles
+        ]
+        for name in dropped:
+            del self._windows[name]
+        if self.__currentHandle() not in open_handles:
+            self.switch(WindowManager.MAIN)
+        return dropped
+
+    def __checkName(self, name: str):
+        if name in self._windows:
+            raise ValueError(f"A window named '{name}' is already tracked.")
+
+    def __switchTo(self, handle: str):
+        self.wait._driver.switch_to.window(handle)
+        SnapshotUtils.invalidate(self.wait)
+
+    def __currentHandle(self):
+        try:
+            return self.wait._driver.current_window_handle
+        except NoSuchWindowException:
+            return None
+
+    def __nameOf(self, handle: str):
+        for name, info in self._windows.items():
+            if info.handle == handle:
+                return name
+        return None
+
+    def __subscribe(self, event: str, callback):
+        """Add a BiDi browsingContext event handler; None if the session has no BiDi."""
+        driver = self.wait._driver
+        if not (getattr(driver, "caps", None) or {}).get("webSocketUrl"):
+            return None
+        try:
+            return driver.browsing_context.add_event_handler(event, callback)
+        except (AttributeError, OSError, WebDriverException):
+            return None
+
+    def __unsubscribe(self, event: str, callback_id: int):
+        try:
+            self.wait._driver.browsing_context.remove_event_handler(event, callback_id)
+        except (AttributeError, OSError, WebDriverException):
+            pass
 
 
 class BrowserUtils:
@@ -13,8 +444,36 @@ class BrowserUtils:
         >>> BrowserUtils.switch_to_Tab(wait, 1)  # Switch to second tab
         >>> BrowserUtils.switch_to_next_tab(wait)  # Move to next tab
         >>> BrowserUtils.close_current_tab_and_switch_back(wait)  # Close and return
+
+    For multi-tab flows, BrowserUtils.windows(wait) tracks windows by name and parent.
     """
 
+    _managers = {}
+
+    @staticmethod
+    def windows(wait: WebDriverWait):
+        """
+        Return the WindowManager of this wait's driver, creating it on first use.
+
+        The window that is current on first use is registered as "main".
+
+        Args:
+            wait: WebDriverWait instance.
+
+        Returns:
+            WindowManager: The driver's window manager.
+
+        Examples:
+            >>> windows = BrowserUtils.windows(wait)
+            >>> windows.track("record", lambda: LinkUtils.click(wait, "INV-1001"))
+        """
+        key = id(wait._driver)
+        manager = BrowserUtils._managers.get(key)
+        if manager is None or manager.wait._driver is not wait._driver:
+            manager = WindowManager(wait)
+            BrowserUtils._managers[key] = manager
+        return manager
+
     @staticmethod
     def switch_to_Tab(wait: WebDriverWait, tab_number):
         """
@@ -40,6 +499,7 @@ class BrowserUtils:
         # Switch to the specified browser tab
         handler = wait._driver.window_handles[tab_number]
         wait._driver.switch_to.window(handler)
+        SnapshotUtils.invalidate(wait)
 
     @staticmethod
     def switch_to_next_tab(wait: WebDriverWait):
@@ -58,11 +518,10 @@ class BrowserUtils:
         Examples:
             >>> BrowserUtils.switch_to_next_tab(wait)  # Cycles through available tabs
         """
-        current_tab_index = wait._driver.window_handles.index(
-            wait._driver.current_window_handle
-        )
-        next_tab_index = (current_tab_index + 1) % len(wait._driver.window_handles)
-        BrowserUtils.switch_to_Tab(wait, next_tab_index)
+        handles = wait._driver.window_handles
+        current_tab_index = handles.index(wait._driver.current_window_handle)
+        wait._driver.switch_to.window(handles[(current_tab_index + 1) % len(handles)])
+        SnapshotUtils.invalidate(wait)
 
     @staticmethod
     def close_current_tab_and_switch_back(wait: WebDriverWait):
@@ -70,8 +529,8 @@ class BrowserUtils:
         Close the current browser tab and return to the previous tab.
 
         Useful when Appian navigation opens a link in a new tab and you need to
-        close it after completing an action. Automatically switches back to the
-        previous tab index.
+        close it after completing an action. Switches back to the tab it was opened
+        from if a WindowManager tracks it, otherwise to the previous tab index.
 
         Args:
             wait: WebDriverWait instance.
@@ -83,9 +542,18 @@ class BrowserUtils:
             >>> # Open a new tab, perform actions, then close it
             >>> BrowserUtils.close_current_tab_and_switch_back(wait)
         """
-        current_tab_index = wait._driver.window_handles.index(
-            wait._driver.current_window_handle
-        )
-        wait._driver.close()
-        original_tab_index = (current_tab_index - 1) % len(wait._driver.window_handles)
-        BrowserUtils.switch_to_Tab(wait, original_tab_index)
+        driver = wait._driver
+        current = driver.current_window_handle
+        manager = BrowserUtils._managers.get(id(driver))
+        if manager is not None and manager.wait._driver is driver:
+            tracked = [name for name in manager.names() if manager.handleOf(name) == current]
+            if tracked and tracked[0] != WindowManager.MAIN:
+                manager.close(tracked[0])
+                return
+
+        handles = driver.window_handles
+        current_tab_index = handles.index(current)
+        driver.close()
+        remaining = handles[:current_tab_index] + handles[current_tab_index + 1 :]
+        driver.switch_to.window(remaining[(current_tab_index - 1) % len(remaining)])
+        SnapshotUtils.invalidate(wait)
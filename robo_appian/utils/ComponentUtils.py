@@ -1,9 +1,14 @@
-try:
-    import tomllib
-except ImportError:  # pragma: no cover - Python < 3.11
-    import tomli as tomllib
+import logging
+from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    JavascriptException,
+    NoSuchElementException,
+    TimeoutException,
+)
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -11,11 +16,289 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
+import threading
 import time
 
+from robo_appian.utils.SnapshotUtils import SnapshotUtils
+
+logger = logging.getLogger(__name__)
+
+_FIND_VISIBLE_COMPONENTS_SCRIPT = """
+const xpath = arguments[0];
+const attributes = arguments[1] || [];
+const snapshot = document.evaluate(
+    xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+);
+
+function isDisplayed(el) {
+    if (typeof el.checkVisibility === "function") {
+        if (!el.checkVisibility({ checkOpacity: true, checkVisibilityCSS: true })) {
+            return false;
+        }
+    } else {
+        const style = window.getComputedStyle(el);
+        if (style.display === "none" || style.visibility !== "visible"
+            || parseFloat(style.opacity) === 0) {
+            return false;
+        }
+    }
+    return el.getClientRects().length > 0;
+}
+
+function isEnabled(el) {
+    return !el.matches(":disabled");
+}
+
+const components = [];
+for (let i = 0; i < snapshot.snapshotLength; i++) {
+    const el = snapshot.snapshotItem(i);
+    if (el.nodeType !== Node.ELEMENT_NODE || !isDisplayed(el) || !isEnabled(el)) {
+        continue;
+    }
+    const values = {};
+    for (const name of attributes) {
+        values[name] = el.getAttribute(name);
+    }
+    components.push({
+        element: el,
+        text: (el.textContent || "").replace(/\\s+/g, " ").trim(),
+        attributes: values,
+    });
+}
+return components;
+"""
+
+_SETTLE_LOADING_SELECTOR = (
+    '[aria-busy="true"], [class*="LoadingIndicator"], '
+    '[class*="appian-indicator"], [class*="---loading"]'
+)
+
+_INSTALL_SETTLE_DETECTOR_SCRIPT = """
+if (window.__roboAppianSettle) {
+    return true;
+}
+const state = { pending: 0, lastActivity: Date.now() };
+window.__roboAppianSettle = state;
+const touch = () => { state.lastActivity = Date.now(); };
+const begin = () => { state.pending += 1; touch(); };
+const end = () => { state.pending = Math.max(0, state.pending - 1); touch(); };
+
+const originalSend = XMLHttpRequest.prototype.send;
+XMLHttpRequest.prototype.send = function () {
+    begin();
+    this.addEventListener("loadend", end, { once: true });
+    try {
+        return originalSend.apply(this, arguments);
+    } catch (e) {
+        end();
+        throw e;
+    }
+};
+
+if (typeof window.fetch === "function") {
+    const originalFetch = window.fetch;
+    window.fetch = function () {
+        begin();
+        try {
+            return originalFetch.apply(this, arguments).then(
+                (response) => { end(); return response; },
+                (error) => { end(); throw error; }
+            );
+        } catch (e) {
+            end();
+            throw e;
+        }
+    };
+}
+
+new MutationObserver(touch).observe(document.documentElement, {
+    childList: true, subtree: true, characterData: true
+});
+return false;
+"""
+
+_CHECK_SETTLED_SCRIPT = """
+const quietMs = arguments[0];
+const loadingSelector = arguments[1];
+const state = window.__roboAppianSettle;
+if (!state) {
+    return null;
+}
+if (document.readyState !== "complete" || state.pending > 0) {
+    return false;
+}
+for (const el of document.querySelectorAll(loadingSelector)) {
+    if (el.getClientRects().length > 0 && !el.closest('[class*="---hidden"]')) {
+        state.lastActivity = Date.now();
+        return false;
+    }
+}
+return Date.now() - state.lastActivity >= quietMs;
+"""
+
+# A class names an overlay when its last word is one of OVERLAY_WORDS: "PopupMask---mask",
+# "gwt-PopupPanelGlass" and "loading-spinner" do, "modal-body" and "loading-complete" do not.
+_OVERLAY_CLASS_JS = """
+const OVERLAY_WORDS = new Set(["mask", "overlay", "backdrop", "glass", "modal", "loading", "spinner", "busy"]);
+
+function hasOverlayClass(node) {
+    const classes = (typeof node.className === "string" ? node.className : "").split(/\\s+/);
+    return classes.some((name) => {
+        const words = name.replace(/([a-z])([A-Z])/g, "$1 $2").split(/[^A-Za-z]+/).filter(Boolean);
+        return words.length > 0 && OVERLAY_WORDS.has(words[words.length - 1].toLowerCase());
+    });
+}
+"""
+
+# Hit test shared by the click fast path and the overlay detector: scrolls the element
+# to the viewport center and reports what covers that point, if anything, and whether
+# that looks like an overlay that will go away (mask, modal, busy indicator, full-screen
+# fixed layer) rather than part of the page such as a label, icon or sticky header.
+_HIT_TEST_JS = _OVERLAY_CLASS_JS + """
+function describe(el) {
+    let text = el.tagName.toLowerCase();
+    if (el.id) {
+        text += "#" + el.id;
+    }
+    const classes = (typeof el.className === "string" ? el.className : "").split(/\\s+/).filter(Boolean);
+    if (classes.length) {
+        text += "." + classes.slice(0, 3).join(".");
+    }
+    if (el.getAttribute("role")) {
+        text += "[role=" + el.getAttribute("role") + "]";
+    }
+    return text;
+}
+
+function isOverlay(el, hit, blocker) {
+    const label = hit.closest("label");
+    if (label && (label.control === el || label.contains(el) || (el.id && label.htmlFor === el.id))) {
+        return false;
+    }
+    for (let node = hit; node; node = node.parentElement) {
+        if (node.getAttribute("aria-modal") === "true" || node.getAttribute("aria-busy") === "true") {
+            return true;
+        }
+        const role = node.getAttribute("role");
+        if (role === "dialog" || role === "alertdialog") {
+            return true;
+        }
+        if (hasOverlayClass(node)) {
+            return true;
+        }
+        if (window.getComputedStyle(node).position === "fixed") {
+            const box = node.getBoundingClientRect();
+            if (box.width >= window.innerWidth / 2 && box.height >= window.innerHeight / 2) {
+                return true;
+            }
+        }
+        if (node === blocker) {
+            break;
+        }
+    }
+    return false;
+}
+
+function hitTest(el) {
+    el.scrollIntoView({ block: "center", inline: "center" });
+    const rect = el.getBoundingClientRect();
+    const x = rect.left + rect.width / 2;
+    const y = rect.top + rect.height / 2;
+    const hit = document.elementFromPoint(x, y);
+    if (!hit || hit === el || el.contains(hit)) {
+        return { x: x, y: y, hit: hit, blocker: null, overlay: false };
+    }
+    let blocker = hit;
+    while (blocker.parentElement && !blocker.parentElement.contains(el)) {
+        blocker = blocker.parentElement;
+    }
+    return { x: x, y: y, hit: hit, blocker: blocker, overlay: isOverlay(el, hit, blocker) };
+}
+"""
+
+_FIND_BLOCKER_SCRIPT = _HIT_TEST_JS + """
+const result = hitTest(arguments[0]);
+if (!result.blocker || !result.overlay) {
+    return null;
+}
+return { element: result.blocker, description: describe(result.blocker) };
+"""
+
+_CLICK_SCRIPT = _HIT_TEST_JS + """
+const el = arguments[0];
+if (!el.isConnected) {
+    return "detached";
+}
+if (el.disabled || el.getAttribute("aria-disabled") === "true") {
+    return "disabled";
+}
+const box = el.getBoundingClientRect();
+const style = window.getComputedStyle(el);
+if (box.width === 0 || box.height === 0 || style.visibility === "hidden" || style.pointerEvents === "none") {
+    return "not visible";
+}
+const result = hitTest(el);
+if (!result.hit || result.blocker) {
+    return "intercepted";
+}
+const hit = result.hit;
+const init = {
+    bubbles: true, cancelable: true, composed: true, view: window,
+    clientX: result.x, clientY: result.y, button: 0,
+};
+hit.dispatchEvent(new PointerEvent("pointerdown", Object.assign({ pointerType: "mouse", isPrimary: true }, init)));
+hit.dispatchEvent(new MouseEvent("mousedown", Object.assign({ buttons: 1 }, init)));
+if (typeof el.focus === "function" && document.activeElement !== el && !el.contains(document.activeElement)) {
+    el.focus({ preventScroll: true });
+}
+hit.dispatchEvent(new PointerEvent("pointerup", Object.assign({ pointerType: "mouse", isPrimary: true }, init)));
+hit.dispatchEvent(new MouseEvent("mouseup", init));
+hit.click();
+return null;
+"""
+
+
+# strftime directives that can be rendered from date attributes without a
+# locale lookup; patterns using anything else fall back to strftime.
+_DATE_DIRECTIVES = {
+    "d": "{0.day:02d}",
+    "m": "{0.month:02d}",
+    "Y": "{0.year:04d}",
+    "y": "{1:02d}",
+    "%": "%",
+}
+
+
+@lru_cache(maxsize=32)
+def _compileDateFormat(pattern: str):
+    """Compile a strftime pattern once into a formatting function."""
+    template = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char != "%":
+            template.append(char.replace("{", "{{").replace("}", "}}"))
+            i += 1
+            continue
+        directive = pattern[i + 1 : i + 2]
+        if directive not in _DATE_DIRECTIVES:
+            return lambda value: value.strftime(pattern)
+        template.append(_DATE_DIRECTIVES[directive])
+        i += 2
+    template = "".join(template)
+    return lambda value: template.format(value, value.year % 100)
+
 
 class ComponentUtils:
-    
+
+    DATE_FORMAT = "%m/%d/%Y"
+
+    # Click strategy used by click(): "native", "script" or "actions"
+    CLICK_STRATEGY = "native"
+
+    _click_stats = {}
+    _click_lock = threading.Lock()
+
     @staticmethod
     def retry_until(func, timeout=10, wait_interval=0.5, raise_on_timeout=False, *args, **kwargs):
         """
@@ -47,6 +330,67 @@ class ComponentUtils:
             raise TimeoutError(f"Operation did not succeed within {timeout} seconds")
         return False
 
+    @staticmethod
+    def install_settle_detector(wait: WebDriverWait):
+        """
+        Hook network activity and DOM mutations on the current page for wait_for_settled.
+
+        Wraps XMLHttpRequest and fetch to count in-flight requests and observes DOM
+        mutations to track the last activity time. Installing is idempotent; call it
+        before an interaction so requests started by that interaction are counted.
+        A full page navigation discards the hooks; wait_for_settled reinstalls them.
+
+        Args:
+            wait: WebDriverWait instance.
+
+        Returns:
+            bool: True if the detector was already installed on this page, False if it was just installed.
+        """
+        return bool(wait._driver.execute_script(_INSTALL_SETTLE_DETECTOR_SCRIPT))
+
+    @staticmethod
+    def wait_for_settled(
+        wait: WebDriverWait,
+        quiet_period: float = 0.3,
+        loading_selector: str = _SETTLE_LOADING_SELECTOR,
+    ):
+        """
+        Wait until the Appian interface has finished re-evaluating after an interaction.
+
+        The page counts as settled when the document is loaded, no XHR/fetch request is
+        in flight, no Appian loading indicator is visible, and the DOM has not changed
+        for `quiet_period` seconds. Use it right after a server round trip instead of
+        fixed sleeps or retry loops.
+
+        Args:
+            wait: WebDriverWait instance. Its timeout bounds the total wait.
+            quiet_period: Seconds without network or DOM activity required to count as settled.
+            loading_selector: CSS selector for loading indicators that must not be visible.
+
+        Returns:
+            bool: True once the page is settled.
+
+        Raises:
+            TimeoutException: If the page does not settle within the wait timeout.
+
+        Examples:
+            >>> ComponentUtils.install_settle_detector(wait)
+            >>> ButtonUtils.clickByLabelText(wait, "Save")
+            >>> ComponentUtils.wait_for_settled(wait)
+        """
+        quiet_ms = int(quiet_period * 1000)
+
+        def settled(driver):
+            state = driver.execute_script(
+                _CHECK_SETTLED_SCRIPT, quiet_ms, loading_selector
+            )
+            if state is None:
+                driver.execute_script(_INSTALL_SETTLE_DETECTOR_SCRIPT)
+                return False
+            return state
+
+        return wait.until(settled)
+
     @staticmethod
     def upload_file(wait, file_path):
         """
@@ -60,13 +404,33 @@ class ComponentUtils:
             )
 
             # Send the file path directly to the input element
+            SnapshotUtils.invalidate(wait)
             file_input.send_keys(file_path)
         except Exception as e:
             raise
 
     @staticmethod
     def get_version():
+        """
+        Returns the installed robo_appian version.
+
+        Reads the installed distribution metadata; in a source checkout that is not
+        installed, falls back to the version in pyproject.toml. Returns "0.0.0" if
+        neither is available.
+        """
+        from importlib import metadata
+
+        try:
+            return metadata.version("robo_appian")
+        except metadata.PackageNotFoundError:
+            pass
+
         try:
+            try:
+                import tomllib
+            except ImportError:  # pragma: no cover - Python < 3.11
+                import tomli as tomllib
+
             # pyproject.toml lives at the repo root (two levels above package dir)
             toml_path = Path(__file__).parents[2] / "pyproject.toml"
             with open(toml_path, "rb") as f:
@@ -76,29 +440,49 @@ class ComponentUtils:
         except Exception:
             return "0.0.0"
 
+    @staticmethod
+    def formatDate(value, pattern: str = None):
+        """
+        Format a date for an Appian date field.
+
+        The pattern is compiled once and cached, so formatting many dates with the
+        same pattern (e.g. a locale's date format) costs no repeated parsing.
+
+        Args:
+            value: date, datetime or an already formatted string (returned unchanged).
+            pattern: strftime pattern. Defaults to ComponentUtils.DATE_FORMAT (MM/DD/YYYY).
+
+        Returns:
+            str: The formatted date.
+
+        Raises:
+            ValueError: If value is not a date, datetime or string.
+
+        Examples:
+            >>> ComponentUtils.formatDate(date(2024, 1, 15))
+            '01/15/2024'
+            >>> ComponentUtils.formatDate(date(2024, 1, 15), "%d.%m.%Y")
+            '15.01.2024'
+        """
+        if isinstance(value, str):
+            return value
+        if not isinstance(value, date):
+            raise ValueError(f"Expected a date, datetime or str, got {type(value).__name__}")
+        return _compileDateFormat(pattern or ComponentUtils.DATE_FORMAT)(value)
+
     @staticmethod
     def today():
         """
         Returns today's date formatted as MM/DD/YYYY.
         """
-
-        from datetime import date
-
-        today = date.today()
-        yesterday_formatted = today.strftime("%m/%d/%Y")
-        return yesterday_formatted
+        return ComponentUtils.formatDate(date.today())
 
     @staticmethod
     def yesterday():
         """
         Returns yesterday's date formatted as MM/DD/YYYY.
         """
-
-        from datetime import date, timedelta
-
-        yesterday = date.today() - timedelta(days=1)
-        yesterday_formatted = yesterday.strftime("%m/%d/%Y")
-        return yesterday_formatted
+        return ComponentUtils.formatDate(date.today() - timedelta(days=1))
 
     @staticmethod
     def findChildComponentByXpath(
@@ -167,6 +551,7 @@ class ComponentUtils:
         Example usage:
         ComponentUtils.tab(wait)
         """
+        SnapshotUtils.invalidate(wait)
         driver = wait._driver
         actions = ActionChains(driver)
         actions.send_keys(Keys.TAB).perform()
@@ -180,26 +565,92 @@ class ComponentUtils:
             :param xpath: XPath string to locate the components
             :return: List of WebElements matching the XPath
         """
-        # Wait for the presence of elements matching the XPath
+        components = ComponentUtils.findVisibleComponentsByXPath(wait, xpath)
+        if len(components) > 0:
+            return [component["element"] for component in components]
+
+        raise Exception(f"No valid components found for XPath: {xpath}")
+
+    @staticmethod
+    def findVisibleComponentsByXPath(
+        wait: WebDriverWait, xpath: str, attributes: list[str] = None
+    ):
+        """
+        Find all displayed and enabled components matching an XPath in one browser call.
+
+        Waits for the first match to be present, then evaluates the XPath, filters the
+        matches by visibility and enabled state, and reads their key attributes inside
+        the browser. Replaces one is_displayed()/is_enabled() round trip per element
+        with a single script call, which matters for long lists of links or checkboxes.
+
+        Args:
+            wait: WebDriverWait instance.
+            xpath: XPath expression to locate the components.
+            attributes: Attribute names to read for each component. Defaults to
+                id, role, aria-label, aria-controls, aria-selected, aria-checked and href.
+
+        Returns:
+            list[dict]: One entry per qualifying component with keys "element"
+            (WebElement), "text" (normalized text content) and "attributes"
+            (attribute name to value, None when absent). Empty if none qualify.
+
+        Raises:
+            TimeoutException: If no element matching the XPath is present within timeout.
+
+        Examples:
+            >>> links = ComponentUtils.findVisibleComponentsByXPath(wait, "//a", ["href"])
+            >>> hrefs = [link["attributes"]["href"] for link in links]
+        """
+        if attributes is None:
+            attributes = [
+                "id",
+                "role",
+                "aria-label",
+                "aria-controls",
+                "aria-selected",
+                "aria-checked",
+                "href",
+            ]
+
         wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
+        components = wait._driver.execute_script(
+            _FIND_VISIBLE_COMPONENTS_SCRIPT, xpath, list(attributes)
+        )
+        return components or []
 
-        # Find all matching elements
-        driver = wait._driver
-        components = driver.find_elements(By.XPATH, xpath)
+    @staticmethod
+    def getLocatorFromCondition(condition):
+        """
+        Best-effort extraction of the locator a wait condition polls for.
 
-        # Filter for clickable and displayed components
-        valid_components = []
-        for component in components:
-            try:
-                if component.is_displayed() and component.is_enabled():
-                    valid_components.append(component)
-            except Exception:
-                continue
+        Works with selenium's expected_conditions (which close over a (By, value) locator)
+        and with the lambdas used in this package that close over an `xpath` string.
 
-        if len(valid_components) > 0:
-            return valid_components
+        Args:
+            condition: The callable passed to WebDriverWait.until.
 
-        raise Exception(f"No valid components found for XPath: {xpath}")
+        Returns:
+            tuple: (by, value) locator, or None if the condition does not reveal one.
+
+        Examples:
+            >>> ComponentUtils.getLocatorFromCondition(EC.visibility_of_element_located((By.ID, "save")))
+            ('id', 'save')
+        """
+        names = getattr(getattr(condition, "__code__", None), "co_freevars", ())
+        for name, cell in zip(names, getattr(condition, "__closure__", None) or ()):
+            try:
+                value = cell.cell_contents
+            except ValueError:
+                continue
+            if (
+                isinstance(value, tuple)
+                and len(value) == 2
+                and all(isinstance(part, str) for part in value)
+            ):
+                return value
+            if name == "xpath" and isinstance(value, str):
+                return (By.XPATH, value)
+        return None
 
     @staticmethod
     def findComponentByXPath(wait: WebDriverWait, xpath: str):
@@ -231,19 +682,35 @@ class ComponentUtils:
         ComponentUtils.click(wait, component)
 
     @staticmethod
-    def click(wait: WebDriverWait, component: WebElement):
+    def click(wait: WebDriverWait, component: WebElement, strategy: str = None):
         """
-        Reliably click an element using ActionChains and wait for clickability.
-
-        Preferred over direct element.click() because it handles animations, overlays,
-        and other DOM interactions that can cause click failures. Waits for the element
-        to be clickable, moves the mouse to it, and clicks using ActionChains.
+        Reliably click an element, trying a one-call fast path before ActionChains.
+
+        The fast path depends on the strategy (ComponentUtils.CLICK_STRATEGY by default):
+
+        - "native" (default): checks is_enabled, then WebElement.click(), a trusted browser
+          click; the driver reports ElementClickInterceptedException if something covers
+          the element.
+        - "script" (opt-in): one script checks that the element is attached, enabled, visible
+          and not covered at its center (elementFromPoint), then dispatches the pointer/mouse
+          events and the click. The events are synthetic (isTrusted is false) and there is
+          no hover, so only use it for components that do not depend on either.
+        - "actions": no fast path.
+
+        When the fast path cannot click (disabled, not yet visible, intercepted), click falls
+        back to waiting for element_to_be_clickable, then for any overlay covering the element
+        to disappear (see findBlocker), and clicks through ActionChains. If an overlay is
+        still there at the wait timeout, it clicks anyway, logs a warning naming the overlay
+        and counts a "blocker timeout" reason. Fallbacks are counted per strategy, see
+        clickStats().
 
         Args:
             wait: WebDriverWait instance.
             component: WebElement to click.
+            strategy: Override ComponentUtils.CLICK_STRATEGY for this click.
 
         Raises:
+            ValueError: If the strategy is unknown.
             TimeoutException: If element not clickable within timeout.
 
         Examples:
@@ -253,11 +720,161 @@ class ComponentUtils:
 
         Note:
             This is used internally by all robo_appian click methods (ButtonUtils, etc).
+            BrowserProfileUtils.enableFastUI removes CSS animations so the clickability
+            wait does not have to outlast them.
         """
+        strategy = strategy or ComponentUtils.CLICK_STRATEGY
+        if strategy not in ("script", "native", "actions"):
+            raise ValueError(f"Unknown click strategy '{strategy}'.")
+
+        SnapshotUtils.invalidate(wait)
+        reason = None
+        if strategy == "script":
+            try:
+                reason = wait._driver.execute_script(_CLICK_SCRIPT, component)
+            except JavascriptException as e:
+                reason = f"script error: {e.msg}"
+        elif strategy == "native":
+            try:
+                if component.is_enabled():
+                    component.click()
+                else:
+                    reason = "disabled"
+            except ElementClickInterceptedException:
+                reason = "intercepted"
+            except ElementNotInteractableException:
+                reason = "not interactable"
+        else:
+            reason = "actions"
+
+        ComponentUtils.__recordClick(strategy, None if strategy == "actions" else reason)
+        if reason is None:
+            return
+
         wait.until(EC.element_to_be_clickable(component))
+        try:
+            ComponentUtils.waitForBlockersToDisappear(wait, component)
+        except TimeoutException as e:
+            # Click through, as ActionChains did before overlays were detected, but leave a trace
+            logger.warning(f"Clicking through an overlay that did not go away: {e.msg}")
+            ComponentUtils.__recordClick(strategy, "blocker timeout", count=False)
+        SnapshotUtils.invalidate(wait)
         actions = ActionChains(wait._driver)
         actions.move_to_element(component).click().perform()
 
+    @staticmethod
+    def findBlocker(wait: WebDriverWait, component: WebElement):
+        """
+        Return the overlay covering the center of a component, if any.
+
+        Scrolls the component to the viewport center and hit-tests that point with
+        elementFromPoint in one script. The returned element is the outermost ancestor of
+        the hit element that does not contain the component, typically the loading mask or
+        modal overlay itself. Only overlays that are expected to go away count: elements
+        marked aria-modal or aria-busy, dialogs, mask/overlay/loading classes and fixed
+        layers covering most of the viewport. A label of the component, an icon in the
+        same component or a sticky header is not reported.
+
+        Args:
+            wait: WebDriverWait instance.
+            component: WebElement that is about to be clicked.
+
+        Returns:
+            WebElement: The covering overlay, or None if no overlay covers the component's center.
+
+        Examples:
+            >>> blocker = ComponentUtils.findBlocker(wait, button)
+            >>> if blocker is not None:
+            ...     print(blocker.get_attribute("class"))
+        """
+        result = ComponentUtils.__hitTest(wait, component)
+        return result["element"] if result else None
+
+    @staticmethod
+    def waitForBlockersToDisappear(wait: WebDriverWait, component: WebElement, max_blockers: int = 3):
+        """
+        Wait until no overlay (see findBlocker) covers the center of a component.
+
+        Each detected blocker is waited on directly (until it is hidden or removed from the
+        page) instead of re-polling the component's locator. Overlays that replace each
+        other, e.g. a loading mask followed by a dialog, are handled up to max_blockers.
+
+        Args:
+            wait: WebDriverWait instance. Its timeout applies to each blocker.
+            component: WebElement that is about to be clicked.
+            max_blockers: Maximum number of successive blockers to wait for.
+
+        Returns:
+            list[str]: Descriptions of the blockers that were waited for (empty if none).
+
+        Raises:
+            TimeoutException: If a blocker is still visible at the wait timeout; the message
+                names the blocker.
+        """
+        waited = []
+        for _ in range(max_blockers):
+            result = ComponentUtils.__hitTest(wait, component)
+            if result is None:
+                break
+            waited.append(result["description"])
+            wait.until(
+                EC.invisibility_of_element(result["element"]),
+                message=f"Click target is covered by {result['description']}.",
+            )
+        return waited
+
+    @staticmethod
+    def __hitTest(wait: WebDriverWait, component: WebElement):
+        try:
+            return wait._driver.execute_script(_FIND_BLOCKER_SCRIPT, component)
+        except JavascriptException:
+            return None
+
+    @staticmethod
+    def clickStats():
+        """
+        Return click counts per strategy and how often each fell back to ActionChains.
+
+        Returns:
+            dict: strategy -> {"clicks", "fallbacks", "fallback_rate", "reasons"}, where
+            reasons counts the fallbacks by cause ("intercepted", "disabled", ...) and, as
+            "blocker timeout", the clicks that went through an overlay still there at the
+            wait timeout.
+
+        Examples:
+            >>> ComponentUtils.clickStats()["native"]["fallback_rate"]
+            0.04
+        """
+        with ComponentUtils._click_lock:
+            return {
+                strategy: dict(
+                    stats,
+                    reasons=dict(stats["reasons"]),
+                    fallback_rate=stats["fallbacks"] / stats["clicks"] if stats["clicks"] else 0.0,
+                )
+                for strategy, stats in ComponentUtils._click_stats.items()
+            }
+
+    @staticmethod
+    def resetClickStats():
+        """Clear the click statistics."""
+        with ComponentUtils._click_lock:
+            ComponentUtils._click_stats.clear()
+
+    @staticmethod
+    def __recordClick(strategy: str, reason: str = None, count: bool = True):
+        """Count a click and its fallback reason; with count=False only add the reason."""
+        with ComponentUtils._click_lock:
+            stats = ComponentUtils._click_stats.setdefault(
+                strategy, {"clicks": 0, "fallbacks": 0, "reasons": {}}
+            )
+            if count:
+                stats["clicks"] += 1
+                if reason is not None:
+                    stats["fallbacks"] += 1
+            if reason is not None:
+                stats["reasons"][reason] = stats["reasons"].get(reason, 0) + 1
+
     @staticmethod
     def waitForElementToBeVisibleById(wait: WebDriverWait, id: str):
         return wait.until(EC.visibility_of_element_located((By.ID, id)))
@@ -0,0 +1,270 @@
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+
+_FIND_WITH_FALLBACK_SCRIPT = """
+const kind = arguments[0];
+const label = arguments[1];
+const order = arguments[2];
+const primary = arguments[3];
+const normalize = (text) => (text || "").replace(/\\s+/g, " ").trim();
+
+function isDisplayed(el) {
+    if (typeof el.checkVisibility === "function") {
+        return el.checkVisibility({ checkOpacity: true, checkVisibilityCSS: true });
+    }
+    const style = window.getComputedStyle(el);
+    return style.display !== "none" && style.visibility !== "hidden" && el.getClientRects().length > 0;
+}
+
+function firstVisible(elements) {
+    for (const el of elements) {
+        if (el && isDisplayed(el)) {
+            return el;
+        }
+    }
+    return null;
+}
+
+function byXPath(xpath) {
+    const snapshot = document.evaluate(
+        xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    const found = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) {
+        found.push(snapshot.snapshotItem(i));
+    }
+    return firstVisible(found);
+}
+
+function labelledBy(el) {
+    const ids = (el.getAttribute("aria-labelledby") || "").split(/\\s+/).filter(Boolean);
+    return ids.map((id) => normalize((document.getElementById(id) || {}).textContent)).filter(Boolean);
+}
+
+function hasName(el) {
+    return normalize(el.getAttribute("aria-label")) === label || labelledBy(el).includes(label);
+}
+
+const enabled = (el) => el.getAttribute("aria-disabled") !== "true";
+
+const strategies = {
+    tab: {
+        xpath: () => byXPath(primary),
+        aria: () => firstVisible(Array.from(document.querySelectorAll("[role='tab']")).filter(
+            (el) => hasName(el) || normalize(el.textContent) === label
+        )),
+        link: () => firstVisible(Array.from(document.querySelectorAll("[role='link']")).filter(
+            (el) => normalize(el.textContent) === label
+        )),
+    },
+    combobox: {
+        xpath: () => byXPath(primary),
+        aria: () => firstVisible(Array.from(document.querySelectorAll("[role='combobox']")).filter(
+            (el) => enabled(el) && hasName(el)
+        )),
+        label_for: () => firstVisible(Array.from(document.querySelectorAll("label[for]")).filter(
+            (el) => normalize(el.textContent) === label
+        ).map((el) => {
+            const target = document.getElementById(el.htmlFor);
+            if (!target) {
+                return null;
+            }
+            return target.getAttribute("role") === "combobox" ? target : target.querySelector("[role='combobox']");
+        }).filter((el) => el && enabled(el))),
+        id_suffix: () => firstVisible(Array.from(document.querySelectorAll("[role='combobox'][id$='_value']")).filter(
+            (el) => {
+                if (!enabled(el)) {
+                    return false;
+                }
+                const container = el.closest("[role='presentation']") || el.parentElement?.parentElement?.parentElement;
+                return container && Array.from(container.querySelectorAll("span")).some(
+                    (span) => normalize(span.textContent) === label
+                );
+            }
+        )),
+    },
+};
+
+for (const name of order) {
+    const strategy = (strategies[kind] || {})[name];
+    const el = strategy ? strategy() : null;
+    if (el) {
+        return { element: el, strategy: name };
+    }
+}
+return null;
+"""
+
+
+class LocatorUtils:
+    """
+    Find components through an ordered chain of locator strategies, remembering which one works.
+
+    Appian markup shifts between versions, and a fixed XPath that no longer matches costs a full
+    wait timeout before anything else can be tried. LocatorUtils tries every strategy for a
+    component type within one script call per poll: the utility's own XPath first, then
+    ARIA role + accessible name, label/for and Appian id suffix patterns. When a fallback
+    strategy finds the component, it is remembered per label for the rest of the run, so later
+    lookups try the winner first.
+
+    Strategies per component type (default order):
+        - tab: xpath, aria (role="tab" + name), link (role="link" + text)
+        - combobox: xpath, aria (role="combobox" + aria-label/aria-labelledby), label_for,
+          id_suffix (id ending "_value" inside the labelled container)
+
+    Learned strategies stay in memory unless a cache file is configured (configure, or the
+    ROBO_APPIAN_LOCATOR_CACHE environment variable). A strategy is only written to that file
+    after it has won PERSIST_AFTER lookups in a row for the same label, so one lucky fallback
+    on a half-rendered page does not reorder every later run.
+
+    Examples:
+        >>> tab = LocatorUtils.find(wait, "tab", "Details", '//div/div[@role="link"]//p[normalize-space(.)="Details"]')
+        >>> LocatorUtils.learned()
+        {'tab': {'Details': 'aria'}}
+    """
+
+    STRATEGIES = {
+        "tab": ("xpath", "aria", "link"),
+        "combobox": ("xpath", "aria", "label_for", "id_suffix"),
+    }
+    PERSIST_AFTER = 3
+
+    _cache_path = None
+    _learned = None
+    _persisted = None
+    _wins = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def configure(cache_path=None, persist_after: int = 3):
+        """
+        Configure where learned strategies are persisted.
+
+        Args:
+            cache_path: JSON file for learned strategies, or None to keep them in memory
+                (unless ROBO_APPIAN_LOCATOR_CACHE is set).
+            persist_after: Consecutive wins of the same strategy for a label before it is written.
+        """
+        with LocatorUtils._lock:
+            LocatorUtils._cache_path = Path(cache_path) if cache_path is not None else None
+            LocatorUtils.PERSIST_AFTER = persist_after
+            LocatorUtils._learned = None
+            LocatorUtils._persisted = None
+            LocatorUtils._wins = {}
+
+    @staticmethod
+    def find(wait: WebDriverWait, kind: str, label: str, xpath: str):
+        """
+        Find a visible component by label, falling back through the strategies for its kind.
+
+        Args:
+            wait: WebDriverWait instance.
+            kind: Component type, a key of LocatorUtils.STRATEGIES.
+            label: Exact visible label (accessible name) of the component.
+            xpath: The utility's own XPath for the component (the "xpath" strategy).
+
+        Returns:
+            WebElement: The component found by the first strategy that matches.
+
+        Raises:
+            ValueError: If kind is unknown.
+            TimeoutException: If no strategy finds the component within timeout.
+        """
+        if kind not in LocatorUtils.STRATEGIES:
+            raise ValueError(f"Unknown component type '{kind}'.")
+
+        learned = LocatorUtils.__load().get(kind, {})
+        order = list(LocatorUtils.STRATEGIES[kind])
+        preferred = learned.get(label)
+        if preferred in order:
+            order.remove(preferred)
+            order.insert(0, preferred)
+
+        result = wait.until(
+            lambda driver: driver.execute_script(_FIND_WITH_FALLBACK_SCRIPT, kind, label, order, xpath),
+            message=f"No locator strategy found {kind} '{label}' (tried {', '.join(order)}).",
+        )
+        default = LocatorUtils.STRATEGIES[kind][0]
+        if preferred is not None or result["strategy"] != default:
+            if preferred not in (None, result["strategy"]):
+                logger.info(f"{kind} '{label}': strategy '{result['strategy']}' replaced '{preferred}'.")
+            LocatorUtils.__remember(kind, label, result["strategy"])
+        return result["element"]
+
+    @staticmethod
+    def learned():
+        """
+        Return the learned strategy per component type and label.
+
+        Returns:
+            dict: kind -> {label: strategy}.
+        """
+        with LocatorUtils._lock:
+            return {kind: dict(labels) for kind, labels in LocatorUtils.__load().items()}
+
+    @staticmethod
+    def clear():
+        """Forget all learned strategies, in memory and in the cache file."""
+        with LocatorUtils._lock:
+            LocatorUtils._learned = {}
+            LocatorUtils._persisted = {}
+            LocatorUtils._wins = {}
+            LocatorUtils.__save()
+
+    @staticmethod
+    def __cachePath():
+        if LocatorUtils._cache_path is not None:
+            return LocatorUtils._cache_path
+        path = os.environ.get("ROBO_APPIAN_LOCATOR_CACHE")
+        return Path(path) if path else None
+
+    @staticmethod
+    def __load():
+        if LocatorUtils._learned is None:
+            persisted = {}
+            path = LocatorUtils.__cachePath()
+            if path is not None and path.exists():
+                try:
+                    persisted = json.loads(path.read_text(encoding="utf-8"))
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable locator cache {path}: {e}")
+            LocatorUtils._persisted = persisted
+            LocatorUtils._learned = {kind: dict(labels) for kind, labels in persisted.items()}
+        return LocatorUtils._learned
+
+    @staticmethod
+    def __remember(kind: str, label: str, strategy: str):
+        """
+        Prefer strategy for this label from now on, and persist it once it has won
+        PERSIST_AFTER lookups in a row.
+        """
+        with LocatorUtils._lock:
+            LocatorUtils.__load().setdefault(kind, {})[label] = strategy
+            last, wins = LocatorUtils._wins.get((kind, label), (None, 0))
+            wins = wins + 1 if last == strategy else 1
+            LocatorUtils._wins[(kind, label)] = (strategy, wins)
+
+            persisted = LocatorUtils._persisted.setdefault(kind, {})
+            if wins >= LocatorUtils.PERSIST_AFTER and persisted.get(label) != strategy:
+                persisted[label] = strategy
+                LocatorUtils.__save()
+
+    @staticmethod
+    def __save():
+        path = LocatorUtils.__cachePath()
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp = path.with_name(path.name + ".tmp")
+            temp.write_text(json.dumps(LocatorUtils._persisted, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(temp, path)
+        except OSError as e:
+            logger.warning(f"Could not write locator cache {path}: {e}")
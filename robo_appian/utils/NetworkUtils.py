@@ -0,0 +1,288 @@
+import json
+import logging
+import re
+import threading
+import time
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from robo_appian.utils.BrowserProfileUtils import BrowserProfileUtils
+from robo_appian.utils.ComponentUtils import ComponentUtils
+
+logger = logging.getLogger(__name__)
+
+
+class NetworkUtils:
+    """
+    Track Appian server calls through the Chrome DevTools Network domain.
+
+    Once started, Network.requestWillBeSent / responseReceived / loadingFinished events are
+    read from the driver's performance log on every poll. Requests whose URL matches the
+    monitor's pattern (by default Appian's interface endpoints) are tracked while in flight
+    and recorded with their status, server latency (time from sending the request until the
+    response headers arrived) and total duration. That lets a wait target "the interface
+    re-evaluation response has arrived" instead of guessing from elements, and separates
+    slow server responses from slow waits in reports.
+
+    The performance log must be enabled when the driver is created, see enableLogging().
+    Without it (or on non-Chromium drivers) the monitor is not started, and waitForResponse
+    and waitForIdle fall back to ComponentUtils.wait_for_settled.
+
+    Examples:
+        >>> options = ChromeOptions()
+        >>> NetworkUtils.enableLogging(options)
+        >>> driver = webdriver.Chrome(options=options)
+        ...
+        >>> NetworkUtils.start(wait)
+        >>> mark = NetworkUtils.mark(wait)
+        >>> ButtonUtils.clickByLabelText(wait, "Save")
+        >>> record = NetworkUtils.waitForResponse(wait, after=mark)
+        >>> print(record["url"], record["latency_ms"])
+    """
+
+    APPIAN_PATTERN = r"/suite/(?:rest|sail|api)/"
+    MAX_RECORDS = 1000
+
+    _monitors = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def enableLogging(options):
+        """
+        Enable the Chrome performance log needed by the network monitor.
+
+        Args:
+            options: ChromeOptions (or EdgeOptions) used to create the driver.
+
+        Returns:
+            The same options, for chaining.
+        """
+        prefs = dict(options.capabilities.get("goog:loggingPrefs") or {})
+        prefs["performance"] = "ALL"
+        options.set_capability("goog:loggingPrefs", prefs)
+        return options
+
+    @staticmethod
+    def start(wait: WebDriverWait, url_pattern: str = APPIAN_PATTERN):
+        """
+        Start tracking requests whose URL matches url_pattern.
+
+        Args:
+            wait: WebDriverWait instance.
+            url_pattern: Regular expression searched in each request URL.
+
+        Returns:
+            bool: True if the monitor is running, False if the driver has no performance
+            log or CDP support (the wait helpers then fall back to wait_for_settled).
+        """
+        driver = wait._driver
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.get_log("performance")
+        except WebDriverException as e:
+            logger.warning(f"Network monitor unavailable, falling back to wait_for_settled: {e}")
+            return False
+
+        with NetworkUtils._lock:
+            NetworkUtils._monitors[id(driver)] = {
+                "pattern": re.compile(url_pattern),
+                "pending": {},
+                "records": [],
+                "sent": 0,
+                "mark": 0,
+                "last_activity": time.monotonic(),
+            }
+        return True
+
+    @staticmethod
+    def stop(wait: WebDriverWait):
+        """
+        Stop tracking requests and return the recorded requests.
+
+        The CDP Network domain is disabled again unless a browser profile blocks URLs through
+        it (BrowserProfileUtils.apply), whose blocking would otherwise stop with it.
+
+        Returns:
+            list[dict]: Completed request records, as returned by requests().
+        """
+        driver = wait._driver
+        with NetworkUtils._lock:
+            monitor = NetworkUtils._monitors.pop(id(driver), None)
+        if monitor is None:
+            return []
+        if not BrowserProfileUtils.blockedURLs(wait):
+            try:
+                driver.execute_cdp_cmd("Network.disable", {})
+            except WebDriverException:
+                pass
+        return list(monitor["records"])
+
+    @staticmethod
+    def isActive(wait: WebDriverWait):
+        """
+        Return True if the network monitor is running for the driver of this wait.
+        """
+        return id(wait._driver) in NetworkUtils._monitors
+
+    @staticmethod
+    def mark(wait: WebDriverWait):
+        """
+        Mark the current point in the request stream; call it right before an interaction.
+
+        Returns:
+            int: Marker to pass as waitForResponse(after=...). 0 when the monitor is not running.
+        """
+        monitor = NetworkUtils.__poll(wait)
+        if monitor is None:
+            return 0
+        monitor["mark"] = monitor["sent"]
+        return monitor["mark"]
+
+    @staticmethod
+    def waitForResponse(wait: WebDriverWait, url_pattern: str = None, after: int = None):
+        """
+        Wait until a matching request sent after the mark has finished.
+
+        Args:
+            wait: WebDriverWait instance. Its timeout bounds the wait.
+            url_pattern: Regular expression the URL must also match, e.g. a specific endpoint.
+            after: Marker from mark(); defaults to the last mark taken for this driver.
+
+        Returns:
+            dict: The request record (see requests()), or None when the monitor is not running
+            and the wait fell back to ComponentUtils.wait_for_settled.
+
+        Raises:
+            TimeoutException: If no matching response arrives within timeout.
+
+        Examples:
+            >>> mark = NetworkUtils.mark(wait)
+            >>> DropdownUtils.selectDropdownValueByLabelText(wait, "Department", "Finance")
+            >>> NetworkUtils.waitForResponse(wait, after=mark)
+        """
+        if not NetworkUtils.isActive(wait):
+            ComponentUtils.wait_for_settled(wait)
+            return None
+
+        pattern = re.compile(url_pattern) if url_pattern else None
+
+        def arrived(driver):
+            monitor = NetworkUtils.__poll(wait)
+            since = monitor["mark"] if after is None else after
+            for record in monitor["records"]:
+                if record["seq"] > since and (pattern is None or pattern.search(record["url"])):
+                    return record
+            return False
+
+        return wait.until(arrived, message="No matching server response arrived.")
+
+    @staticmethod
+    def waitForIdle(wait: WebDriverWait, quiet_period: float = 0.3):
+        """
+        Wait until no tracked request is in flight and none has started or finished for quiet_period.
+
+        Args:
+            wait: WebDriverWait instance. Its timeout bounds the wait.
+            quiet_period: Seconds without tracked network activity required to count as idle.
+
+        Returns:
+            bool: True once the network is idle.
+
+        Raises:
+            TimeoutException: If requests are still in flight at the wait timeout.
+        """
+        if not NetworkUtils.isActive(wait):
+            return ComponentUtils.wait_for_settled(wait, quiet_period)
+
+        def idle(driver):
+            monitor = NetworkUtils.__poll(wait)
+            return not monitor["pending"] and time.monotonic() - monitor["last_activity"] >= quiet_period
+
+        return wait.until(idle, message="Server requests still in flight.")
+
+    @staticmethod
+    def pending(wait: WebDriverWait):
+        """
+        Return the URLs of the tracked requests currently in flight.
+        """
+        monitor = NetworkUtils.__poll(wait)
+        return [request["url"] for request in monitor["pending"].values()] if monitor else []
+
+    @staticmethod
+    def requests(wait: WebDriverWait):
+        """
+        Return the completed tracked requests, oldest first.
+
+        Returns:
+            list[dict]: Records with "seq", "url", "method", "status" (None for failed
+            requests), "error", "latency_ms" (send until response headers, i.e. server time),
+            "duration_ms" (send until body loaded) and "started" (time.time() of the request).
+        """
+        monitor = NetworkUtils.__poll(wait)
+        return list(monitor["records"]) if monitor else []
+
+    @staticmethod
+    def __poll(wait: WebDriverWait):
+        """Apply the Network events logged since the last poll to the monitor."""
+        driver = wait._driver
+        monitor = NetworkUtils._monitors.get(id(driver))
+        if monitor is None:
+            return None
+        try:
+            entries = driver.get_log("performance")
+        except WebDriverException as e:
+            logger.warning(f"Could not read the performance log: {e}")
+            return monitor
+
+        with NetworkUtils._lock:
+            for entry in entries:
+                try:
+                    message = json.loads(entry["message"])["message"]
+                except (KeyError, ValueError):
+                    continue
+                NetworkUtils.__apply(monitor, message.get("method"), message.get("params") or {})
+        return monitor
+
+    @staticmethod
+    def __apply(monitor: dict, method: str, params: dict):
+        pending = monitor["pending"]
+        request_id = params.get("requestId")
+
+        if method == "Network.requestWillBeSent":
+            request = params.get("request") or {}
+            url = request.get("url", "")
+            if not monitor["pattern"].search(url):
+                return
+            monitor["sent"] += 1
+            monitor["last_activity"] = time.monotonic()
+            pending[request_id] = {
+                "seq": monitor["sent"],
+                "url": url,
+                "method": request.get("method"),
+                "status": None,
+                "error": None,
+                "latency_ms": None,
+                "duration_ms": None,
+                "started": params.get("wallTime"),
+                "timestamp": params.get("timestamp"),
+            }
+
+        elif method == "Network.responseReceived" and request_id in pending:
+            response = params.get("response") or {}
+            timing = response.get("timing") or {}
+            record = pending[request_id]
+            record["status"] = response.get("status")
+            if "receiveHeadersEnd" in timing and "sendStart" in timing:
+                record["latency_ms"] = timing["receiveHeadersEnd"] - timing["sendStart"]
+
+        elif method in ("Network.loadingFinished", "Network.loadingFailed") and request_id in pending:
+            record = pending.pop(request_id)
+            if method == "Network.loadingFailed":
+                record["error"] = params.get("errorText") or "failed"
+            if record["timestamp"] is not None and params.get("timestamp") is not None:
+                record["duration_ms"] = (params["timestamp"] - record["timestamp"]) * 1000
+            del record["timestamp"]
+            monitor["records"].append(record)
+            del monitor["records"][: -NetworkUtils.MAX_RECORDS]
+            monitor["last_activity"] = time.monotonic()
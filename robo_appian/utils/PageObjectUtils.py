@@ -0,0 +1,323 @@
+import argparse
+import keyword
+import re
+import sys
+from pathlib import Path
+from typing import NamedTuple, Optional
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from robo_appian.utils.ComponentUtils import ComponentUtils
+from robo_appian.utils.SnapshotUtils import SnapshotUtils
+
+
+class PageField(NamedTuple):
+    """
+    One component of a generated page object.
+
+    Attributes:
+        kind: "input", "dropdown", "search_input", "button" or "column".
+        label: Visible label (column header abbr for columns), as accepted by the label-based utilities.
+        id: Element id at generation time, for reference. Appian may regenerate ids, so
+            lookups use xpath.
+        xpath: Precomputed locator that resolves the label to the element in one evaluation.
+        list_id: Options list id (aria-controls) for dropdowns and search inputs at generation time.
+    """
+
+    kind: str
+    label: str
+    id: Optional[str]
+    xpath: str
+    list_id: Optional[str] = None
+
+    def find(self, wait: WebDriverWait):
+        """
+        Wait for this component to be visible and return it.
+
+        Raises:
+            TimeoutException: If the component is not visible within timeout.
+        """
+        return ComponentUtils.waitForComponentToBeVisibleByXpath(wait, self.xpath)
+
+
+class PageObjectUtils:
+    """
+    Generate page-object modules from a captured Appian interface.
+
+    Detects labelled inputs, dropdown comboboxes, search inputs, buttons and grid columns
+    in an HTML snapshot and writes a module with one PageField per component. Each field
+    carries a precomputed XPath that resolves its label to the element in a single browser
+    evaluation, so tests skip the label-to-id discovery done by the label-based utilities.
+    Regenerating, or running verify, after an interface change reports renamed labels
+    before any test runs.
+
+    Requires the optional lxml dependency (pip install robo_appian[snapshot]).
+
+    Examples:
+        >>> source = PageObjectUtils.generateFromPage(wait, "LeaveRequestPage")
+        >>> Path("pages/leave_request.py").write_text(source)
+
+        # In a test
+        >>> from pages.leave_request import LeaveRequestPage as Page
+        >>> DropdownUtils.selectDropdownValueByComboboxComponent(wait, Page.LEAVE_TYPE.find(wait), "Annual")
+        >>> ComponentUtils.click(wait, Page.SUBMIT_BUTTON.find(wait))
+
+        Command line, from a saved snapshot:
+            python -m robo_appian.utils.PageObjectUtils snapshot.html LeaveRequestPage -o pages/leave_request.py
+    """
+
+    @staticmethod
+    def detectFields(html: str):
+        """
+        Detect the labelled components in an HTML snapshot.
+
+        Elements marked hidden by SnapshotUtils.capture and elements without a label are skipped.
+
+        Args:
+            html: HTML of the interface, e.g. from SnapshotUtils.capture or a saved page.
+
+        Returns:
+            list[PageField]: Detected components in document order, without duplicates.
+
+        Raises:
+            ImportError: If lxml is not installed.
+        """
+        from lxml import html as lxml_html
+
+        root = lxml_html.fromstring(html)
+        hidden = SnapshotUtils.HIDDEN_ATTRIBUTE
+        ids = {el.get("id"): el for el in root.iter() if isinstance(el.tag, str) and el.get("id")}
+        label_for = {
+            label.get("for"): PageObjectUtils.__text(label) for label in root.iter("label") if label.get("for")
+        }
+
+        fields = []
+        seen = set()
+
+        def add(field):
+            if field.label and (field.kind, field.label) not in seen:
+                seen.add((field.kind, field.label))
+                fields.append(field)
+
+        for el in root.iter():
+            if not isinstance(el.tag, str) or el.get(hidden) is not None:
+                continue
+            tag = el.tag.lower()
+            role = el.get("role")
+            element_id = el.get("id")
+
+            if tag in ("input", "textarea") and role != "combobox":
+                if el.get("type") in ("hidden", "file", "checkbox", "radio", "submit", "button"):
+                    continue
+                label = label_for.get(element_id)
+                if label:
+                    literal = PageObjectUtils.__literal(label)
+                    xpath = f'//*[@id=//label[normalize-space(translate(., "\u00a0", " "))={literal}]/@for]'
+                    add(PageField("input", label, element_id, xpath))
+
+            elif tag == "input" and role == "combobox":
+                label = PageObjectUtils.__structuralLabel(el) or label_for.get(element_id)
+                if label:
+                    literal = PageObjectUtils.__literal(label)
+                    xpath = (
+                        f'.//div[./div/span[normalize-space(translate(., "\u00a0", " "))={literal}]]'
+                        '/div/div/div/input[@role="combobox"]'
+                    )
+                    add(PageField("search_input", label, element_id, xpath, el.get("aria-controls")))
+
+            elif role == "combobox":
+                label = PageObjectUtils.__labelledBy(el, ids) or PageObjectUtils.__structuralLabel(el)
+                if label:
+                    literal = PageObjectUtils.__literal(label)
+                    xpath = (
+                        f'//span[normalize-space(translate(., "\u00a0", " "))={literal}]'
+                        '/ancestor::div[@role="presentation"][1]//div[@role="combobox"]'
+                    )
+                    add(PageField("dropdown", label, element_id, xpath, el.get("aria-controls")))
+
+            elif tag == "button":
+                spans = [child for child in el if isinstance(child.tag, str) and child.tag == "span"]
+                label = next((PageObjectUtils.__text(span) for span in spans if PageObjectUtils.__text(span)), "")
+                if label:
+                    literal = PageObjectUtils.__literal(label)
+                    add(PageField("button", label, element_id, f".//button[./span[normalize-space(.)={literal}]]"))
+
+            elif tag == "th" and el.get("scope") == "col" and el.get("abbr"):
+                label = el.get("abbr")
+                literal = PageObjectUtils.__literal(label)
+                add(PageField("column", label, element_id, f".//table/thead/tr/th[@abbr={literal}]"))
+
+        return fields
+
+    @staticmethod
+    def generate(html: str, class_name: str, source: str = None):
+        """
+        Generate page-object module source from an HTML snapshot.
+
+        Args:
+            html: HTML of the interface.
+            class_name: Name of the generated class (e.g. "LeaveRequestPage").
+            source: Optional description of where the snapshot came from, written into the docstring.
+
+        Returns:
+            str: Python source of the module.
+
+        Raises:
+            ValueError: If class_name is not a valid identifier.
+            ImportError: If lxml is not installed.
+        """
+        if not class_name.isidentifier() or keyword.iskeyword(class_name):
+            raise ValueError(f"Invalid class name: {class_name!r}")
+
+        fields = PageObjectUtils.detectFields(html)
+        names = []
+        used = set()
+        for field in fields:
+            name = PageObjectUtils.__attributeName(field)
+            candidate, n = name, 2
+            while candidate in used:
+                candidate, n = f"{name}_{n}", n + 1
+            used.add(candidate)
+            names.append(candidate)
+
+        lines = [
+            '"""',
+            f"Page object for {class_name}.",
+            "",
+            f"Generated by robo_appian.utils.PageObjectUtils{f' from {source}' if source else ''}.",
+            "Regenerate instead of editing by hand.",
+            '"""',
+            "from robo_appian.utils.PageObjectUtils import PageField",
+            "",
+            "",
+            f"class {class_name}:",
+        ]
+        if not fields:
+            lines.append("    FIELDS = ()")
+        for name, field in zip(names, fields):
+            lines.append(f"    {name} = {field!r}")
+        if fields:
+            lines.append("")
+            lines.append("    FIELDS = (")
+            lines.extend(f"        {name}," for name in names)
+            lines.append("    )")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def generateFromPage(wait: WebDriverWait, class_name: str, path=None):
+        """
+        Capture the current page and generate a page-object module for it.
+
+        Args:
+            wait: WebDriverWait instance.
+            class_name: Name of the generated class.
+            path: Optional file to write the module to.
+
+        Returns:
+            str: Python source of the module.
+        """
+        source = PageObjectUtils.generate(
+            SnapshotUtils.capture(wait), class_name, source=wait._driver.current_url
+        )
+        if path is not None:
+            Path(path).write_text(source, encoding="utf-8")
+        return source
+
+    @staticmethod
+    def verify(wait: WebDriverWait, page):
+        """
+        Check that every field of a generated page object is still on the current page.
+
+        Uses one snapshot of the page when lxml is installed, otherwise one lookup per field.
+
+        Args:
+            wait: WebDriverWait instance.
+            page: Generated page-object class (with a FIELDS tuple).
+
+        Returns:
+            list[PageField]: Fields whose locator no longer matches (e.g. renamed labels).
+
+        Examples:
+            >>> missing = PageObjectUtils.verify(wait, LeaveRequestPage)
+            >>> assert not missing, [field.label for field in missing]
+        """
+        missing = []
+        with SnapshotUtils.snapshot(wait):
+            for field in page.FIELDS:
+                found = SnapshotUtils.exists(wait, field.xpath)
+                if found is None:
+                    found = bool(wait._driver.find_elements(By.XPATH, field.xpath))
+                if not found:
+                    missing.append(field)
+        return missing
+
+    @staticmethod
+    def __text(element):
+        return " ".join(element.text_content().replace("\u00a0", " ").split())
+
+    @staticmethod
+    def __labelledBy(element, ids):
+        for label_id in (element.get("aria-labelledby") or "").split():
+            if label_id in ids:
+                text = PageObjectUtils.__text(ids[label_id])
+                if text:
+                    return text
+        return None
+
+    @staticmethod
+    def __structuralLabel(element):
+        """Find the div/span or div/label text of the nearest enclosing component container."""
+        ancestor = element.getparent()
+        for _ in range(6):
+            if ancestor is None:
+                return None
+            for child in ancestor:
+                if not isinstance(child.tag, str) or child.tag != "div":
+                    continue
+                for label in child:
+                    if isinstance(label.tag, str) and label.tag in ("span", "label"):
+                        text = PageObjectUtils.__text(label)
+                        if text:
+                            return text
+            ancestor = ancestor.getparent()
+        return None
+
+    @staticmethod
+    def __literal(text: str):
+        """Quote text as an XPath string literal."""
+        if '"' not in text:
+            return f'"{text}"'
+        if "'" not in text:
+            return f"'{text}'"
+        parts = text.split('"')
+        return "concat(" + ", '\"', ".join(f'"{part}"' for part in parts) + ")"
+
+    @staticmethod
+    def __attributeName(field: PageField):
+        name = re.sub(r"[^0-9A-Za-z]+", "_", field.label).strip("_").upper() or "FIELD"
+        if field.kind in ("button", "column"):
+            name = f"{name}_{field.kind.upper()}"
+        if name[0].isdigit():
+            name = f"F_{name}"
+        return name
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m robo_appian.utils.PageObjectUtils",
+        description="Generate a robo_appian page-object module from a saved HTML snapshot.",
+    )
+    parser.add_argument("snapshot", help="HTML file of the Appian interface")
+    parser.add_argument("class_name", help="Name of the generated class")
+    parser.add_argument("-o", "--output", help="Write the module here instead of stdout")
+    args = parser.parse_args(argv)
+
+    html = Path(args.snapshot).read_text(encoding="utf-8")
+    source = PageObjectUtils.generate(html, args.class_name, source=Path(args.snapshot).name)
+    if args.output:
+        Path(args.output).write_text(source, encoding="utf-8")
+    else:
+        sys.stdout.write(source)
+
+
+if __name__ == "__main__":
+    main()
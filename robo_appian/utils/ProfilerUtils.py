@@ -0,0 +1,210 @@
+import re
+import threading
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from robo_appian.utils.ComponentUtils import ComponentUtils
+
+
+_TIME_XPATHS_SCRIPT = """
+const xpaths = arguments[0];
+const repeat = Math.max(1, arguments[1]);
+const results = [];
+for (const xpath of xpaths) {
+    try {
+        let matches = 0;
+        const start = performance.now();
+        for (let i = 0; i < repeat; i++) {
+            matches = document.evaluate(
+                xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+            ).snapshotLength;
+        }
+        results.push({ ms: (performance.now() - start) / repeat, matches: matches, error: null });
+    } catch (e) {
+        results.push({ ms: null, matches: 0, error: String(e && e.message || e) });
+    }
+}
+return { domSize: document.getElementsByTagName("*").length, results: results };
+"""
+
+_LITERAL_PATTERN = re.compile(r'"[^"]*"|\'[^\']*\'')
+
+
+class ProfilerUtils:
+    """
+    Time how long robo_appian's XPath locators take to evaluate in the browser.
+
+    Once installed on a WebDriverWait, the XPath polled by each wait is evaluated once more
+    with document.evaluate and timed with performance.now(). Timings are aggregated per
+    template (the XPath with its string literals replaced by "?"), so every label looked up
+    through the same utility method lands in one entry. report() lists the most expensive
+    templates with the DOM size at their slowest evaluation; benchmark() compares
+    alternative XPaths against the same DOM in one script call.
+
+    Profiling costs one extra script call per profiled wait; use sample_every to thin it out.
+
+    Examples:
+        >>> ProfilerUtils.install(wait)
+        >>> ... run the test ...
+        >>> for entry in ProfilerUtils.report(5):
+        ...     print(f"{entry['total_ms']:8.1f} ms  {entry['calls']:4d}x  {entry['template']}")
+    """
+
+    _stats = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def install(wait: WebDriverWait, sample_every: int = 1):
+        """
+        Profile the XPath locators polled by this WebDriverWait.
+
+        Wraps wait.until on this instance only. Installing twice on the same wait has no effect.
+
+        Args:
+            wait: WebDriverWait instance used by the robo_appian utilities.
+            sample_every: Profile every n-th XPath wait (1 profiles all of them).
+
+        Returns:
+            WebDriverWait: The same wait, for chaining.
+        """
+        original_until = wait.until
+        if getattr(original_until, "_robo_profiler", False):
+            return wait
+
+        counter = {"waits": 0}
+
+        def until(method, message: str = ""):
+            locator = ComponentUtils.getLocatorFromCondition(method)
+            if locator is None or locator[0] != By.XPATH:
+                return original_until(method, message)
+
+            start = time.monotonic()
+            try:
+                return original_until(method, message)
+            finally:
+                counter["waits"] += 1
+                if counter["waits"] % max(1, sample_every) == 0:
+                    wait_ms = (time.monotonic() - start) * 1000
+                    try:
+                        ProfilerUtils.profile(wait, locator[1], wait_ms=wait_ms)
+                    except Exception:
+                        pass
+
+        until._robo_profiler = True
+        wait.until = until
+        return wait
+
+    @staticmethod
+    def profile(wait: WebDriverWait, xpath: str, repeat: int = 1, wait_ms: float = None):
+        """
+        Time one XPath in the browser and add the result to the per-template statistics.
+
+        Args:
+            wait: WebDriverWait instance.
+            xpath: XPath expression to time.
+            repeat: Evaluations to average over.
+            wait_ms: Wall time of the wait that used this XPath, if known.
+
+        Returns:
+            dict: "ms" (mean evaluation time), "matches", "error" and "dom_size".
+        """
+        timing = wait._driver.execute_script(_TIME_XPATHS_SCRIPT, [xpath], repeat)
+        result = dict(timing["results"][0], dom_size=timing["domSize"])
+        if result["error"] is None:
+            ProfilerUtils.__record(xpath, result["ms"], timing["domSize"], wait_ms)
+        return result
+
+    @staticmethod
+    def benchmark(wait: WebDriverWait, strategies: dict, repeat: int = 5):
+        """
+        Compare alternative XPaths for the same element against the same DOM.
+
+        All strategies are evaluated in one script call, so the page cannot change between them.
+
+        Args:
+            wait: WebDriverWait instance.
+            strategies: Mapping of strategy name to XPath.
+            repeat: Evaluations per strategy to average over.
+
+        Returns:
+            list[dict]: One entry per strategy with "name", "xpath", "ms", "matches", "error"
+            and "dom_size", fastest first (failing strategies last).
+
+        Examples:
+            >>> ProfilerUtils.benchmark(wait, {
+            ...     "label text": '//*[normalize-space(translate(., "\\u00a0", " "))="Status"]',
+            ...     "span text": '//span[normalize-space(.)="Status"]',
+            ... })
+        """
+        names = list(strategies)
+        timing = wait._driver.execute_script(
+            _TIME_XPATHS_SCRIPT, [strategies[name] for name in names], repeat
+        )
+        results = [
+            dict(result, name=name, xpath=strategies[name], dom_size=timing["domSize"])
+            for name, result in zip(names, timing["results"])
+        ]
+        return sorted(results, key=lambda r: (r["ms"] is None, r["ms"] or 0.0))
+
+    @staticmethod
+    def report(limit: int = None, sort_by: str = "total_ms"):
+        """
+        Return the aggregated per-template statistics, worst first.
+
+        Args:
+            limit: Return at most this many entries.
+            sort_by: "total_ms", "mean_ms" or "max_ms".
+
+        Returns:
+            list[dict]: Entries with "template", "example" (one concrete XPath), "calls",
+            "total_ms", "mean_ms", "max_ms", "dom_size" (DOM element count at the slowest
+            evaluation) and "wait_ms" (total wall time of the profiled waits).
+        """
+        with ProfilerUtils._lock:
+            entries = [
+                dict(entry, mean_ms=entry["total_ms"] / entry["calls"])
+                for entry in ProfilerUtils._stats.values()
+            ]
+        entries.sort(key=lambda entry: entry[sort_by], reverse=True)
+        return entries[:limit] if limit is not None else entries
+
+    @staticmethod
+    def reset():
+        """Clear all recorded statistics."""
+        with ProfilerUtils._lock:
+            ProfilerUtils._stats.clear()
+
+    @staticmethod
+    def template(xpath: str):
+        """
+        Return the template of an XPath: its string literals replaced by "?".
+
+        Examples:
+            >>> ProfilerUtils.template('//span[text()="Status"]')
+            '//span[text()=?]'
+        """
+        return _LITERAL_PATTERN.sub("?", xpath)
+
+    @staticmethod
+    def __record(xpath: str, ms: float, dom_size: int, wait_ms: float = None):
+        template = ProfilerUtils.template(xpath)
+        with ProfilerUtils._lock:
+            entry = ProfilerUtils._stats.get(template)
+            if entry is None:
+                entry = {
+                    "template": template,
+                    "example": xpath,
+                    "calls": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "dom_size": dom_size,
+                    "wait_ms": 0.0,
+                }
+                ProfilerUtils._stats[template] = entry
+            entry["calls"] += 1
+            entry["total_ms"] += ms
+            entry["wait_ms"] += wait_ms or 0.0
+            if ms >= entry["max_ms"]:
+                entry["max_ms"] = ms
+                entry["dom_size"] = dom_size
+                entry["example"] = xpath
@@ -1,16 +1,177 @@
 import time
 import logging
 import os
+import threading
+from dataclasses import dataclass
 from datetime import datetime
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class RetryPolicy:
+    """
+    Retry settings for RoboUtils.retry.
+
+    Attributes:
+        max_retries: Maximum number of total attempts (initial + retries).
+        budget: Total seconds a step may spend on attempts and backoff, or None for no limit.
+            When a WebDriverWait is passed to RoboUtils.retry, its timeout is shortened so that
+            a single attempt cannot run past the remaining budget.
+        backoff: Delay in seconds before the first retry of a timed-out attempt.
+        backoff_factor: Multiplier applied to the delay after each timed-out attempt.
+        max_backoff: Upper bound for a single backoff delay.
+        intercepted_delay: Delay before retrying an intercepted click (overlays are usually short-lived).
+        retry_on: Exception kinds to retry ("timeout", "stale", "intercepted"); see RoboUtils.classify_exception.
+
+    Examples:
+        >>> policy = RetryPolicy(max_retries=4, budget=20, backoff=0.5)
+        >>> RoboUtils.retry(lambda: ButtonUtils.clickByLabelText(wait, "Save"), policy, "save", wait)
+    """
+
+    max_retries: int = 3
+    budget: float = None
+    backoff: float = 0.5
+    backoff_factor: float = 2.0
+    max_backoff: float = 5.0
+    intercepted_delay: float = 0.25
+    retry_on: tuple = ("timeout", "stale", "intercepted")
+
+
 class RoboUtils:
-    
+
+    _retry_metrics = {}
+    _retry_metrics_lock = threading.Lock()
+
+    @staticmethod
+    def classify_exception(exception: BaseException):
+        """
+        Classify an exception raised by a Selenium step to pick a retry recovery.
+
+        Args:
+            exception: The exception raised by the operation.
+
+        Returns:
+            str: "stale" for StaleElementReferenceException (retry at once, the element is re-found),
+            "intercepted" for ElementClickInterceptedException (short delay for the overlay to go),
+            "timeout" for TimeoutException (backoff before the next full wait),
+            or None for anything that should not be retried.
+        """
+        if isinstance(exception, StaleElementReferenceException):
+            return "stale"
+        if isinstance(exception, ElementClickInterceptedException):
+            return "intercepted"
+        if isinstance(exception, TimeoutException):
+            return "timeout"
+        return None
+
+    @staticmethod
+    def retry(operation, policy: RetryPolicy = None, operation_name="operation", wait=None):
+        """
+        Run an operation under a retry policy with a time budget, backoff and exception classification.
+
+        Each failure is classified with classify_exception and recovered cheaply for its kind:
+        stale elements are retried immediately, intercepted clicks after a short delay, and
+        timeouts after an exponential backoff. The time spent in failed attempts and delays is
+        recorded per operation_name; see get_retry_metrics.
+
+        Args:
+            operation (callable): Callable taking no arguments that performs the step.
+            policy (RetryPolicy, optional): Retry settings. Defaults to RetryPolicy().
+            operation_name (str, optional): Name used in log messages and retry metrics.
+            wait (WebDriverWait, optional): The wait used by the operation. When given together
+                with a budget, its timeout is capped to the remaining budget for each attempt and
+                restored afterwards.
+
+        Returns:
+            The return value from the successful execution of the operation callable.
+
+        Raises:
+            TimeoutException: If the last failure was a timeout and attempts or budget are exhausted.
+            Exception: The last exception for other retryable kinds once exhausted, or any
+                non-retryable exception immediately.
+
+        Examples:
+            >>> RoboUtils.retry(
+            ...     lambda: ButtonUtils.clickByLabelText(wait, "Submit"),
+            ...     RetryPolicy(budget=20),
+            ...     operation_name="click submit",
+            ...     wait=wait,
+            ... )
+        """
+        if policy is None:
+            policy = RetryPolicy()
+
+        start = time.monotonic()
+        original_timeout = wait._timeout if wait is not None else None
+        delay = policy.backoff
+        attempt = 0
+
+        try:
+            while True:
+                attempt += 1
+                attempt_start = time.monotonic()
+                if wait is not None and policy.budget is not None:
+                    remaining = policy.budget - (attempt_start - start)
+                    wait._timeout = max(0.0, min(original_timeout, remaining))
+                try:
+                    result = operation()
+                except Exception as e:
+                    kind = RoboUtils.classify_exception(e)
+                    wasted = time.monotonic() - attempt_start
+                    if kind is None or kind not in policy.retry_on:
+                        RoboUtils.__recordRetry(operation_name, attempt, kind, wasted, failed=True)
+                        logger.error(f"Error during {operation_name}: {e}")
+                        raise
+
+                    if kind == "stale":
+                        pause = 0.0
+                    elif kind == "intercepted":
+                        pause = policy.intercepted_delay
+                    else:
+                        pause = min(delay, policy.max_backoff)
+                        delay *= policy.backoff_factor
+
+                    elapsed = time.monotonic() - start
+                    out_of_attempts = attempt >= policy.max_retries
+                    out_of_budget = policy.budget is not None and elapsed + pause >= policy.budget
+                    if out_of_attempts or out_of_budget:
+                        RoboUtils.__recordRetry(operation_name, attempt, kind, wasted, failed=True)
+                        reason = f"{attempt} attempts" if out_of_attempts else f"{elapsed:.1f}s budget"
+                        msg = f"Failed to execute {operation_name} after {reason}."
+                        logger.error(msg)
+                        if kind == "timeout":
+                            raise TimeoutException(msg) from e
+                        raise
+
+                    logger.warning(
+                        f"{kind.capitalize()} during {operation_name}, retrying "
+                        f"({attempt}/{policy.max_retries}) in {pause:.2f}s..."
+                    )
+                    if pause > 0:
+                        time.sleep(pause)
+                    RoboUtils.__recordRetry(operation_name, attempt, kind, wasted + pause)
+                    continue
+
+                RoboUtils.__recordRetry(operation_name, attempt, None, 0.0)
+                return result
+        finally:
+            if wait is not None:
+                wait._timeout = original_timeout
+
     @staticmethod
-    def retry_on_timeout(operation, max_retries=3, operation_name="operation"):
+    def retry_on_timeout(
+        operation,
+        max_retries=3,
+        operation_name="operation",
+        policy: RetryPolicy = None,
+        wait=None,
+    ):
         """
         Retries an operation that may fail due to timeout exceptions.
 
@@ -29,6 +190,11 @@ class RoboUtils:
             operation_name (str, optional): A descriptive name for the operation
                 being performed, used in error messages and logging. Defaults to
                 "operation".
+            policy (RetryPolicy, optional): Full retry policy (budget, backoff, exception kinds).
+                When given, max_retries is ignored. Defaults to retrying timeouts only,
+                immediately, up to max_retries attempts.
+            wait (WebDriverWait, optional): The wait used by the operation, so a policy budget
+                can cap its timeout. See RoboUtils.retry.
 
         Returns:
             The return value from the successful execution of the operation callable.
@@ -43,22 +209,63 @@ class RoboUtils:
             The method logs errors when all retry attempts are exhausted. Make sure
             logging is properly configured to capture these messages.
         """
-        retry_count = 0
-
-        while retry_count < max_retries:
-            try:
-                return operation()
-            except TimeoutException as e:
-                retry_count += 1
-                if retry_count >= max_retries:
-                    msg = f"Failed to execute {operation_name} after {max_retries} attempts."
-                    logger.error(msg)
-                    raise TimeoutException(msg) from e
-                else:
-                    logger.warning(
-                        f"Timeout during {operation_name}, retrying ({retry_count}/{max_retries})..."
-                    )
-            except Exception as e:
-                msg = f"Error during {operation_name}: {e}"
-                logger.error(msg)
-                raise
\ No newline at end of file
+        if policy is None:
+            policy = RetryPolicy(max_retries=max_retries, backoff=0.0, retry_on=("timeout",))
+        return RoboUtils.retry(operation, policy, operation_name, wait)
+
+    @staticmethod
+    def get_retry_metrics():
+        """
+        Return retry-cost metrics per operation, most expensive first.
+
+        Returns:
+            list[dict]: One entry per operation_name with keys "operation", "calls",
+            "attempts", "retries", "failures", "retry_seconds" (time lost to failed
+            attempts and backoff) and "by_kind" (kind -> {"count", "seconds"}).
+
+        Examples:
+            >>> for entry in RoboUtils.get_retry_metrics()[:5]:
+            ...     print(entry["operation"], round(entry["retry_seconds"], 1))
+        """
+        with RoboUtils._retry_metrics_lock:
+            entries = [
+                dict(entry, by_kind={kind: dict(stats) for kind, stats in entry["by_kind"].items()})
+                for entry in RoboUtils._retry_metrics.values()
+            ]
+        return sorted(entries, key=lambda entry: entry["retry_seconds"], reverse=True)
+
+    @staticmethod
+    def reset_retry_metrics():
+        """Clear all recorded retry-cost metrics."""
+        with RoboUtils._retry_metrics_lock:
+            RoboUtils._retry_metrics.clear()
+
+    @staticmethod
+    def __recordRetry(operation_name, attempt, kind, seconds, failed=False):
+        with RoboUtils._retry_metrics_lock:
+            entry = RoboUtils._retry_metrics.get(operation_name)
+            if entry is None:
+                entry = {
+                    "operation": operation_name,
+                    "calls": 0,
+                    "attempts": 0,
+                    "retries": 0,
+                    "failures": 0,
+                    "retry_seconds": 0.0,
+                    "by_kind": {},
+                }
+                RoboUtils._retry_metrics[operation_name] = entry
+
+            entry["attempts"] += 1
+            if kind is None and not failed:
+                entry["calls"] += 1
+                return
+            if failed:
+                entry["calls"] += 1
+                entry["failures"] += 1
+            else:
+                entry["retries"] += 1
+            entry["retry_seconds"] += seconds
+            stats = entry["by_kind"].setdefault(kind or "other", {"count": 0, "seconds": 0.0})
+            stats["count"] += 1
+            stats["seconds"] += seconds
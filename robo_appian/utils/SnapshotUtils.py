@@ -0,0 +1,188 @@
+import logging
+import threading
+from contextlib import contextmanager
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+
+_CAPTURE_SNAPSHOT_SCRIPT = """
+const root = document.documentElement;
+const clone = root.cloneNode(true);
+const live = root.querySelectorAll("*");
+const copies = clone.querySelectorAll("*");
+
+function isDisplayed(el) {
+    if (typeof el.checkVisibility === "function") {
+        return el.checkVisibility({ checkOpacity: true, checkVisibilityCSS: true });
+    }
+    const style = window.getComputedStyle(el);
+    return style.display !== "none" && style.visibility !== "hidden"
+        && style.opacity !== "0" && el.getClientRects().length > 0;
+}
+
+for (let i = 0; i < live.length; i++) {
+    if (!isDisplayed(live[i])) {
+        copies[i].setAttribute("data-robo-hidden", "");
+    }
+}
+return clone.outerHTML;
+"""
+
+
+class SnapshotUtils:
+    """
+    Evaluate read-only XPath checks offline against one captured copy of the page.
+
+    Inside SnapshotUtils.snapshot(wait), existence checks such as LabelUtils.isLabelExists,
+    ButtonUtils.isButtonExistsByLabelText and the DropdownUtils read-only/editable checks
+    are answered from a parsed copy of document.documentElement: the page is transferred
+    once and every XPath is evaluated in-process with lxml. Visibility is recorded at capture
+    time so checks that require a visible element keep their meaning.
+
+    The cached copy is dropped by every robo_appian action that changes the page (clicks,
+    typing, date writes, window switches and navigation through BrowserUtils), and the next
+    check captures the page again. Checks answer from
+    the snapshot immediately and do not wait for elements to appear, so only enter the mode
+    once the page is stable.
+
+    Requires the optional lxml dependency (pip install robo_appian[snapshot]). Without it,
+    the mode is a no-op and checks run against the live browser as usual.
+
+    Examples:
+        >>> with SnapshotUtils.snapshot(wait):
+        ...     assert LabelUtils.isLabelExists(wait, "Employee Details")
+        ...     assert ButtonUtils.isButtonExistsByLabelText(wait, "Submit")
+        ...     assert DropdownUtils.checkReadOnlyStatusByLabelText(wait, "Department")
+    """
+
+    HIDDEN_ATTRIBUTE = "data-robo-hidden"
+
+    _sessions = {}
+    _lock = threading.Lock()
+    _lxml_missing_logged = False
+
+    @staticmethod
+    @contextmanager
+    def snapshot(wait: WebDriverWait):
+        """
+        Answer read-only checks from a cached page snapshot inside the with-block.
+
+        Args:
+            wait: WebDriverWait instance whose driver is snapshotted.
+
+        Examples:
+            >>> with SnapshotUtils.snapshot(wait):
+            ...     LabelUtils.isLabelExists(wait, "Summary")
+        """
+        key = id(wait._driver)
+        with SnapshotUtils._lock:
+            session = SnapshotUtils._sessions.setdefault(key, {"depth": 0, "tree": None})
+            session["depth"] += 1
+        try:
+            yield
+        finally:
+            with SnapshotUtils._lock:
+                session["depth"] -= 1
+                if session["depth"] == 0:
+                    SnapshotUtils._sessions.pop(key, None)
+
+    @staticmethod
+    def isActive(wait: WebDriverWait):
+        """
+        Return True if snapshot mode is active for the driver of this wait.
+        """
+        return id(wait._driver) in SnapshotUtils._sessions
+
+    @staticmethod
+    def invalidate(wait: WebDriverWait = None):
+        """
+        Drop the cached snapshot so the next check captures the page again.
+
+        Called by robo_appian actions that change the page. Call it yourself after changing
+        the page through the driver directly.
+
+        Args:
+            wait: WebDriverWait instance, or None to drop the snapshots of all drivers.
+        """
+        if not SnapshotUtils._sessions:
+            return
+        with SnapshotUtils._lock:
+            if wait is None:
+                sessions = SnapshotUtils._sessions.values()
+            else:
+                sessions = [SnapshotUtils._sessions.get(id(wait._driver))]
+            for session in sessions:
+                if session is not None:
+                    session["tree"] = None
+
+    @staticmethod
+    def exists(wait: WebDriverWait, xpath: str, visible: bool = False):
+        """
+        Evaluate an XPath against the snapshot.
+
+        Args:
+            wait: WebDriverWait instance.
+            xpath: XPath expression, as used against the live page.
+            visible: Only count elements that were visible when the snapshot was taken.
+
+        Returns:
+            bool: Whether a matching element exists in the snapshot, or None when snapshot
+            mode is not active (or lxml is not installed) and the caller should check the
+            live page instead.
+
+        Examples:
+            >>> found = SnapshotUtils.exists(wait, "//button[./span='Save']")
+            >>> if found is None:
+            ...     found = bool(wait._driver.find_elements(By.XPATH, "//button[./span='Save']"))
+        """
+        tree = SnapshotUtils.__tree(wait)
+        if tree is None:
+            return None
+        matches = tree.xpath(xpath)
+        if not isinstance(matches, list):
+            return bool(matches)
+        if visible:
+            hidden = SnapshotUtils.HIDDEN_ATTRIBUTE
+            return any(
+                getattr(match, "get", None) is not None and match.get(hidden) is None
+                for match in matches
+            )
+        return len(matches) > 0
+
+    @staticmethod
+    def capture(wait: WebDriverWait):
+        """
+        Capture the page's HTML in one script, marking elements that are not visible.
+
+        Hidden elements carry the HIDDEN_ATTRIBUTE attribute in the returned HTML.
+
+        Args:
+            wait: WebDriverWait instance.
+
+        Returns:
+            str: The serialized document element.
+        """
+        return wait._driver.execute_script(_CAPTURE_SNAPSHOT_SCRIPT)
+
+    @staticmethod
+    def __tree(wait: WebDriverWait):
+        session = SnapshotUtils._sessions.get(id(wait._driver))
+        if session is None:
+            return None
+        if session["tree"] is not None:
+            return session["tree"]
+
+        try:
+            from lxml import html as lxml_html
+        except ImportError:
+            if not SnapshotUtils._lxml_missing_logged:
+                SnapshotUtils._lxml_missing_logged = True
+                logger.warning("lxml is not installed; snapshot mode falls back to live checks.")
+            return None
+
+        source = SnapshotUtils.capture(wait)
+        tree = lxml_html.fromstring(source).getroottree()
+        with SnapshotUtils._lock:
+            session["tree"] = tree
+        return tree
@@ -0,0 +1,277 @@
+import time
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from robo_appian.utils.ComponentUtils import ComponentUtils
+from robo_appian.utils.NetworkUtils import NetworkUtils
+from robo_appian.utils.SnapshotUtils import SnapshotUtils
+
+
+_READ_LISTBOX_SCRIPT = """
+const list = document.getElementById(arguments[0]);
+const value = arguments[1];
+const normalize = (text) => (text || "").replace(/\\s+/g, " ").trim();
+if (!list) {
+    return { options: null, match: null, busy: false };
+}
+const busy = list.closest('[aria-busy="true"]') !== null;
+// Options are role="option" elements; older search lists hold plain li children instead
+let items = list.querySelectorAll('[role="option"]');
+if (!items.length) {
+    items = list.querySelectorAll(":scope > li");
+}
+const options = [];
+let match = null;
+for (const option of items) {
+    if (option.getClientRects().length === 0) {
+        continue;
+    }
+    const text = normalize(option.textContent);
+    options.push(text);
+    if (match !== null) {
+        continue;
+    }
+    if (text === value) {
+        match = option;
+        continue;
+    }
+    for (const child of option.querySelectorAll("*")) {
+        if (normalize(child.textContent) === value) {
+            match = option;
+            break;
+        }
+    }
+}
+return { options: options, match: match, busy: busy };
+"""
+
+_MISSING_SELECTIONS_SCRIPT = """
+const anchor = arguments[0];
+const label = arguments[1];
+const values = arguments[2];
+const listId = arguments[3];
+const normalize = (text) => (text || "").replace(/\\s+/g, " ").trim();
+const hasLabel = (node) => Array.from(node.children).some(
+    (child) => child.tagName === "DIV" && Array.from(child.children).some(
+        (span) => span.tagName === "SPAN" && normalize(span.textContent) === label
+    )
+);
+let container = anchor;
+while (container && !hasLabel(container)) {
+    container = container.parentElement;
+}
+container = container || anchor.parentElement;
+const texts = new Set();
+for (const el of container.querySelectorAll("*")) {
+    if (el === anchor || (listId && el.closest("#" + CSS.escape(listId)))) {
+        continue;
+    }
+    texts.add(normalize(el.textContent));
+}
+return values.filter((value) => !texts.has(value));
+"""
+
+
+class TypeaheadUtils:
+    """
+    Type the shortest useful prefix into an Appian search box and pick the option as soon as it appears.
+
+    Used by SearchDropdownUtils and SearchInputUtils. Instead of typing the full value and waiting
+    on a fixed XPath for the exact option, the engine types a short prefix, reads the listbox
+    (the `_list` / aria-controls element) with one script per poll, and clicks the option that
+    matches the value as soon as it is listed. If the results for the typed prefix settle
+    without the option, more characters are typed. Results only settle once they answer the
+    last keystroke (see __waitForResults), so a stale list or a slow server does not pass for
+    the final answer. Prefix-to-result mappings are cached per search component for the rest
+    of the run, so later searches on the same component start from a prefix known to work.
+
+    Examples:
+        >>> TypeaheadUtils.selectValue(wait, search_input, "employee_list", "John Doe", cache_key="Employee")
+    """
+
+    MIN_PREFIX = 3
+    DEBOUNCE = 0.3
+    UNCHANGED_TIMEOUT = 2.0
+    POLL_FREQUENCY = 0.1
+
+    _cache = {}
+
+    @staticmethod
+    def selectValue(
+        wait: WebDriverWait,
+        input_component: WebElement,
+        list_id: str,
+        value: str,
+        cache_key: str = None,
+    ):
+        """
+        Type into a search input until the option matching value is listed, then click it.
+
+        Args:
+            wait: WebDriverWait instance. Its timeout bounds the wait for the final (full value) search.
+            input_component: The search input element.
+            list_id: ID of the listbox element holding the options.
+            value: Exact visible text of the option to select.
+            cache_key: Key identifying the search component for the prefix cache. Defaults to list_id.
+
+        Returns:
+            WebElement: The option element that was clicked.
+
+        Raises:
+            TimeoutException: If the option does not appear after typing the full value.
+        """
+        cache = TypeaheadUtils._cache.setdefault(cache_key or list_id, {})
+        length = TypeaheadUtils.__prefixLength(cache, value)
+
+        wait.until(EC.element_to_be_clickable(input_component))
+        SnapshotUtils.invalidate(wait)
+        input_component.clear()
+        before = wait._driver.execute_script(_READ_LISTBOX_SCRIPT, list_id, value)["options"]
+        mark = NetworkUtils.mark(wait)
+        typed = value[:length]
+        input_component.send_keys(typed)
+
+        while True:
+            final = typed == value
+            result = TypeaheadUtils.__waitForResults(wait, list_id, value, final, before, mark)
+            if result["settled"]:
+                cache[typed] = result["options"] or []
+            if result["match"] is not None:
+                ComponentUtils.click(wait, result["match"])
+                return result["match"]
+
+            before = result["options"]
+            mark = NetworkUtils.mark(wait)
+            remaining = len(value) - len(typed)
+            length = len(typed) + max(1, remaining // 2)
+            input_component.send_keys(value[len(typed):length])
+            typed = value[:length]
+
+    @staticmethod
+    def findMissingSelections(
+        wait: WebDriverWait, anchor: WebElement, label: str, values: list[str], list_id: str = None
+    ) -> list[str]:
+        """
+        Read the selected tokens of a search component once and report values that are not selected.
+
+        Climbs from the anchor (the search input or combobox) to the component container that
+        holds the label, then compares the texts inside it with the expected values in one script.
+
+        Args:
+            wait: WebDriverWait instance.
+            anchor: An element inside the component (search input or combobox).
+            label: Exact label text of the component.
+            values: Values expected to be selected.
+            list_id: ID of the option list, excluded from the comparison.
+
+        Returns:
+            list[str]: Values with no matching token, in the order given. Empty if all are selected.
+        """
+        return wait._driver.execute_script(
+            _MISSING_SELECTIONS_SCRIPT, anchor, label, list(values), list_id
+        )
+
+    @staticmethod
+    def clearCache(cache_key: str = None):
+        """
+        Forget cached prefix-to-result mappings.
+
+        Args:
+            cache_key: Search component to forget, or None to clear the whole cache.
+        """
+        if cache_key is None:
+            TypeaheadUtils._cache.clear()
+        else:
+            TypeaheadUtils._cache.pop(cache_key, None)
+
+    @staticmethod
+    def __prefixLength(cache: dict, value: str):
+        """
+        Pick the prefix length to type first, using earlier results for the same component.
+
+        A cached prefix whose results listed the value wins outright. Otherwise the prefix must be
+        longer than any cached prefix that did not list it, and long enough to tell the value apart
+        from the other options seen so far.
+        """
+        length = min(len(value), TypeaheadUtils.MIN_PREFIX)
+        lowered = value.lower()
+
+        listed = [
+            len(prefix)
+            for prefix, options in cache.items()
+            if value.startswith(prefix) and any(value in option for option in options)
+        ]
+        if listed:
+            return min(listed)
+
+        for prefix in cache:
+            if value.startswith(prefix):
+                length = max(length, len(prefix) + 1)
+
+        for options in cache.values():
+            for option in options:
+                option = option.lower()
+                if option.startswith(lowered):
+                    continue
+                shared = 0
+                for a, b in zip(option, lowered):
+                    if a != b:
+                        break
+                    shared += 1
+                length = max(length, shared + 1)
+
+        return min(len(value), length)
+
+    @staticmethod
+    def __waitForResults(wait: WebDriverWait, list_id: str, value: str, final: bool, before, mark: int):
+        """
+        Poll the listbox until the option appears or, for a partial prefix, until the results settle.
+
+        Appian debounces search input before querying the server, and the list shown right
+        after a keystroke may still be the previous prefix's. The results settle once they
+        answer this keystroke and then stay unchanged for DEBOUNCE seconds. They answer it when
+        a tracked server response arrived after mark and none is in flight (NetworkUtils
+        running), or else when the option list differs from before and is not aria-busy. A
+        list that stays as it was, or never renders, is given up on after UNCHANGED_TIMEOUT
+        seconds, so more characters get typed instead of waiting out the full timeout; such a
+        result has "settled" False and is not cached.
+        """
+        typed_at = time.monotonic()
+        state = {"options": None, "since": typed_at}
+        monitored = NetworkUtils.isActive(wait)
+
+        def answered(result):
+            if result["busy"]:
+                return False
+            if monitored:
+                return not NetworkUtils.pending(wait) and any(
+                    record["seq"] > mark for record in NetworkUtils.requests(wait)
+                )
+            return result["options"] is not None and result["options"] != before
+
+        def results(driver):
+            result = driver.execute_script(_READ_LISTBOX_SCRIPT, list_id, value)
+            result["settled"] = True
+            if result["match"] is not None:
+                return result
+            if final:
+                return False
+
+            now = time.monotonic()
+            if result["options"] != state["options"]:
+                state["options"] = result["options"]
+                state["since"] = now
+                return False
+            if now - state["since"] >= TypeaheadUtils.DEBOUNCE and answered(result):
+                return result
+            if now - typed_at >= TypeaheadUtils.UNCHANGED_TIMEOUT:
+                result["settled"] = False
+                return result
+            return False
+
+        if final:
+            return wait.until(results)
+        fast_wait = WebDriverWait(
+            wait._driver, wait._timeout, poll_frequency=TypeaheadUtils.POLL_FREQUENCY
+        )
+        return fast_wait.until(results)
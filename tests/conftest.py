@@ -1,35 +1,25 @@
 import os
 import pytest
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.support.ui import WebDriverWait
+from robo_appian.utils.ArtifactUtils import ArtifactUtils
+from robo_appian.utils.BrowserProfileUtils import BrowserProfileUtils
 
 
 @pytest.fixture(scope="session")
 def driver():
     """Session-scoped WebDriver using Selenium Manager (Selenium >= 4.6).
     Configure via env vars:
-      - BROWSER: chrome (default). Extend as needed.
+      - BROWSER: chrome (default). Other browsers fall back to Chrome; extend as needed.
       - HEADLESS: "1" (default) to run headless; set "0" for headed.
+      - BROWSER_PROFILE: default (plain Chrome), light or minimal; see BrowserProfileUtils.
     """
-    browser = os.getenv("BROWSER", "chrome").lower()
     headless = os.getenv("HEADLESS", "1") == "1"
+    profile = os.getenv("BROWSER_PROFILE", "default")
 
-    if browser == "chrome":
-        options = ChromeOptions()
-        if headless:
-            options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        drv = webdriver.Chrome(options=options)
-    else:
-        # Fallback to Chrome if an unsupported browser is requested
-        options = ChromeOptions()
-        if headless:
-            options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        drv = webdriver.Chrome(options=options)
+    options = BrowserProfileUtils.chromeOptions(profile, headless=headless)
+    drv = webdriver.Chrome(options=options)
+    BrowserProfileUtils.apply(WebDriverWait(drv, 0), profile)
 
     yield drv
     try:
@@ -40,9 +30,25 @@ def driver():
 
 @pytest.fixture()
 def wait(driver):
-    """Function-scoped WebDriverWait aligned with library usage (wait-first)."""
+    """Function-scoped WebDriverWait aligned with library usage (wait-first).
+    Set ARTIFACTS_DIR to capture a screenshot, DOM snapshot and locator when a test fails.
+    """
     timeout = int(os.getenv("SELENIUM_WAIT_TIMEOUT", "15"))
-    return WebDriverWait(driver, timeout)
+    wait = WebDriverWait(driver, timeout)
+    artifacts_dir = os.getenv("ARTIFACTS_DIR")
+    if artifacts_dir:
+        ArtifactUtils.install(wait, artifacts_dir)
+    return wait
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Capture failure artifacts once a test has failed, not on every (possibly expected) timeout."""
+    outcome = yield
+    report = outcome.get_result()
+    wait = item.funcargs.get("wait") if hasattr(item, "funcargs") else None
+    if report.when == "call" and report.failed and wait is not None and os.getenv("ARTIFACTS_DIR"):
+        ArtifactUtils.captureFailure(wait, call.excinfo.value if call.excinfo else None)
 
 
 @pytest.fixture()
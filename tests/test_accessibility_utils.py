@@ -0,0 +1,123 @@
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from robo_appian.utils.AccessibilityUtils import AccessibilityUtils
+
+
+class FakeCdpDriver:
+    """Answers the CDP calls of an accessibility lookup over count matching options."""
+
+    def __init__(self, count, hidden_from_selector=0):
+        self.count = count
+        self.hidden_from_selector = hidden_from_selector
+        self.commands = []
+        self.scripts = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append(command)
+        if command == "DOM.getDocument":
+            return {"root": {"nodeId": 1}}
+        if command == "Accessibility.queryAXTree":
+            return {"nodes": [{"backendDOMNodeId": 100 + i} for i in range(self.count)]}
+        if command == "DOM.pushNodesByBackendIdsToFrontend":
+            return {"nodeIds": [backend_id - 90 for backend_id in params["backendNodeIds"]]}
+        if command == "DOM.querySelectorAll":
+            return {"nodeIds": list(range(10 + self.hidden_from_selector, 10 + self.count))}
+        if command == "DOM.resolveNode":
+            return {"object": {"objectId": f"object-{params['backendNodeId']}"}}
+        return {}
+
+    def execute_script(self, script, *args):
+        self.scripts.append(args)
+        if len(args) == 3:
+            return [f"element-{i}" for i in args[1]]
+        return [f"element-{i}" for i in range(self.count)] if "__roboAppianAx" in script else None
+
+
+class FakeWait:
+    def __init__(self, driver):
+        self._driver = driver
+
+
+@pytest.fixture(autouse=True)
+def fresh_support_cache(monkeypatch):
+    monkeypatch.setattr(AccessibilityUtils, "_support", {})
+
+
+def test_find_all_by_role_maps_nodes_with_a_fixed_number_of_calls():
+    wait = FakeWait(FakeCdpDriver(200))
+
+    elements = AccessibilityUtils.findAllByRole(wait, "option")
+
+    assert len(elements) == 200
+    assert wait._driver.commands.count("DOM.getDocument") == 2  # support probe and one per lookup
+    assert "DOM.resolveNode" not in wait._driver.commands
+    assert len(wait._driver.commands) == 5
+    assert wait._driver.scripts[-1][0] == '[role="option"], option:not([role])'
+
+
+def test_nodes_outside_the_selector_are_resolved_one_by_one():
+    wait = FakeWait(FakeCdpDriver(3, hidden_from_selector=1))
+
+    elements = AccessibilityUtils.findAllByRole(wait, "option")
+
+    assert len(elements) == 3
+    assert wait._driver.commands.count("DOM.resolveNode") == 3
+    assert wait._driver.commands.count("Runtime.callFunctionOn") == 1
+
+
+class FakeDriverWithoutCdp:
+    def __init__(self):
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(args)
+        return ["visible"]
+
+    def find_elements(self, by, value):
+        raise AssertionError("the fallback must filter visibility in one script")
+
+
+def test_xpath_fallback_filters_visibility_in_one_script():
+    wait = FakeWait(FakeDriverWithoutCdp())
+
+    assert AccessibilityUtils.findAllByRole(wait, "button", "Save") == ["visible"]
+    assert wait._driver.scripts == [(AccessibilityUtils.xpathForRole("button", "Save"), None)]
+
+
+def test_find_by_role_fetches_the_document_once_per_lookup():
+    driver = FakeCdpDriver(0)
+    calls = {"n": 0}
+    real = driver.execute_cdp_cmd
+
+    def execute_cdp_cmd(command, params):
+        if command == "Accessibility.queryAXTree":
+            calls["n"] += 1
+            driver.count = 1 if calls["n"] >= 3 else 0
+        return real(command, params)
+
+    driver.execute_cdp_cmd = execute_cdp_cmd
+    element = AccessibilityUtils.findByRole(WebDriverWait(driver, 1, poll_frequency=0.01), "tab", "History")
+
+    assert element == "element-0"
+    assert calls["n"] == 3
+    assert driver.commands.count("DOM.getDocument") == 2
+
+
+def test_stale_document_is_fetched_again():
+    driver = FakeCdpDriver(1)
+    real = driver.execute_cdp_cmd
+
+    def execute_cdp_cmd(command, params):
+        if command == "Accessibility.queryAXTree" and params["nodeId"] == "stale":
+            raise WebDriverException("No node with given id found")
+        return real(command, params)
+
+    driver.execute_cdp_cmd = execute_cdp_cmd
+    lookup = {"root": "stale"}
+
+    elements = AccessibilityUtils._AccessibilityUtils__query(FakeWait(driver), "tab", "History", None, lookup)
+
+    assert elements == ["element-0"]
+    assert lookup == {"root": 1}
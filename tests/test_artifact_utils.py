@@ -0,0 +1,80 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from robo_appian.utils.ArtifactUtils import ArtifactUtils
+
+
+class FakeDriver:
+    current_url = "https://example.com/record"
+    page_source = "<html></html>"
+
+    def __init__(self):
+        self.screenshots = 0
+
+    def get_screenshot_as_png(self):
+        self.screenshots += 1
+        return b"png"
+
+    def find_element(self, by, value):
+        raise TimeoutException("not yet")
+
+
+@pytest.fixture()
+def wait(tmp_path):
+    wait = ArtifactUtils.install(WebDriverWait(FakeDriver(), 0.05, poll_frequency=0.01), tmp_path)
+    yield wait
+    ArtifactUtils.flush()
+
+
+def read_metadata(prefix):
+    return json.loads(gzip.decompress(Path(prefix + ".json.gz").read_bytes()))
+
+
+def probe(wait, locator):
+    try:
+        wait.until(EC.presence_of_element_located(locator))
+    except TimeoutException:
+        pass
+
+
+def test_handled_timeouts_capture_nothing(wait, tmp_path):
+    probe(wait, (By.ID, "optional-banner"))
+
+    assert wait._driver.screenshots == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failure_is_captured_with_the_locator_of_its_timeout(wait, tmp_path):
+    probe(wait, (By.ID, "optional-banner"))
+    try:
+        wait.until(EC.presence_of_element_located((By.ID, "save")))
+    except TimeoutException as timeout:
+        try:
+            raise RuntimeError("Save button not found") from timeout
+        except RuntimeError as e:
+            error = e
+
+    prefix = ArtifactUtils.captureFailure(wait, error)
+    ArtifactUtils.flush()
+
+    assert wait._driver.screenshots == 1
+    assert Path(prefix).parent == tmp_path
+    assert read_metadata(prefix)["locator"] == [By.ID, "save"]
+
+
+def test_failure_after_a_handled_timeout_has_no_locator(wait, tmp_path):
+    probe(wait, (By.ID, "optional-banner"))
+
+    prefix = ArtifactUtils.captureFailure(wait, AssertionError("wrong total"))
+    ArtifactUtils.flush()
+
+    metadata = read_metadata(prefix)
+    assert metadata["locator"] is None
+    assert metadata["reason"] == "wrong total"
@@ -0,0 +1,134 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from robo_appian.utils.BrowserUtils import BrowserUtils, WindowManager
+from robo_appian.utils.SnapshotUtils import SnapshotUtils
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.switches.append(handle)
+        self.driver.current_window_handle = handle
+
+    def new_window(self, type_hint=None):
+        self.window(self.driver.add_window())
+
+
+class FakeBrowsingContext:
+    def __init__(self):
+        self.handlers = {}
+
+    def add_event_handler(self, event, callback, contexts=None):
+        self.handlers[len(self.handlers) + 1] = (event, callback)
+        return len(self.handlers)
+
+    def remove_event_handler(self, event, callback_id):
+        del self.handlers[callback_id]
+
+    def emit(self, event, params):
+        for name, callback in list(self.handlers.values()):
+            if name == event:
+                callback(params)
+
+
+class FakeDriver:
+    def __init__(self, bidi=False):
+        self.window_handles = ["A"]
+        self.current_window_handle = "A"
+        self.switches = []
+        self.switch_to = FakeSwitchTo(self)
+        self.caps = {"webSocketUrl": "ws://localhost/session"} if bidi else {}
+        self.browsing_context = FakeBrowsingContext()
+
+    def add_window(self):
+        handle = chr(ord("A") + len(self.window_handles))
+        self.window_handles.append(handle)
+        return handle
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+
+def make_wait(driver):
+    return WebDriverWait(driver, 1, poll_frequency=0.01)
+
+
+def test_switch_follows_switches_made_outside_the_manager():
+    driver = FakeDriver()
+    wait = make_wait(driver)
+    windows = WindowManager(wait)
+    windows.adopt("record", driver.add_window())
+
+    BrowserUtils.switch_to_next_tab(wait)
+    assert windows.current == "record"
+
+    windows.switch("main")
+    assert driver.current_window_handle == "A"
+
+
+def test_close_returns_to_the_parent_window():
+    driver = FakeDriver()
+    windows = WindowManager(make_wait(driver))
+    windows.open("record")
+    windows.open("report")
+
+    assert windows.close() == "record"
+    assert driver.current_window_handle == "B"
+    assert windows.names() == ["main", "record"]
+
+
+def test_track_polls_window_handles_without_bidi():
+    driver = FakeDriver()
+    windows = WindowManager(make_wait(driver))
+
+    handle = windows.track("record", driver.add_window)
+
+    assert handle == "B"
+    assert windows.current == "record"
+    assert windows.info("record").parent == "main"
+
+
+def test_track_uses_context_created_event_with_bidi():
+    driver = FakeDriver(bidi=True)
+    windows = WindowManager(make_wait(driver))
+
+    def open_from_page():
+        handle = driver.add_window()
+        driver.browsing_context.emit("context_created", {"context": "frame-1", "parent": "A"})
+        threading.Timer(0.05, driver.browsing_context.emit, ("context_created", {"context": handle, "parent": None})).start()
+
+    handle = windows.track("record", open_from_page, switch=False)
+
+    assert handle == "B"
+    assert windows.current == "main"
+    assert driver.browsing_context.handlers == {}
+
+
+def test_track_times_out_and_unsubscribes_when_no_window_opens():
+    driver = FakeDriver(bidi=True)
+    windows = WindowManager(WebDriverWait(driver, 0.1))
+
+    with pytest.raises(TimeoutException):
+        windows.track("record", lambda: None)
+    assert driver.browsing_context.handlers == {}
+    assert "record" not in windows.names()
+
+
+def test_window_switches_drop_the_page_snapshot():
+    driver = FakeDriver()
+    wait = make_wait(driver)
+    windows = WindowManager(wait)
+    windows.open("record")
+
+    with SnapshotUtils.snapshot(wait):
+        session = SnapshotUtils._sessions[id(driver)]
+        for switch in (lambda: windows.switch("main"), lambda: BrowserUtils.switch_to_next_tab(wait), windows.close):
+            session["tree"] = "previous tab"
+            switch()
+            assert session["tree"] is None
@@ -0,0 +1,161 @@
+import json
+import logging
+import shutil
+import subprocess
+from datetime import date, datetime
+
+import pytest
+from selenium.common.exceptions import ElementClickInterceptedException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+import robo_appian.utils.ComponentUtils as component_utils_module
+from robo_appian.utils.ComponentUtils import _OVERLAY_CLASS_JS, ComponentUtils
+
+
+def test_format_date_default_and_custom_patterns():
+    assert ComponentUtils.formatDate(date(2024, 1, 5)) == "01/05/2024"
+    assert ComponentUtils.formatDate(datetime(2024, 1, 5, 13, 30)) == "01/05/2024"
+    assert ComponentUtils.formatDate(date(2024, 1, 5), "%d.%m.%Y") == "05.01.2024"
+    assert ComponentUtils.formatDate(date(2024, 1, 5), "%d/%m/%y") == "05/01/24"
+    assert ComponentUtils.formatDate(date(2024, 1, 5), "{%Y}-100%%") == "{2024}-100%"
+
+
+def test_format_date_falls_back_to_strftime():
+    assert ComponentUtils.formatDate(date(2024, 1, 5), "%b %d, %Y") == date(2024, 1, 5).strftime("%b %d, %Y")
+
+
+def test_format_date_passes_strings_and_rejects_other_types():
+    assert ComponentUtils.formatDate("12/31/2024") == "12/31/2024"
+    with pytest.raises(ValueError, match="int"):
+        ComponentUtils.formatDate(20240105)
+
+
+def test_format_date_uses_class_default(monkeypatch):
+    monkeypatch.setattr(ComponentUtils, "DATE_FORMAT", "%Y-%m-%d")
+    assert ComponentUtils.formatDate(date(2024, 1, 5)) == "2024-01-05"
+
+
+class FakeClickDriver:
+    def __init__(self):
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        return None
+
+
+class FakeButton:
+    def __init__(self):
+        self.clicks = 0
+
+    def is_enabled(self):
+        return True
+
+    def click(self):
+        self.clicks += 1
+
+
+class FakeWait:
+    def __init__(self, driver):
+        self._driver = driver
+
+
+def test_click_uses_the_native_click_by_default(monkeypatch):
+    monkeypatch.setattr(ComponentUtils, "_click_stats", {})
+    wait, button = FakeWait(FakeClickDriver()), FakeButton()
+
+    ComponentUtils.click(wait, button)
+
+    assert ComponentUtils.CLICK_STRATEGY == "native"
+    assert button.clicks == 1
+    assert wait._driver.scripts == []
+    assert ComponentUtils.clickStats()["native"]["clicks"] == 1
+
+
+def test_scripted_click_is_opt_in(monkeypatch):
+    monkeypatch.setattr(ComponentUtils, "_click_stats", {})
+    wait, button = FakeWait(FakeClickDriver()), FakeButton()
+
+    ComponentUtils.click(wait, button, strategy="script")
+
+    assert button.clicks == 0
+    assert len(wait._driver.scripts) == 1
+    assert list(ComponentUtils.clickStats()) == ["script"]
+
+
+OVERLAY_CLASSES = {
+    "PopupMask---mask": True,
+    "gwt-PopupPanelGlass": True,
+    "Modal---overlay": True,
+    "LoadingIndicator---spinner": True,
+    "appian-context-loading": True,
+    "modal-body": False,
+    "loading-complete": False,
+    "SideBySideItem---flex_item": False,
+    "ContentLayout---hidden": False,
+}
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node to run the hit-test script")
+def test_overlay_classes_need_the_keyword_as_their_last_word():
+    script = _OVERLAY_CLASS_JS + (
+        "const names = JSON.parse(process.argv[1]);"
+        "console.log(JSON.stringify(names.map((name) => hasOverlayClass({ className: name }))));"
+    )
+    names = list(OVERLAY_CLASSES)
+    output = subprocess.run(
+        ["node", "-e", script, json.dumps(names)], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert dict(zip(names, json.loads(output))) == OVERLAY_CLASSES
+
+
+class InterceptedButton(WebElement):
+    def __init__(self):
+        super().__init__(None, "button")
+
+    def is_enabled(self):
+        return True
+
+    def is_displayed(self):
+        return True
+
+    def click(self):
+        raise ElementClickInterceptedException("covered")
+
+
+class FakeActionChains:
+    performed = 0
+
+    def __init__(self, driver):
+        pass
+
+    def move_to_element(self, component):
+        return self
+
+    def click(self):
+        return self
+
+    def perform(self):
+        FakeActionChains.performed += 1
+
+
+def test_click_through_a_lasting_overlay_is_logged_and_counted(monkeypatch, caplog):
+    monkeypatch.setattr(ComponentUtils, "_click_stats", {})
+    monkeypatch.setattr(component_utils_module, "ActionChains", FakeActionChains)
+
+    def overlay_stays(wait, component):
+        raise TimeoutException("Click target is covered by div.PopupMask---mask.")
+
+    monkeypatch.setattr(ComponentUtils, "waitForBlockersToDisappear", overlay_stays)
+    wait = WebDriverWait(FakeClickDriver(), 1)
+
+    with caplog.at_level(logging.WARNING):
+        ComponentUtils.click(wait, InterceptedButton())
+
+    assert FakeActionChains.performed == 1
+    assert "div.PopupMask---mask" in caplog.text
+    stats = ComponentUtils.clickStats()["native"]
+    assert (stats["clicks"], stats["fallbacks"]) == (1, 1)
+    assert stats["reasons"] == {"intercepted": 1, "blocker timeout": 1}
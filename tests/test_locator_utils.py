@@ -0,0 +1,59 @@
+import json
+
+import pytest
+from selenium.webdriver.support.ui import WebDriverWait
+
+from robo_appian.utils.LocatorUtils import LocatorUtils
+
+
+class FakeDriver:
+    def __init__(self, strategy):
+        self.strategy = strategy
+        self.orders = []
+
+    def execute_script(self, script, kind, label, order, xpath):
+        self.orders.append(list(order))
+        return {"element": f"{kind}:{label}", "strategy": self.strategy}
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.delenv("ROBO_APPIAN_LOCATOR_CACHE", raising=False)
+    LocatorUtils.configure()
+    yield
+    LocatorUtils.configure()
+
+
+def find(driver, label="Details"):
+    return LocatorUtils.find(WebDriverWait(driver, 1), "tab", label, "//p")
+
+
+def test_fallback_wins_stay_in_memory_by_default(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    driver = FakeDriver("aria")
+
+    for _ in range(LocatorUtils.PERSIST_AFTER):
+        find(driver)
+
+    assert driver.orders[-1][0] == "aria"
+    assert LocatorUtils.learned() == {"tab": {"Details": "aria"}}
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_strategy_is_persisted_only_after_consistent_wins(tmp_path):
+    cache = tmp_path / "locators.json"
+    LocatorUtils.configure(cache, persist_after=3)
+
+    find(FakeDriver("aria"))
+    find(FakeDriver("link"))
+    find(FakeDriver("aria"))
+    find(FakeDriver("aria"))
+    assert not cache.exists()
+
+    find(FakeDriver("aria"))
+    assert json.loads(cache.read_text()) == {"tab": {"Details": "aria"}}
+
+    LocatorUtils.configure(cache)
+    driver = FakeDriver("aria")
+    find(driver)
+    assert driver.orders[0][0] == "aria"
@@ -0,0 +1,44 @@
+from robo_appian.utils.BrowserProfileUtils import BrowserProfileUtils
+from robo_appian.utils.NetworkUtils import NetworkUtils
+
+
+class FakeCdpDriver:
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append(command)
+        return {"identifier": "1"}
+
+    def get_log(self, log_type):
+        return []
+
+    def execute_script(self, script, *args):
+        return None
+
+
+class FakeWait:
+    def __init__(self, driver):
+        self._driver = driver
+
+
+def test_stop_disables_the_network_domain_it_enabled():
+    wait = FakeWait(FakeCdpDriver())
+
+    assert NetworkUtils.start(wait)
+    NetworkUtils.stop(wait)
+
+    assert wait._driver.commands == ["Network.enable", "Network.disable"]
+
+
+def test_stop_keeps_the_network_domain_for_profile_blocking(monkeypatch):
+    for registry in ("_applied", "_blocked", "_fast_ui"):
+        monkeypatch.setattr(BrowserProfileUtils, registry, {})
+    wait = FakeWait(FakeCdpDriver())
+    BrowserProfileUtils.apply(wait, "light")
+    assert BrowserProfileUtils.blockedURLs(wait)
+
+    NetworkUtils.start(wait)
+    NetworkUtils.stop(wait)
+
+    assert "Network.disable" not in wait._driver.commands
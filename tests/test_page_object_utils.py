@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("lxml")
+
+from robo_appian.utils.PageObjectUtils import PageField, PageObjectUtils
+
+HTML = """<html><body>
+<div><div><label for="i1">Start Date</label></div><div><input id="i1" type="text"></div></div>
+<div role="presentation"><div><span id="s1">Leave Type</span></div>
+<div><div><div><div role="combobox" id="c1_value" aria-labelledby="s1" aria-controls="c1_list">--</div></div></div></div></div>
+<button id="b1"><span>Submit</span></button>
+<button data-robo-hidden=""><span>Hidden</span></button>
+<table><thead><tr><th scope="col" abbr="Employee ID">E</th></tr></thead></table>
+</body></html>"""
+
+
+def test_detect_fields_skips_hidden_components():
+    fields = PageObjectUtils.detectFields(HTML)
+    assert [(field.kind, field.label) for field in fields] == [
+        ("input", "Start Date"),
+        ("dropdown", "Leave Type"),
+        ("button", "Submit"),
+        ("column", "Employee ID"),
+    ]
+    assert fields[1].list_id == "c1_list"
+
+
+def test_generate_produces_importable_module():
+    source = PageObjectUtils.generate(HTML, "LeavePage", source="leave.html")
+    namespace = {}
+    exec(compile(source, "leave_page.py", "exec"), namespace)
+    page = namespace["LeavePage"]
+
+    assert page.START_DATE == PageField("input", "Start Date", "i1", page.START_DATE.xpath)
+    assert page.SUBMIT_BUTTON.label == "Submit"
+    assert page.EMPLOYEE_ID_COLUMN in page.FIELDS
+    assert len(page.FIELDS) == 4
+
+
+def test_generate_rejects_invalid_class_names():
+    with pytest.raises(ValueError):
+        PageObjectUtils.generate(HTML, "class")
@@ -0,0 +1,84 @@
+import pytest
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from robo_appian.utils.RoboUtils import RetryPolicy, RoboUtils
+
+
+class FakeWait:
+    def __init__(self, timeout):
+        self._timeout = timeout
+
+
+def flaky(*failures, result="done"):
+    errors = list(failures)
+
+    def operation():
+        if errors:
+            raise errors.pop(0)
+        return result
+
+    return operation
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    RoboUtils.reset_retry_metrics()
+    yield
+    RoboUtils.reset_retry_metrics()
+
+
+def test_classify_exception():
+    assert RoboUtils.classify_exception(StaleElementReferenceException()) == "stale"
+    assert RoboUtils.classify_exception(ElementClickInterceptedException()) == "intercepted"
+    assert RoboUtils.classify_exception(TimeoutException()) == "timeout"
+    assert RoboUtils.classify_exception(ValueError()) is None
+
+
+def test_retry_on_timeout_keeps_default_behaviour():
+    operation = flaky(TimeoutException(), TimeoutException())
+    assert RoboUtils.retry_on_timeout(operation, max_retries=3, operation_name="step") == "done"
+
+    with pytest.raises(TimeoutException, match="after 2 attempts"):
+        RoboUtils.retry_on_timeout(flaky(TimeoutException(), TimeoutException()), max_retries=2)
+
+    with pytest.raises(StaleElementReferenceException):
+        RoboUtils.retry_on_timeout(flaky(StaleElementReferenceException()))
+
+
+def test_retry_recovers_each_kind():
+    operation = flaky(
+        StaleElementReferenceException(),
+        ElementClickInterceptedException(),
+        TimeoutException(),
+    )
+    policy = RetryPolicy(max_retries=4, backoff=0.01, intercepted_delay=0.01)
+    assert RoboUtils.retry(operation, policy, "save") == "done"
+
+    (entry,) = RoboUtils.get_retry_metrics()
+    assert entry["operation"] == "save"
+    assert entry["calls"] == 1
+    assert entry["attempts"] == 4
+    assert entry["retries"] == 3
+    assert set(entry["by_kind"]) == {"stale", "intercepted", "timeout"}
+
+
+def test_retry_stops_at_budget_and_restores_wait_timeout():
+    wait = FakeWait(15)
+    seen = []
+
+    def operation():
+        seen.append(wait._timeout)
+        raise TimeoutException()
+
+    policy = RetryPolicy(max_retries=10, budget=0.2, backoff=0.05, backoff_factor=1.0)
+    with pytest.raises(TimeoutException, match="budget"):
+        RoboUtils.retry(operation, policy, "slow step", wait)
+
+    assert wait._timeout == 15
+    assert all(timeout <= 0.2 for timeout in seen)
+    assert 1 < len(seen) < 10
+    assert RoboUtils.get_retry_metrics()[0]["failures"] == 1
@@ -0,0 +1,47 @@
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from robo_appian.components.TabUtils import TabUtils
+from robo_appian.utils.ComponentUtils import ComponentUtils
+
+
+class FakeTab:
+    """A tab whose "Selected Tab." marker appears selected_after seconds from now."""
+
+    def __init__(self, selected_after=None):
+        self.selected_at = None if selected_after is None else time.monotonic() + selected_after
+
+    def find_elements(self, by, value):
+        selected = self.selected_at is not None and time.monotonic() >= self.selected_at
+        return ["marker"] if selected else []
+
+    def get_attribute(self, name):
+        return None
+
+
+def make_wait(timeout=1):
+    return WebDriverWait(object(), timeout, poll_frequency=0.01)
+
+
+def test_check_waits_for_the_selected_marker(monkeypatch):
+    monkeypatch.setattr(TabUtils, "findTabByLabelText", lambda wait, label: FakeTab(selected_after=0.1))
+
+    assert TabUtils.checkTabSelectedByLabelText(make_wait(), "Details") is True
+
+
+def test_check_returns_false_when_the_marker_never_appears(monkeypatch):
+    monkeypatch.setattr(TabUtils, "findTabByLabelText", lambda wait, label: FakeTab())
+
+    assert TabUtils.checkTabSelectedByLabelText(make_wait(0.1), "Details") is False
+
+
+def test_ensure_reads_the_state_without_waiting(monkeypatch):
+    clicked = []
+    monkeypatch.setattr(TabUtils, "findTabByLabelText", lambda wait, label: FakeTab(selected_after=5))
+    monkeypatch.setattr(ComponentUtils, "click", lambda wait, component: clicked.append(component))
+
+    started = time.monotonic()
+    assert TabUtils.ensureTabSelectedByLabelText(make_wait(10), "Details") is True
+    assert time.monotonic() - started < 1
+    assert len(clicked) == 1
@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from robo_appian.components.TableUtils import TableSnapshot, TableUtils
+from robo_appian.utils.ComponentUtils import ComponentUtils
+
+
+def make_snapshot(columns, rows):
+    values = np.array(rows, dtype=object).reshape(len(rows), len(columns))
+    return TableSnapshot(tuple(columns), {name: values[:, i].astype(str) for i, name in enumerate(columns)})
+
+
+COLUMNS = ("ID", "Name", "Status")
+
+
+def test_diff_reports_added_removed_and_changed_rows():
+    before = make_snapshot(COLUMNS, [["1", "Ann", "Active"], ["2", "Bob", "Active"], ["3", "Cy", "Active"]])
+    after = make_snapshot(COLUMNS, [["1", "Ann", "Active"], ["3", "Cy", "Inactive"], ["4", "Di", "New"]])
+
+    result = TableUtils.diff(before, after, "ID")
+
+    assert result.added == [{"ID": "4", "Name": "Di", "Status": "New"}]
+    assert result.removed == [{"ID": "2", "Name": "Bob", "Status": "Active"}]
+    assert result.changed == {"3": {"Status": ("Active", "Inactive")}}
+
+
+def test_diff_of_identical_and_empty_snapshots():
+    rows = [["1", "Ann", "Active"]]
+    unchanged = TableUtils.diff(make_snapshot(COLUMNS, rows), make_snapshot(COLUMNS, rows), "ID")
+    assert unchanged == ([], [], {})
+
+    empty = make_snapshot(COLUMNS, [])
+    assert len(empty) == 0
+    assert TableUtils.diff(empty, empty, "ID") == ([], [], {})
+
+    filled = TableUtils.diff(empty, make_snapshot(COLUMNS, rows), "ID")
+    assert filled.added == [{"ID": "1", "Name": "Ann", "Status": "Active"}]
+    assert not filled.removed and not filled.changed
+
+
+def test_diff_uses_first_row_for_duplicate_keys():
+    before = make_snapshot(COLUMNS, [["1", "Ann", "Active"], ["1", "Ann", "Duplicate"]])
+    after = make_snapshot(COLUMNS, [["1", "Ann", "Inactive"]])
+
+    result = TableUtils.diff(before, after, "ID")
+
+    assert result.changed == {"1": {"Status": ("Active", "Inactive")}}
+    assert not result.added and not result.removed
+
+
+def test_diff_requires_key_column():
+    snapshot = make_snapshot(COLUMNS, [["1", "Ann", "Active"]])
+    with pytest.raises(ValueError, match="Missing"):
+        TableUtils.diff(snapshot, snapshot, "Missing")
+
+
+def test_snapshot_keeps_missing_cells_empty(monkeypatch):
+    page = {"columns": list(COLUMNS), "rows": [["1", None, "Active"]]}
+    monkeypatch.setattr(TableUtils, "findTableByColumnName", lambda wait, columnName: object())
+    monkeypatch.setattr(TableUtils, "_TableUtils__readPage", lambda wait, table, columnName, columns: page)
+
+    snapshot = TableUtils.snapshot(None, "ID")
+
+    assert snapshot.data["Name"].tolist() == [""]
+    before = make_snapshot(COLUMNS, [["1", "", "Active"]])
+    assert TableUtils.diff(before, snapshot, "ID").changed == {}
+
+
+class FakeGridDriver:
+    def __init__(self, found):
+        self.found = found
+        self.scopes = []
+
+    def execute_script(self, script, scope, columnName):
+        self.scopes.append(scope)
+        return self.found
+
+
+class FakeWait:
+    def __init__(self, driver):
+        self._driver = driver
+
+
+def test_page_after_reads_only_the_grid_whose_pager_was_clicked(monkeypatch):
+    pages = {"grid": [["1"]], "other": [["9"]]}
+    monkeypatch.setattr(
+        TableUtils, "_TableUtils__readPage", lambda wait, table, columnName, columns: {"rows": pages[table]}
+    )
+    wait = FakeWait(FakeGridDriver("other"))
+    previous = {"table": "grid", "container": "pager-container", "rows": [["1"]]}
+
+    assert TableUtils._TableUtils__pageAfter(wait, previous, "ID", None) is False
+
+    pages["grid"] = [["2"]]
+    assert TableUtils._TableUtils__pageAfter(wait, previous, "ID", None) == {"rows": [["2"]]}
+    assert wait._driver.scopes == []
+
+
+def test_page_after_finds_a_rerendered_grid_in_its_container(monkeypatch):
+    def read_page(wait, table, columnName, columns):
+        if table == "grid":
+            raise StaleElementReferenceException()
+        return {"rows": [["2"]]}
+
+    monkeypatch.setattr(TableUtils, "_TableUtils__readPage", read_page)
+    wait = FakeWait(FakeGridDriver("new-grid"))
+    previous = {"table": "grid", "container": "pager-container", "rows": [["1"]]}
+
+    assert TableUtils._TableUtils__pageAfter(wait, previous, "ID", None) == {"rows": [["2"]]}
+    assert wait._driver.scopes == ["pager-container"]
+
+
+def test_all_pages_snapshot_rewinds_to_the_first_page(monkeypatch):
+    grid = {"page": 2}
+    contents = {1: [["1", "Ann", "Active"]], 2: [["2", "Bob", "Active"]]}
+
+    def read_page(wait, table, columnName, columns):
+        page = grid["page"]
+        return {
+            "columns": list(COLUMNS),
+            "rows": contents[page],
+            "table": "grid",
+            "container": "pager-container",
+            "next": page + 1 if page < 2 else None,
+            "first": 1 if page > 1 else None,
+        }
+
+    monkeypatch.setattr(TableUtils, "findTableByColumnName", lambda wait, columnName: "grid")
+    monkeypatch.setattr(TableUtils, "_TableUtils__readPage", read_page)
+    monkeypatch.setattr(ComponentUtils, "click", lambda wait, control: grid.update(page=control))
+    wait = WebDriverWait(FakeGridDriver(None), 1, poll_frequency=0.01)
+
+    first = TableUtils.snapshot(wait, "ID", all_pages=True)
+    second = TableUtils.snapshot(wait, "ID", all_pages=True)
+
+    assert first.columns == COLUMNS
+    assert first.data["ID"].tolist() == ["1", "2"]
+    assert TableUtils.diff(first, second, "ID") == ([], [], {})
@@ -0,0 +1,80 @@
+import time
+
+import pytest
+from selenium.webdriver.support.ui import WebDriverWait
+
+from robo_appian.utils.TypeaheadUtils import TypeaheadUtils
+
+
+class FakeListDriver:
+    """Returns listbox reads from a timeline of (seconds since start, result) steps."""
+
+    def __init__(self, timeline):
+        self.timeline = timeline
+        self.start = time.monotonic()
+
+    def execute_script(self, script, *args):
+        elapsed = time.monotonic() - self.start
+        current = self.timeline[0][1]
+        for at, result in self.timeline:
+            if elapsed >= at:
+                current = result
+        return dict(current)
+
+
+def listing(*options, busy=False):
+    return {"options": list(options), "match": None, "busy": busy}
+
+
+NO_LIST = {"options": None, "match": None, "busy": False}
+
+
+@pytest.fixture(autouse=True)
+def short_settle_times(monkeypatch):
+    monkeypatch.setattr(TypeaheadUtils, "DEBOUNCE", 0.05)
+    monkeypatch.setattr(TypeaheadUtils, "POLL_FREQUENCY", 0.01)
+
+
+def wait_for_results(timeline, before):
+    wait = WebDriverWait(FakeListDriver(timeline), 5)
+    started = time.monotonic()
+    result = TypeaheadUtils._TypeaheadUtils__waitForResults(wait, "list", "John Doe", False, before, 0)
+    return result, time.monotonic() - started
+
+
+def test_list_left_over_from_the_previous_prefix_is_not_taken_as_settled():
+    previous = listing("Jane Roe", "Joan Poe")
+    result, _ = wait_for_results([(0, previous), (0.3, listing("Joan Poe"))], before=previous["options"])
+
+    assert result["options"] == ["Joan Poe"]
+    assert result["settled"]
+
+
+def test_busy_list_is_not_taken_as_settled():
+    result, elapsed = wait_for_results(
+        [(0, listing("Joan Poe", busy=True)), (0.3, listing("Joan Poe"))], before=None
+    )
+
+    assert result["settled"]
+    assert elapsed >= 0.3
+
+
+def test_list_that_never_renders_gives_up_before_the_timeout(monkeypatch):
+    monkeypatch.setattr(TypeaheadUtils, "UNCHANGED_TIMEOUT", 0.2)
+
+    result, elapsed = wait_for_results([(0, NO_LIST)], before=None)
+
+    assert result["options"] is None
+    assert not result["settled"]
+    assert elapsed < 1
+
+
+def test_unchanged_list_is_accepted_after_the_unchanged_timeout(monkeypatch):
+    monkeypatch.setattr(TypeaheadUtils, "UNCHANGED_TIMEOUT", 0.2)
+    previous = listing("Jane Roe")
+
+    result, elapsed = wait_for_results([(0, previous)], before=previous["options"])
+
+    assert result["options"] == ["Jane Roe"]
+    assert not result["settled"]
+    assert 0.2 <= elapsed < 1